@@ -0,0 +1,6 @@
+"""Benchmarks for the SonicBit SDK's hot paths.
+
+Run ``python -m benchmarks --help`` from the repository root. Every
+benchmark runs offline against :class:`sonicbit.testing.FakeSonicBit` and
+the results are written as JSON so runs can be compared across commits.
+"""
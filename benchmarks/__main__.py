@@ -0,0 +1,86 @@
+import argparse
+import fnmatch
+import json
+import sys
+
+from . import concurrency, imports, parsing  # noqa: F401  (registers benchmarks)
+from .common import BENCHMARKS, Options, environment
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the SDK benchmarks."
+    )
+    parser.add_argument("patterns", nargs="*", help="glob patterns of benchmarks")
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=0.05,
+        help="seconds allowed for a cold 'import sonicbit'",
+    )
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="print median ratios against this file")
+    parser.add_argument("--list", action="store_true", help="list benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(sorted(BENCHMARKS)))
+        return 0
+
+    options = Options(
+        sizes=[int(size) for size in args.sizes.split(",")],
+        repeat=args.repeat,
+        threads=args.threads,
+        latency=args.latency,
+        import_budget=args.import_budget,
+    )
+    report = {"environment": environment(), "results": {}}
+    for name, func in BENCHMARKS.items():
+        if args.patterns and not any(fnmatch.fnmatch(name, p) for p in args.patterns):
+            continue
+        print(f"running {name}", file=sys.stderr)
+        report["results"][name] = func(options)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    failed = [
+        name
+        for name, rows in report["results"].items()
+        if any(row.get("failed") for row in rows)
+    ]
+    if failed:
+        print(f"failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def compare(baseline: dict, report: dict) -> None:
+    """Print current/baseline median ratios; below 1.0 is an improvement."""
+    for name, rows in report["results"].items():
+        for index, row in enumerate(rows):
+            try:
+                before = baseline["results"][name][index]["median"]
+            except (KeyError, IndexError):
+                continue
+            label = row.get("size", row.get("threads", index))
+            print(
+                f"{name}[{label}]: {row['median'] / before:.2f}x baseline",
+                file=sys.stderr,
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import platform
+import statistics
+import subprocess
+import time
+from typing import Callable, Dict, List
+
+BENCHMARKS: Dict[str, Callable[["Options"], List[dict]]] = {}
+
+
+class Options:
+    def __init__(
+        self,
+        sizes: List[int],
+        repeat: int,
+        threads: int,
+        latency: float,
+        import_budget: float = 0.05,
+    ):
+        self.sizes = sizes
+        self.repeat = repeat
+        self.threads = threads
+        self.latency = latency
+        self.import_budget = import_budget
+
+
+def benchmark(name: str):
+    """Register a benchmark function under ``name``."""
+
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict:
+    """Call ``func`` ``repeat`` times and summarize the wall-clock timings."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+        "repeat": repeat,
+    }
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+    }
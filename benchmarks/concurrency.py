@@ -0,0 +1,215 @@
+import itertools
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from sonicbit import SonicBit
+from sonicbit.constants import Constants
+from sonicbit.handlers import TokenFileHandler
+from sonicbit.metrics import MetricsCollector
+from sonicbit.testing import FakeSonicBit
+from tests import EMAIL, PASSWORD, make_client
+
+from .common import Options, benchmark, measure
+
+
+@benchmark("concurrent_list_torrents")
+def concurrent_list_torrents(options: Options):
+    """Throughput of list_torrents from many threads sharing one client."""
+    fake = FakeSonicBit(latency=options.latency, jitter=options.latency / 4, seed=1)
+    client = make_client(fake)
+    fake.populate_torrents(100)
+    calls = options.threads * 10
+
+    def run():
+        with ThreadPoolExecutor(max_workers=options.threads) as executor:
+            list(executor.map(lambda _: client.list_torrents(), range(calls)))
+
+    timing = measure(run, options.repeat)
+    return [
+        {
+            "threads": options.threads,
+            "calls": calls,
+            "calls_per_second": calls / timing["median"],
+            **timing,
+        }
+    ]
+
+
+@benchmark("token_refresh_storm")
+def token_refresh_storm(options: Options):
+    """Cost of every thread hitting an expired token at the same time."""
+    fake = FakeSonicBit(latency=options.latency, seed=1)
+    metrics = MetricsCollector()
+    client = make_client(fake, hooks=[metrics])
+
+    def run():
+        fake.expire_tokens()
+        with ThreadPoolExecutor(max_workers=options.threads) as executor:
+            list(
+                executor.map(
+                    lambda _: client.get_storage_details(), range(options.threads)
+                )
+            )
+
+    timing = measure(run, options.repeat)
+    refreshes = sum(metrics.snapshot()["token_refreshes"].values())
+    return [
+        {
+            "threads": options.threads,
+            "token_refreshes_per_storm": refreshes / options.repeat,
+            **timing,
+        }
+    ]
+
+
+@benchmark("directory_crawl")
+def directory_crawl(options: Options):
+    """Recursive crawl of a generated directory tree."""
+    fake = FakeSonicBit(latency=options.latency, seed=1)
+    client = make_client(fake)
+    fake.populate_files(50, subdirectories=4, depth=3)
+
+    def crawl():
+        count, pending = 0, [None]
+        while pending:
+            directory = pending.pop()
+            items = directory.items if directory else client.list_files().items
+            for item in items:
+                count += 1
+                if item.is_directory:
+                    pending.append(item)
+        return count
+
+    entries = crawl()
+    timing = measure(crawl, options.repeat)
+    return [{"entries": entries, **timing}]
+
+
+@benchmark("thread_safety_stress")
+def thread_safety_stress(options: Options):
+    """Many threads sharing one client and a small connection pool while
+    tokens expire every ``4 * threads`` calls.
+
+    The fake is served over local HTTP so the client's real connection
+    pool, capped at a quarter of the threads, is exercised. Every expiry
+    makes all in-flight threads contend for one refresh. The row is
+    marked as failed if any call raised or returned a wrong result, which
+    is what the thread-safety guarantees rule out.
+    """
+    fake = FakeSonicBit(latency=options.latency, jitter=options.latency / 2, seed=1)
+    fake.add_account(EMAIL, PASSWORD)
+    fake.populate_torrents(50)
+    fake.populate_files(20)
+    server = fake.serve()
+    host, port = server.server_address
+    base_url, Constants.API_BASE_URL = (
+        Constants.API_BASE_URL,
+        f"http://{host}:{port}/api",
+    )
+
+    connections = max(1, options.threads // 4)
+    metrics = MetricsCollector()
+    calls_per_thread = 20
+    expire_every = options.threads * 4
+    completed = itertools.count(1)
+    try:
+        client = SonicBit(
+            EMAIL,
+            PASSWORD,
+            token_handler=TokenFileHandler(
+                os.path.join(tempfile.mkdtemp(), "token.cache")
+            ),
+            hooks=[metrics],
+            limits=httpx.Limits(
+                max_connections=connections, max_keepalive_connections=connections
+            ),
+        )
+        calls = [
+            lambda: len(client.list_torrents().torrents) == 50,
+            lambda: len(client.list_files().items) == 21,
+            lambda: client.get_storage_details().max_parallel == fake.max_parallel,
+        ]
+
+        def worker(index):
+            errors = 0
+            for call in range(calls_per_thread):
+                try:
+                    errors += not calls[(index + call) % len(calls)]()
+                except Exception:
+                    errors += 1
+                if next(completed) % expire_every == 0:
+                    fake.expire_tokens()
+            return errors
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options.threads) as executor:
+            errors = sum(executor.map(worker, range(options.threads)))
+        elapsed = time.perf_counter() - started
+        client.session.close()
+    finally:
+        Constants.API_BASE_URL = base_url
+        server.shutdown()
+        server.server_close()
+
+    return [
+        {
+            "threads": options.threads,
+            "max_connections": connections,
+            "calls": options.threads * calls_per_thread,
+            "errors": errors,
+            "token_expiries": options.threads * calls_per_thread // expire_every,
+            "token_refreshes": sum(metrics.snapshot()["token_refreshes"].values()),
+            "seconds": elapsed,
+            "failed": errors > 0,
+        }
+    ]
+
+
+@benchmark("hedged_reads")
+def hedged_reads(options: Options):
+    """Tail latency of list_torrents with and without hedged reads when
+    every 25th response (4%) is slow.
+
+    The slow responses are scheduled rather than random, so both runs see
+    the same ones. The hedged row is marked as failed unless hedging lowers
+    p99.
+    """
+    slow_every, warmup, samples = 25, 50, 500
+    results = []
+    for hedged in (False, True):
+        fake = FakeSonicBit(
+            latency=options.latency,
+            jitter=options.latency / 2,
+            slow_latency=options.latency * 20,
+            seed=1,
+        )
+        client = make_client(fake)
+        fake.populate_torrents(10)
+        client.hedged_reads = hedged
+        timings = []
+        for call in range(warmup + samples):
+            if call % slow_every == slow_every - 1:
+                fake.fail("slow", endpoint="/app/seedbox/torrent/list")
+            started = time.perf_counter()
+            client.list_torrents()
+            if call >= warmup:  # hedging needs latency samples to start
+                timings.append(time.perf_counter() - started)
+        timings.sort()
+        results.append(
+            {
+                "hedged": hedged,
+                "samples": samples,
+                "slow_fraction": 1 / slow_every,
+                "p50": timings[len(timings) // 2],
+                "p99": timings[int(len(timings) * 0.99) - 1],
+                "requests": fake.requests,
+            }
+        )
+    unhedged, hedged_row = results
+    hedged_row["p99_improvement"] = unhedged["p99"] / hedged_row["p99"]
+    hedged_row["failed"] = hedged_row["p99"] >= unhedged["p99"]
+    return results
@@ -0,0 +1,42 @@
+import json
+import subprocess
+import sys
+
+from .common import Options, benchmark
+
+SCRIPT = """
+import json, time
+started = time.perf_counter()
+import sonicbit
+imported = time.perf_counter()
+from sonicbit import SonicBit
+client_loaded = time.perf_counter()
+from sonicbit.models import PathInfo
+PathInfo.root()
+first_model = time.perf_counter()
+print(json.dumps({
+    "import_sonicbit": imported - started,
+    "import_client": client_loaded - imported,
+    "first_model": first_model - client_loaded,
+}))
+"""
+
+
+@benchmark("import_time")
+def import_time(options: Options):
+    """Cold-start cost of importing the package in a fresh interpreter.
+
+    ``import sonicbit`` must stay lazy; the row is marked as failed when it
+    exceeds ``options.import_budget`` seconds.
+    """
+    runs = []
+    for _ in range(options.repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True
+        ).stdout
+        runs.append(json.loads(output))
+
+    result = {key: min(run[key] for run in runs) for key in runs[0]}
+    result["budget"] = options.import_budget
+    result["failed"] = result["import_sonicbit"] > options.import_budget
+    return [result]
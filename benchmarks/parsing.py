@@ -0,0 +1,60 @@
+from sonicbit.models import FileList, RemoteTaskList, TorrentList
+from sonicbit.testing import FakeSonicBit
+from tests import make_client
+
+from .common import Options, benchmark, measure
+
+
+@benchmark("parse_torrent_list")
+def parse_torrent_list(options: Options):
+    results = []
+    for size in options.sizes:
+        fake = FakeSonicBit(seed=size)
+        client = make_client(fake)
+        fake.populate_torrents(size)
+        response = client._request(
+            method="POST", url=client.url("/app/seedbox/torrent/list")
+        )
+        timing = measure(
+            lambda: TorrentList.from_response(client, response), options.repeat
+        )
+        results.append({"size": size, "bytes": len(response.content), **timing})
+    return results
+
+
+@benchmark("parse_file_list")
+def parse_file_list(options: Options):
+    results = []
+    for size in options.sizes:
+        fake = FakeSonicBit(seed=size)
+        client = make_client(fake)
+        fake.populate_files(size, depth=0)
+        response = client._request(
+            method="GET",
+            url=client.url("/file-manager"),
+            params={"arguments": '{"pathInfo": []}', "command": "GetDirContents"},
+        )
+        timing = measure(
+            lambda: FileList.from_response(client, response), options.repeat
+        )
+        results.append({"size": size, "bytes": len(response.content), **timing})
+    return results
+
+
+@benchmark("parse_remote_task_list")
+def parse_remote_task_list(options: Options):
+    results = []
+    for size in options.sizes:
+        fake = FakeSonicBit(seed=size)
+        client = make_client(fake)
+        fake.populate_remote_tasks(size)
+        response = client._request(
+            method="POST",
+            url=client.url("/remote_download/task/list"),
+            params={"action": "get_rdl_task_list"},
+        )
+        timing = measure(
+            lambda: RemoteTaskList.from_response(client, response), options.repeat
+        )
+        results.append({"size": size, "bytes": len(response.content), **timing})
+    return results
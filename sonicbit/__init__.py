@@ -1,9 +1,30 @@
 import logging
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from sonicbit._version import __version__
-from sonicbit.client import SonicBit
 
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
+# Public exports are imported on first access (PEP 562) so that
+# `import sonicbit` does not pay for httpx, tenacity and pydantic up front.
+_LAZY_EXPORTS = {"SonicBit": "sonicbit.client"}
+
+if TYPE_CHECKING:
+    from sonicbit.client import SonicBit
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
+
 __all__ = ["SonicBit", "__version__"]
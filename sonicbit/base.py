@@ -1,48 +1,300 @@
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from time import perf_counter
+from typing import Callable, ClassVar, Iterator, List
 
 import httpx
 from tenacity import (
-    retry,
+    Retrying,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
 
+from sonicbit import profiling
 from sonicbit.constants import Constants
+from sonicbit.hooks import RequestEvent, RequestHook
+from sonicbit.latency import LatencyTracker, hedged_call
+from sonicbit.rate_limit import CircuitBreaker, RateLimiter
 
 
 class SonicBitBase:
-    """Base class for all SonicBit modules."""
+    """Base class for all SonicBit modules.
+
+    One instance may be shared by any number of threads: the httpx client
+    and its connection pool are thread-safe, the auth token is attached per
+    request instead of being written to shared session headers, and token
+    refreshes are serialized so a burst of 401s triggers a single login.
+    Size the pool with ``limits`` to match the number of worker threads.
+    """
 
     MAX_API_RETRIES = 3
+    MAX_TOKEN_REFRESHES = 2  # 401 responses answered with a refresh per call
     REQUEST_TIMEOUT = 15  # seconds; override at class level if needed
+    ADAPTIVE_TIMEOUTS = False  # derive per-endpoint timeouts from latency
+    HEDGED_READS = False  # re-send slow idempotent reads after their p95
+    BATCH_CONCURRENCY = 4  # parallel requests used by the bulk helpers
+    BATCH_MAX_ITEMS = 100  # items sent per request by the bulk helpers
+    BATCH_MAX_QUERY_LENGTH = 6000  # characters of query string per request
+    POOL_LIMITS = {  # httpx.Limits used when no transport or limits are given
+        "max_connections": 100,
+        "max_keepalive_connections": 20,
+        "keepalive_expiry": 5.0,
+    }
+
+    global_hooks: ClassVar[List[RequestHook]] = []  # also see static requests
 
-    def __init__(self):
-        transport = httpx.HTTPTransport(retries=2)
+    def __init__(
+        self,
+        hooks: List[RequestHook] | None = None,
+        transport: httpx.BaseTransport | None = None,
+        limits: httpx.Limits | None = None,
+    ):
+        if transport is None:
+            transport = httpx.HTTPTransport(
+                retries=2, limits=limits or httpx.Limits(**self.POOL_LIMITS)
+            )
+        elif limits is not None:
+            raise ValueError(
+                "limits cannot be combined with a transport; "
+                "configure the transport's own pool instead"
+            )
         self.session = httpx.Client(transport=transport, timeout=self.REQUEST_TIMEOUT)
+        # Download URLs live on other hosts. They share the connection pool
+        # but not the API headers, whose Host would send them to the API.
+        self.download_session = httpx.Client(
+            transport=transport,
+            timeout=self.REQUEST_TIMEOUT,
+            headers={"User-Agent": Constants.USER_AGENT},
+        )
+        self.hooks = list(hooks or [])
+        self.latency_tracker = LatencyTracker()
+        self.adaptive_timeouts = self.ADAPTIVE_TIMEOUTS
+        self.hedged_reads = self.HEDGED_READS
+        self.rate_limiter: RateLimiter | None = None
+        self.circuit_breaker: CircuitBreaker | None = None
+
+    def _request(
+        self, method: str, url: str, hedge: bool = False, stream: bool = False, **kwargs
+    ) -> httpx.Response:
+        """Send a request through the session.
+
+        ``hedge`` marks the call as an idempotent read that may be sent a
+        second time when ``hedged_reads`` is enabled. With ``stream`` the
+        body is not read; the caller must iterate and close the response.
+        """
+        request = self.session.request
+        if stream:
+
+            def request(method, url, **kwargs):
+                return self.session.send(
+                    self.session.build_request(method, url, **kwargs), stream=True
+                )
+
+        endpoint = self.endpoint(url)
+        key = self.latency_key(endpoint, kwargs)
+        adaptive = self.adaptive_timeouts and "timeout" not in kwargs
+        tracker = self.latency_tracker
+
+        def send() -> httpx.Response:
+            attempts = 0
+
+            def attempt(method, url, **kwargs) -> httpx.Response:
+                nonlocal attempts
+                if adaptive:
+                    timeout = tracker.timeout_for(key, self.REQUEST_TIMEOUT)
+                    if timeout is not None:
+                        # Double it on every retry, so an endpoint that got
+                        # slower than its window still gets through.
+                        kwargs["timeout"] = min(
+                            self.REQUEST_TIMEOUT, timeout * 2**attempts
+                        )
+                attempts += 1
+                started = perf_counter()
+                try:
+                    response = request(method, url, **kwargs)
+                except httpx.TimeoutException:
+                    # Count the attempt at its timeout; only recording the
+                    # responses that completed would let the timeout shrink.
+                    tracker.observe(key, kwargs.get("timeout", self.REQUEST_TIMEOUT))
+                    raise
+                if response.status_code < 500:
+                    tracker.observe(key, perf_counter() - started)
+                return response
 
-    @retry(
-        stop=stop_after_attempt(MAX_API_RETRIES),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException)),
-    )
-    def _request(self, *args, **kwargs):
-        return self.session.request(*args, **kwargs)
+            return SonicBitBase._send(
+                self._guard(endpoint, attempt),
+                self.hooks + self.global_hooks,
+                method,
+                url,
+                kwargs,
+            )
+
+        with profiling.call(endpoint) as call:
+            if call is not None:
+                kwargs["extensions"] = {
+                    **kwargs.get("extensions", {}),
+                    "trace": call.trace,
+                }
+            if hedge and self.hedged_reads and not stream:
+                return hedged_call(send, tracker.percentile(key, 0.95))
+            return send()
+
+    def _guard(
+        self, endpoint: str, send: Callable[..., httpx.Response]
+    ) -> Callable[..., httpx.Response]:
+        """Wrap ``send`` with the rate limiter and circuit breaker, if set.
+
+        The wrapper runs for every attempt, so retries are throttled too.
+        """
+        limiter, breaker = self.rate_limiter, self.circuit_breaker
+        if limiter is None and breaker is None:
+            return send
+
+        def guarded(*args, **kwargs) -> httpx.Response:
+            if breaker is not None:
+                breaker.before(endpoint)
+            try:
+                if limiter is not None:
+                    with profiling.phase("throttle"):
+                        limiter.acquire(endpoint)
+                response = send(*args, **kwargs)
+            except BaseException:
+                # Any error must end a half-open trial, or the circuit
+                # would stay open for good.
+                if breaker is not None:
+                    breaker.record(endpoint, False)
+                raise
+
+            throttled = response.status_code == 429
+            if throttled and limiter is not None:
+                retry_after = response.headers.get("retry-after", "")
+                limiter.throttled(
+                    endpoint, float(retry_after) if retry_after.isdigit() else None
+                )
+            if breaker is not None:
+                breaker.record(endpoint, not throttled and response.status_code < 500)
+            return response
+
+        return guarded
 
     @staticmethod
-    @retry(
-        stop=stop_after_attempt(MAX_API_RETRIES),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException)),
-    )
-    def _static_request(*args, **kwargs):
+    def _static_request(method: str, url: str, **kwargs) -> httpx.Response:
         kwargs.setdefault("timeout", SonicBitBase.REQUEST_TIMEOUT)
-        return httpx.request(*args, **kwargs)
+        with profiling.call(SonicBitBase.endpoint(url)) as call:
+            if call is not None:
+                kwargs["extensions"] = {
+                    **kwargs.get("extensions", {}),
+                    "trace": call.trace,
+                }
+            return SonicBitBase._send(
+                httpx.request, SonicBitBase.global_hooks, method, url, kwargs
+            )
+
+    @staticmethod
+    def _send(
+        send: Callable[..., httpx.Response],
+        hooks: List[RequestHook],
+        method: str,
+        url: str,
+        kwargs: dict,
+    ) -> httpx.Response:
+        """Send a request with retries, reporting it to hooks if any."""
+        endpoint = SonicBitBase.endpoint(url)
+
+        def before_sleep(retry_state):
+            for hook in hooks:
+                hook.on_retry(
+                    endpoint,
+                    retry_state.attempt_number,
+                    retry_state.outcome.exception(),
+                )
+
+        retrying = Retrying(
+            stop=stop_after_attempt(SonicBitBase.MAX_API_RETRIES),
+            wait=wait_exponential(multiplier=1, min=1, max=5),
+            retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException)),
+            before_sleep=before_sleep if hooks else None,
+            sleep=profiling.backoff_sleep,
+        )
+        if not hooks:
+            return retrying(send, method, url, **kwargs)
+
+        started = perf_counter()
+        try:
+            response = retrying(send, method, url, **kwargs)
+        except Exception as error:
+            SonicBitBase._emit_request(
+                hooks, method, endpoint, None, started, retrying, error
+            )
+            raise
+
+        SonicBitBase._emit_request(
+            hooks, method, endpoint, response, started, retrying, None
+        )
+        return response
+
+    @staticmethod
+    def _emit_request(hooks, method, endpoint, response, started, retrying, error):
+        event = RequestEvent(
+            method=method,
+            endpoint=endpoint,
+            status_code=response.status_code if response is not None else None,
+            elapsed=perf_counter() - started,
+            bytes_sent=(
+                int(response.request.headers.get("content-length", 0))
+                if response is not None
+                else 0
+            ),
+            bytes_received=(
+                response.num_bytes_downloaded if response is not None else 0
+            ),
+            retries=retrying.statistics.get("attempt_number", 1) - 1,
+            error=repr(error) if error is not None else None,
+        )
+        for hook in hooks:
+            hook.on_request(event)
+
+    def _emit(self, callback: str, *args) -> None:
+        for hook in self.hooks + self.global_hooks:
+            getattr(hook, callback)(*args)
+
+    @contextmanager
+    def _parse_timer(
+        self, endpoint: str, response: httpx.Response | None = None
+    ) -> Iterator[None]:
+        """Report the time spent in the enclosed block as parse time.
+
+        Pass the ``response`` being parsed so that, while profiling, its
+        JSON decoding is told apart from building the models.
+        """
+        with profiling.parse(endpoint, response):
+            if not (self.hooks or self.global_hooks):
+                yield
+                return
+            started = perf_counter()
+            yield
+            self._emit("on_parse", endpoint, perf_counter() - started)
 
     @staticmethod
     def url(path: str) -> str:
         return f"{Constants.API_BASE_URL}{path}"
 
+    @staticmethod
+    def endpoint(url: str) -> str:
+        """Return the API path of a URL built by ``url``, for metric labels."""
+        return url.removeprefix(Constants.API_BASE_URL).split("?", 1)[0]
+
+    @staticmethod
+    def latency_key(endpoint: str, kwargs: dict) -> str:
+        """Return the latency window of a request: its endpoint, plus the
+        ``command`` or ``action`` for endpoints that multiplex several."""
+        fields = kwargs.get("params") or kwargs.get("data") or {}
+        command = fields.get("command") or fields.get("action")
+        if command is None:
+            return endpoint
+        return f"{endpoint}:{getattr(command, 'value', command)}"
+
     @staticmethod
     def get_time_params() -> dict:
         return {
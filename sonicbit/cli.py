@@ -0,0 +1,356 @@
+"""Command-line interface, installed as the ``sonicbit`` console script.
+
+Every command writes one JSON object per line to stdout. Bulk commands take
+their items as arguments or, when none are given (or ``-``), one per line
+from stdin, and print a result line per item as soon as it finishes::
+
+    sonicbit torrents ls | jq -r 'select(.progress == 100) | .hash' \\
+        | sonicbit torrents rm --with-file
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List
+
+if TYPE_CHECKING:
+    from sonicbit.client import SonicBit
+    from sonicbit.models import BatchResult, PathInfo
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    from sonicbit.errors import SonicBitError
+
+    try:
+        return args.handler(_client(args), args) or 0
+    except SonicBitError as error:
+        print(f"error: {error.message}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The reader went away, e.g. `sonicbit ls | head`; silence the final
+        # flush at interpreter exit as the Python docs recommend.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sonicbit", description="Batch operations on a SonicBit account."
+    )
+    parser.add_argument(
+        "--email",
+        default=os.environ.get("SONICBIT_EMAIL"),
+        help="account email (default: $SONICBIT_EMAIL)",
+    )
+    parser.add_argument(
+        "--password",
+        default=os.environ.get("SONICBIT_PASSWORD"),
+        help="account password (default: $SONICBIT_PASSWORD)",
+    )
+    parser.add_argument(
+        "--token-file", help="token cache file (default: .sonicbit.cache)"
+    )
+    parser.add_argument(
+        "-j", "--concurrency", type=int, default=8, help="parallel requests"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="stdin items read per batch",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ls = commands.add_parser("ls", help="list a directory")
+    ls.add_argument("path", nargs="?", default="/")
+    ls.set_defaults(handler=_ls)
+
+    walk = commands.add_parser("walk", help="list a directory recursively")
+    walk.add_argument("path", nargs="?", default="/")
+    walk.set_defaults(handler=_walk)
+
+    add = commands.add_parser("add", help="add torrents by magnet or URL")
+    add.add_argument("items", nargs="*", metavar="uri")
+    _add_target_arguments(add)
+    add.add_argument("--skip-existing", action="store_true")
+    add.set_defaults(handler=_add)
+
+    add_file = commands.add_parser("add-file", help="upload local .torrent files")
+    add_file.add_argument("items", nargs="*", metavar="file")
+    _add_target_arguments(add_file)
+    add_file.add_argument("--skip-existing", action="store_true")
+    add_file.set_defaults(handler=_add_file)
+
+    rm = commands.add_parser("rm", help="delete files")
+    rm.add_argument("items", nargs="*", metavar="path")
+    rm.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="delete directories with everything below them",
+    )
+    rm.add_argument(
+        "--no-preserve-root",
+        action="store_true",
+        help="allow deleting everything on the drive with '/'",
+    )
+    rm.set_defaults(handler=_rm)
+
+    torrents = commands.add_parser("torrents", help="manage torrents")
+    torrent_commands = torrents.add_subparsers(dest="action")
+    torrents.set_defaults(handler=_torrents_ls)
+    torrent_commands.add_parser("ls", help="list torrents").set_defaults(
+        handler=_torrents_ls
+    )
+    torrents_details = torrent_commands.add_parser(
+        "details", help="print the files of torrents"
+    )
+    torrents_details.add_argument("items", nargs="*", metavar="hash")
+    torrents_details.set_defaults(handler=_torrents_details)
+    torrents_rm = torrent_commands.add_parser("rm", help="delete torrents")
+    torrents_rm.add_argument("items", nargs="*", metavar="hash")
+    torrents_rm.add_argument("--with-file", action="store_true")
+    torrents_rm.set_defaults(handler=_torrents_rm)
+
+    remote = commands.add_parser("remote", help="manage remote downloads")
+    remote_commands = remote.add_subparsers(dest="action", required=True)
+    remote_add = remote_commands.add_parser("add", help="add remote downloads")
+    remote_add.add_argument("items", nargs="*", metavar="url")
+    remote_add.add_argument("--path", default="/", help="destination directory")
+    remote_add.add_argument("--skip-existing", action="store_true")
+    remote_add.set_defaults(handler=_remote_add)
+    remote_commands.add_parser("ls", help="list remote downloads").set_defaults(
+        handler=_remote_ls
+    )
+    remote_rm = remote_commands.add_parser("rm", help="delete remote downloads")
+    remote_rm.add_argument("items", nargs="*", metavar="id")
+    remote_rm.set_defaults(handler=_remote_rm)
+
+    storage = commands.add_parser("storage", help="print storage details")
+    storage.set_defaults(handler=_storage)
+    return parser
+
+
+def _add_target_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--path", default="/", help="destination directory")
+    parser.add_argument(
+        "--no-start", dest="auto_start", action="store_false", help="add paused"
+    )
+
+
+def _client(args: argparse.Namespace) -> "SonicBit":
+    if not args.email or not args.password:
+        raise SystemExit("sonicbit: --email and --password are required")
+
+    import httpx
+
+    from sonicbit.client import SonicBit
+    from sonicbit.handlers import TokenFileHandler
+
+    connections = max(args.concurrency, SonicBit.POOL_LIMITS["max_connections"])
+    return SonicBit(
+        args.email,
+        args.password,
+        token_handler=TokenFileHandler(args.token_file) if args.token_file else None,
+        limits=httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=args.concurrency,
+        ),
+    )
+
+
+def _path(value: str) -> "PathInfo":
+    from sonicbit.models import PathInfo
+
+    value = value.strip("/")
+    return PathInfo.from_path_key(value) if value else PathInfo.root()
+
+
+def _items(args: argparse.Namespace) -> Iterator[str]:
+    if args.items and args.items != ["-"]:
+        yield from args.items
+        return
+    for line in sys.stdin:
+        if line := line.strip():
+            yield line
+
+
+def _batches(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    items = iter(items)
+    while batch := list(itertools.islice(items, size)):
+        yield batch
+
+
+def _write(line: str) -> None:
+    sys.stdout.write(line + "\n")
+
+
+def _stream(
+    args: argparse.Namespace,
+    run: Callable[[List[str]], "BatchResult"],
+    chunk_size: int = 1,
+    concurrency: int | None = None,
+) -> Iterator["BatchResult"]:
+    """Run ``run`` concurrently over chunks of each batch of items and yield
+    every chunk's result as soon as it finishes."""
+    from sonicbit.models import BatchResult
+    from sonicbit.utils import run_concurrently
+
+    for batch in _batches(_items(args), args.batch_size):
+        chunks = list(_batches(dict.fromkeys(batch), chunk_size))
+        for chunk, result, error in run_concurrently(
+            run, chunks, concurrency or args.concurrency
+        ):
+            if error is not None:
+                result = BatchResult.empty()
+                for item in chunk:
+                    result.add(item, False, str(error))
+            yield result
+
+
+def _report(results: Iterable["BatchResult"]) -> int:
+    """Print a line per item of each result as it arrives; 1 if any failed."""
+    status = 0
+    for result in results:
+        for item in result.results.values():
+            _write(item.model_dump_json())
+            if not item.success and not item.skipped:
+                status = 1
+        sys.stdout.flush()
+    return status
+
+
+def _ls(client: "SonicBit", args: argparse.Namespace) -> int:
+    for file in client.iter_files(_path(args.path)):
+        _write(file.model_dump_json())
+    return 0
+
+
+def _walk(client: "SonicBit", args: argparse.Namespace) -> int:
+    for file in client.walk(_path(args.path), args.concurrency):
+        _write(file.model_dump_json())
+    return 0
+
+
+def _add(client: "SonicBit", args: argparse.Namespace) -> int:
+    path = _path(args.path)
+    if args.skip_existing:
+        client.known_torrent_hashes()  # load once, not per chunk
+    return _report(
+        _stream(
+            args,
+            lambda chunk: client.add_torrents(
+                chunk, path, args.auto_start, skip_existing=args.skip_existing
+            ),
+            client.BATCH_MAX_ITEMS,
+        )
+    )
+
+
+def _add_file(client: "SonicBit", args: argparse.Namespace) -> int:
+    path = _path(args.path)
+    if args.skip_existing:
+        client.known_torrent_hashes()  # load once, not per chunk
+    return _report(
+        _stream(
+            args,
+            lambda chunk: client.add_torrent_files(
+                chunk, path, args.auto_start, skip_existing=args.skip_existing
+            ),
+        )
+    )
+
+
+def _rm(client: "SonicBit", args: argparse.Namespace) -> int:
+    def target(item: str) -> "PathInfo":
+        path = _path(item)
+        if path.path == "/" and not args.no_preserve_root:
+            raise ValueError(
+                "Refusing to delete the root directory; "
+                "pass --no-preserve-root to override"
+            )
+        return path
+
+    if args.recursive:
+        # One tree at a time; each deletes with the full concurrency.
+        return _report(
+            _stream(
+                args,
+                lambda chunk: client.delete_tree(target(chunk[0]), args.concurrency),
+                concurrency=1,
+            )
+        )
+    return _report(_stream(args, lambda chunk: client.delete_files([target(chunk[0])])))
+
+
+def _torrents_ls(client: "SonicBit", args: argparse.Namespace) -> int:
+    for torrent in client.list_torrents().torrents.values():
+        _write(torrent.model_dump_json())
+    return 0
+
+
+def _torrents_details(client: "SonicBit", args: argparse.Namespace) -> int:
+    status = 0
+    for result in _stream(args, client.get_torrent_details_many):
+        for item in result.results.values():
+            line = item.model_dump(mode="json")
+            if item.success:
+                line["files"] = item.value.model_dump(mode="json")["files"]
+            else:
+                status = 1
+            _write(json.dumps(line))
+        sys.stdout.flush()
+    return status
+
+
+def _torrents_rm(client: "SonicBit", args: argparse.Namespace) -> int:
+    return _report(
+        _stream(
+            args,
+            lambda chunk: client.delete_torrents(chunk, with_file=args.with_file),
+            client.BATCH_MAX_ITEMS,
+        )
+    )
+
+
+def _remote_add(client: "SonicBit", args: argparse.Namespace) -> int:
+    path = _path(args.path)
+    if args.skip_existing:
+        client.known_remote_urls()  # load once, not per chunk
+    return _report(
+        _stream(
+            args,
+            lambda chunk: client.add_remote_downloads(
+                chunk, path, skip_existing=args.skip_existing
+            ),
+        )
+    )
+
+
+def _remote_ls(client: "SonicBit", args: argparse.Namespace) -> int:
+    for task in client.list_remote_downloads().tasks:
+        _write(task.model_dump_json())
+    return 0
+
+
+def _remote_rm(client: "SonicBit", args: argparse.Namespace) -> int:
+    def delete(chunk: List[str]) -> "BatchResult":
+        if not chunk[0].isdigit():
+            raise ValueError(f"Invalid task id: {chunk[0]}")
+        return client.delete_remote_downloads([int(chunk[0])])
+
+    return _report(_stream(args, delete))
+
+
+def _storage(client: "SonicBit", args: argparse.Namespace) -> int:
+    _write(client.get_storage_details().model_dump_json())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
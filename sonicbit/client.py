@@ -1,5 +1,10 @@
+from typing import List
+
+import httpx
+
 from sonicbit.handlers.token_file_handler import TokenFileHandler
 from sonicbit.handlers.token_handler import TokenHandler
+from sonicbit.hooks import RequestHook
 from sonicbit.modules.auth import Auth
 from sonicbit.modules.file import File
 from sonicbit.modules.remote_download import RemoteDownload
@@ -15,7 +20,20 @@ class SonicBit(Auth, Signup, User, File, Torrent, RemoteDownload):
         password: str,
         token: str | None = None,
         token_handler: TokenHandler | None = None,
+        hooks: List[RequestHook] | None = None,
+        transport: httpx.BaseTransport | None = None,
+        limits: httpx.Limits | None = None,
+        lazy_session: bool = False,
     ):
         if token_handler is None:
             token_handler = TokenFileHandler()
-        super().__init__(email, password, token, token_handler)
+        super().__init__(
+            email,
+            password,
+            token,
+            token_handler,
+            hooks,
+            transport,
+            limits,
+            lazy_session,
+        )
@@ -14,3 +14,9 @@ class TorrentCommand(StrEnum):
 
 class RemoteDownloadCommand(StrEnum):
     LIST_REMOTE_DOWNLOADS = "get_rdl_task_list"
+
+
+class ReclaimPolicy(StrEnum):
+    OLDEST_FIRST = "oldest_first"
+    LARGEST_FIRST = "largest_first"
+    COMPLETED_FIRST = "completed_first"
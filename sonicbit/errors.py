@@ -8,6 +8,10 @@ class AuthError(SonicBitError):
     """Raised when the user is not authenticated."""
 
 
+class CircuitOpenError(SonicBitError):
+    """Raised when calls to an endpoint family are failing fast."""
+
+
 class InvalidResponseError(SonicBitError):
     """Raised when the server returns an invalid response."""
 
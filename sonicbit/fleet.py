@@ -0,0 +1,113 @@
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+import httpx
+
+from sonicbit.base import SonicBitBase
+from sonicbit.client import SonicBit
+from sonicbit.handlers.token_file_handler import TokenFileHandler
+from sonicbit.handlers.token_handler import TokenHandler
+from sonicbit.hooks import RequestHook
+from sonicbit.models import BatchResult
+from sonicbit.utils import run_concurrently
+
+logger = logging.getLogger(__name__)
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """A transport whose ``close`` is a no-op, so closing one client's
+    session leaves the pool open for the others."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class Fleet:
+    """The clients built by ``connect_many`` and the pool they share.
+
+    ``result`` is keyed by email: the clients of the accounts that connected
+    are in ``clients``, the errors of the others in ``failed``. Closing a
+    single client leaves the pool open; ``close`` shuts it down for all of
+    them.
+    """
+
+    def __init__(self, result: BatchResult, transport: httpx.BaseTransport):
+        self.result = result
+        self.transport = transport
+
+    @property
+    def clients(self) -> Dict[str, SonicBit]:
+        return self.result.values
+
+    @property
+    def failed(self) -> Dict[str, str | None]:
+        return self.result.failed
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def __enter__(self) -> "Fleet":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def connect_many(
+    accounts: Dict[str, str] | Iterable[Tuple[str, str]],
+    concurrency: int = 16,
+    token_handler: TokenHandler | None = None,
+    hooks: List[RequestHook] | None = None,
+    transport: httpx.BaseTransport | None = None,
+    limits: httpx.Limits | None = None,
+    lazy_session: bool = True,
+) -> Fleet:
+    """Build a client for each ``(email, password)`` concurrently.
+
+    All clients share one token handler and one transport, so they reuse
+    cached tokens and a single connection pool; only accounts without a
+    valid cached token log in. With ``lazy_session`` the web session login
+    of each client is deferred until its first file manager request.
+
+    Returns a ``Fleet`` holding the clients and the errors per email;
+    close it, not the clients, to shut down the shared pool.
+    """
+    if transport is None:
+        transport = httpx.HTTPTransport(
+            retries=2, limits=limits or httpx.Limits(**SonicBitBase.POOL_LIMITS)
+        )
+    elif limits is not None:
+        raise ValueError(
+            "limits cannot be combined with a transport; "
+            "configure the transport's own pool instead"
+        )
+    accounts = list(dict(accounts).items())
+    token_handler = token_handler or TokenFileHandler()
+    shared = _SharedTransport(transport)
+    logger.debug("Connecting %d accounts concurrency=%d", len(accounts), concurrency)
+
+    def connect(account: Tuple[str, str]) -> SonicBit:
+        email, password = account
+        return SonicBit(
+            email,
+            password,
+            token_handler=token_handler,
+            hooks=hooks,
+            transport=shared,
+            lazy_session=lazy_session,
+        )
+
+    result = BatchResult.empty()
+    for (email, _), client, error in run_concurrently(connect, accounts, concurrency):
+        if error is not None:
+            logger.warning("Failed to connect email=%s: %s", email, error)
+            result.add(email, False, str(error))
+        else:
+            result.add(email, True, value=client)
+    return Fleet(result, transport)
@@ -1,21 +1,35 @@
 import json
 import os
+import threading
+from typing import Dict
 
 from sonicbit.handlers.token_handler import TokenHandler
 from sonicbit.models.auth_response import AuthResponse
+from sonicbit.utils import write_json_atomic
+
+# Handlers are created per client, so writes to one file are serialized per
+# path rather than per handler.
+_locks: Dict[str, threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+
+def _path_lock(path: str) -> threading.Lock:
+    with _locks_lock:
+        return _locks.setdefault(path, threading.Lock())
 
 
 class TokenFileHandler(TokenHandler):
     def __init__(self, path: str = ".sonicbit.cache"):
         self.path = os.path.abspath(path)
+        self._lock = _path_lock(self.path)
         super().__init__()
 
     def write(self, email: str, auth: AuthResponse) -> None:
-        cache = self._read_cache()
+        with self._lock:
+            cache = self._read_cache()
 
-        cache[email] = auth.token
-        with open(self.path, "w") as f:
-            json.dump(cache, f)
+            cache[email] = auth.token
+            write_json_atomic(self.path, cache)
 
     def read(self, email: str) -> str | None:
         cache = self._read_cache()
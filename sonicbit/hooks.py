@@ -0,0 +1,43 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RequestEvent(BaseModel):
+    """Summary of one API call, emitted after its final attempt."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    method: str
+    endpoint: str
+    status_code: Optional[int]
+    elapsed: float  # seconds, including retry back-off
+    bytes_sent: int
+    bytes_received: int
+    retries: int
+    error: Optional[str] = None
+
+
+class RequestHook:
+    """Base class for instrumentation hooks.
+
+    Subclass this, override the callbacks you need and pass instances to
+    SonicBit(hooks=[...]), or append them to SonicBitBase.global_hooks to
+    also observe static calls such as login and signup. Callbacks run on
+    the calling thread, so they must be cheap and thread-safe.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called once per API call with its timing and sizes."""
+
+    def on_retry(self, endpoint: str, attempt: int, error: BaseException) -> None:
+        """Called before sleeping ahead of a retry of a failed attempt."""
+
+    def on_token_refresh(self, endpoint: str) -> None:
+        """Called when a 401 response triggers a token refresh."""
+
+    def on_cache(self, cache: str, hit: bool) -> None:
+        """Called when a client-side cache is consulted."""
+
+    def on_parse(self, endpoint: str, elapsed: float) -> None:
+        """Called with the time spent decoding a response into models."""
@@ -0,0 +1,221 @@
+import json
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from sonicbit.client import SonicBit
+from sonicbit.models import BatchResult, File, PathInfo, TorrentList
+from sonicbit.utils import run_concurrently, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class IndexedFile(NamedTuple):
+    email: str
+    name: str
+    size: int
+    path_info: PathInfo
+
+
+class AccountIndex:
+    """Where torrents and files live across many accounts.
+
+    Maps infohashes to the accounts holding them, and file names and sizes
+    to the accounts and paths they are stored at, so a lookup is a dict
+    access instead of a ``list_torrents`` or ``list_files`` per account.
+
+    Hashes come from ``TorrentInfo.hash_list`` and the listed torrents, and
+    are replaced per account on every ``update_torrents``, so feeding it the
+    results of an existing polling loop keeps it current. Files come from
+    ``crawl``, which replaces the entries of an account below the crawled
+    path. With ``path`` the index is loaded from and saved to a JSON file.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._hashes: Dict[str, Set[str]] = defaultdict(set)  # hash -> emails
+        self._account_hashes: Dict[str, Set[str]] = {}  # email -> hashes
+        self._files: Dict[Tuple[str, str], IndexedFile] = {}  # (email, path)
+        self._account_files: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self._by_name: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self._by_size: Dict[int, Set[Tuple[str, str]]] = defaultdict(set)
+        if path is not None:
+            self._load()
+
+    # ---------------------------------------------------------------- lookups
+
+    def accounts_with_hash(self, hash: str) -> List[str]:
+        """Emails of the accounts holding the torrent ``hash``."""
+        with self._lock:
+            return sorted(self._hashes.get(hash.upper(), ()))
+
+    def find_files(
+        self, name: str | None = None, size: int | None = None
+    ) -> List[IndexedFile]:
+        """Indexed files matching ``name``, ``size`` or both."""
+        if name is None and size is None:
+            raise ValueError("Pass a name, a size or both")
+        with self._lock:
+            if name is not None:
+                keys = self._by_name.get(name, set())
+                if size is not None:
+                    keys = keys & self._by_size.get(size, set())
+            else:
+                keys = self._by_size.get(size, set())
+            return [self._files[key] for key in keys]
+
+    def missing_hashes(self, hashes: Iterable[str]) -> List[str]:
+        """The ``hashes`` no indexed account holds yet."""
+        with self._lock:
+            return [h for h in hashes if not self._hashes.get(h.upper())]
+
+    # ---------------------------------------------------------------- updates
+
+    def update_torrents(self, email: str, torrent_list: TorrentList) -> None:
+        """Replace the hashes indexed for ``email`` with ``torrent_list``'s."""
+        hashes = {h.upper() for h in torrent_list.info.hash_list} | {
+            torrent.hash.upper() for torrent in torrent_list.torrents.values()
+        }
+        with self._lock:
+            previous = self._account_hashes.get(email, set())
+            for hash in previous - hashes:
+                self._discard_hash(hash, email)
+            for hash in hashes - previous:
+                self._hashes[hash].add(email)
+            self._account_hashes[email] = hashes
+
+    def update_files(
+        self, email: str, files: Iterable[File], path: PathInfo = PathInfo.root()
+    ) -> int:
+        """Replace the files indexed for ``email`` below ``path`` with
+        ``files``. Directories are skipped. Returns the number indexed."""
+        prefix = path.path.rstrip("/") + "/"
+        entries = [
+            IndexedFile(email, file.name, file.size, file.path_info)
+            for file in files
+            if not file.is_directory
+        ]
+        with self._lock:
+            for key in [
+                key
+                for key in self._account_files.get(email, ())
+                if key[1].startswith(prefix)
+            ]:
+                self._remove_file(key)
+            for entry in entries:
+                self._add_file(entry)
+        return len(entries)
+
+    def crawl(
+        self,
+        email: str,
+        client: SonicBit,
+        path: PathInfo = PathInfo.root(),
+        concurrency: int | None = None,
+    ) -> int:
+        """Walk ``path`` on ``client`` and index the files found."""
+        logger.debug("Indexing files email=%s path=%s", email, path.path)
+        return self.update_files(email, client.walk(path, concurrency), path)
+
+    def refresh(
+        self,
+        clients: Dict[str, SonicBit],
+        files: bool = False,
+        concurrency: int = 16,
+    ) -> BatchResult:
+        """Poll every account concurrently and update the index.
+
+        ``clients`` maps emails to clients, as in the ``clients`` of the
+        fleet ``connect_many`` returns. Torrents are listed on every call;
+        the drive is only crawled with ``files``. Results are keyed by email
+        and the index is saved afterwards when it has a ``path``.
+        """
+
+        def poll(email: str) -> None:
+            client = clients[email]
+            self.update_torrents(email, client.list_torrents())
+            if files:
+                self.crawl(email, client)
+
+        result = BatchResult.empty()
+        for email, _, error in run_concurrently(poll, list(clients), concurrency):
+            if error is not None:
+                logger.warning("Failed to index email=%s: %s", email, error)
+                result.add(email, False, str(error))
+            else:
+                result.add(email, True)
+        if self.path is not None:
+            self.save()
+        return result
+
+    def remove_account(self, email: str) -> None:
+        with self._lock:
+            for hash in self._account_hashes.pop(email, set()):
+                self._discard_hash(hash, email)
+            for key in list(self._account_files.get(email, ())):
+                self._remove_file(key)
+
+    # ------------------------------------------------------------ persistence
+
+    def save(self, path: str | None = None) -> None:
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path to save the index to")
+        with self._lock:
+            data = {
+                "version": 1,
+                "hashes": {
+                    email: sorted(hashes)
+                    for email, hashes in self._account_hashes.items()
+                },
+                "files": [
+                    [entry.email, entry.name, entry.size, entry.path_info.raw]
+                    for entry in self._files.values()
+                ],
+            }
+            write_json_atomic(path, data)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        for email, hashes in data["hashes"].items():
+            self._account_hashes[email] = set(hashes)
+            for hash in hashes:
+                self._hashes[hash].add(email)
+        for email, name, size, raw in data["files"]:
+            self._add_file(IndexedFile(email, name, size, PathInfo.from_list(raw)))
+
+    # -------------------------------------------------------------- internals
+
+    def _discard_hash(self, hash: str, email: str) -> None:
+        emails = self._hashes.get(hash)
+        if emails is not None:
+            emails.discard(email)
+            if not emails:
+                del self._hashes[hash]
+
+    def _add_file(self, entry: IndexedFile) -> None:
+        key = (entry.email, entry.path_info.path)
+        if key in self._files:
+            self._remove_file(key)
+        self._files[key] = entry
+        self._account_files[entry.email].add(key)
+        self._by_name[entry.name].add(key)
+        self._by_size[entry.size].add(key)
+
+    def _remove_file(self, key: Tuple[str, str]) -> None:
+        entry = self._files.pop(key)
+        files = self._account_files[entry.email]
+        files.discard(key)
+        if not files:
+            del self._account_files[entry.email]
+        for index, value in ((self._by_name, entry.name), (self._by_size, entry.size)):
+            keys = index[value]
+            keys.discard(key)
+            if not keys:
+                del index[value]
@@ -0,0 +1,109 @@
+import math
+import queue
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class _Window:
+    __slots__ = ("samples", "sorted", "stale")
+
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.sorted: list = []
+        self.stale = 0
+
+
+class LatencyTracker:
+    """Rolling per-endpoint latency percentiles.
+
+    Keeps the last ``window`` latencies of every endpoint and re-sorts them
+    every ``resort_every`` observations, so recording stays O(1) and
+    percentile lookups O(1) between re-sorts. Timed-out attempts are
+    recorded at their timeout, so the percentiles can grow past it.
+    """
+
+    def __init__(
+        self, window: int = 200, min_samples: int = 20, resort_every: int = 10
+    ):
+        self.window = window
+        self.min_samples = min_samples
+        self.resort_every = resort_every
+        self._lock = threading.Lock()
+        self._windows: Dict[str, _Window] = {}
+
+    def observe(self, endpoint: str, elapsed: float) -> None:
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None:
+                window = self._windows[endpoint] = _Window(self.window)
+            window.samples.append(elapsed)
+            window.stale += 1
+            # A new maximum re-sorts at once, so a slowdown raises the
+            # timeout on the next call instead of after ``resort_every``.
+            if (
+                window.stale >= self.resort_every
+                or not window.sorted
+                or elapsed > window.sorted[-1]
+            ):
+                window.sorted = sorted(window.samples)
+                window.stale = 0
+
+    def percentile(self, endpoint: str, q: float) -> float | None:
+        """Return the ``q`` quantile (0-1), or None without enough samples."""
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None or len(window.samples) < self.min_samples:
+                return None
+            values = window.sorted
+            return values[min(len(values) - 1, math.ceil(q * len(values)) - 1)]
+
+    def timeout_for(
+        self,
+        endpoint: str,
+        ceiling: float,
+        floor: float = 1.0,
+        multiplier: float = 3.0,
+        q: float = 0.99,
+    ) -> float | None:
+        """Return a timeout of ``multiplier`` times the ``q`` quantile,
+        clamped to ``[floor, ceiling]``, or None without enough samples."""
+        value = self.percentile(endpoint, q)
+        if value is None:
+            return None
+        return min(ceiling, max(floor, value * multiplier))
+
+
+def hedged_call(func: Callable[[], T], delay: float | None) -> T:
+    """Call ``func`` and, if it has not returned after ``delay`` seconds,
+    call it a second time and return whichever succeeds first.
+
+    Only use this for idempotent calls: the slower attempt is not cancelled,
+    its result is discarded. An error is raised once both attempts failed,
+    or straight away if the first attempt fails before the hedge is sent.
+    """
+    if delay is None:
+        return func()
+
+    results: queue.Queue = queue.Queue()
+
+    def attempt():
+        try:
+            results.put((True, func()))
+        except Exception as error:
+            results.put((False, error))
+
+    threading.Thread(target=attempt, daemon=True).start()
+    try:
+        ok, value = results.get(timeout=delay)
+    except queue.Empty:
+        threading.Thread(target=attempt, daemon=True).start()
+        ok, value = results.get()
+        if not ok:
+            ok, value = results.get()
+
+    if ok:
+        return value
+    raise value
@@ -0,0 +1,194 @@
+import bisect
+import threading
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from sonicbit.hooks import RequestEvent, RequestHook
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total, result = 0, []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((repr(bound), total))
+        result.append(("+Inf", self.count))
+        return result
+
+
+class MetricsCollector(RequestHook):
+    """In-memory aggregator of per-endpoint request metrics.
+
+    Pass an instance to SonicBit(hooks=[...]) and read ``snapshot()`` or
+    export ``to_prometheus()`` from a metrics endpoint.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], _Histogram] = {}
+        self._parse: Dict[str, _Histogram] = {}
+        self._status: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._bytes_sent: Dict[str, int] = defaultdict(int)
+        self._bytes_received: Dict[str, int] = defaultdict(int)
+        self._retries: Dict[str, int] = defaultdict(int)
+        self._token_refreshes: Dict[str, int] = defaultdict(int)
+        self._cache: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    def on_request(self, event: RequestEvent) -> None:
+        status = str(event.status_code) if event.status_code else "error"
+        with self._lock:
+            key = (event.method, event.endpoint)
+            if key not in self._latency:
+                self._latency[key] = _Histogram(self.buckets)
+            self._latency[key].observe(event.elapsed)
+            self._status[(event.method, event.endpoint, status)] += 1
+            self._bytes_sent[event.endpoint] += event.bytes_sent
+            self._bytes_received[event.endpoint] += event.bytes_received
+
+    def on_retry(self, endpoint: str, attempt: int, error: BaseException) -> None:
+        with self._lock:
+            self._retries[endpoint] += 1
+
+    def on_token_refresh(self, endpoint: str) -> None:
+        with self._lock:
+            self._token_refreshes[endpoint] += 1
+
+    def on_cache(self, cache: str, hit: bool) -> None:
+        with self._lock:
+            self._cache[(cache, "hit" if hit else "miss")] += 1
+
+    def on_parse(self, endpoint: str, elapsed: float) -> None:
+        with self._lock:
+            if endpoint not in self._parse:
+                self._parse[endpoint] = _Histogram(self.buckets)
+            self._parse[endpoint].observe(elapsed)
+
+    def reset(self) -> None:
+        with self._lock:
+            for metric in (
+                self._latency,
+                self._parse,
+                self._status,
+                self._bytes_sent,
+                self._bytes_received,
+                self._retries,
+                self._token_refreshes,
+                self._cache,
+            ):
+                metric.clear()
+
+    def snapshot(self) -> dict:
+        """Return the aggregated metrics as plain, JSON-serializable data."""
+        with self._lock:
+            return {
+                "requests": [
+                    {
+                        "method": method,
+                        "endpoint": endpoint,
+                        "count": histogram.count,
+                        "latency_sum": histogram.sum,
+                        "latency_buckets": dict(histogram.cumulative()),
+                    }
+                    for (method, endpoint), histogram in self._latency.items()
+                ],
+                "status": [
+                    {"method": m, "endpoint": e, "status": s, "count": c}
+                    for (m, e, s), c in self._status.items()
+                ],
+                "parse": {
+                    endpoint: {"count": h.count, "sum": h.sum}
+                    for endpoint, h in self._parse.items()
+                },
+                "bytes_sent": dict(self._bytes_sent),
+                "bytes_received": dict(self._bytes_received),
+                "retries": dict(self._retries),
+                "token_refreshes": dict(self._token_refreshes),
+                "cache": {f"{c}:{r}": n for (c, r), n in self._cache.items()},
+            }
+
+    def to_prometheus(self, prefix: str = "sonicbit") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def histogram(name, help_text, items):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for labels, value in items:
+                for bound, count in value.cumulative():
+                    lines.append(
+                        f'{prefix}_{name}_bucket{{{labels},le="{bound}"}} {count}'
+                    )
+                lines.append(f"{prefix}_{name}_sum{{{labels}}} {value.sum}")
+                lines.append(f"{prefix}_{name}_count{{{labels}}} {value.count}")
+
+        def counter(name, help_text, items):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, value in items:
+                lines.append(f"{prefix}_{name}{{{labels}}} {value}")
+
+        with self._lock:
+            histogram(
+                "request_duration_seconds",
+                "Time spent per API call including retries.",
+                [
+                    (f'method="{m}",endpoint="{e}"', h)
+                    for (m, e), h in self._latency.items()
+                ],
+            )
+            histogram(
+                "parse_duration_seconds",
+                "Time spent decoding responses into models.",
+                [(f'endpoint="{e}"', h) for e, h in self._parse.items()],
+            )
+            counter(
+                "responses_total",
+                "API calls by final status code.",
+                [
+                    (f'method="{m}",endpoint="{e}",status="{s}"', c)
+                    for (m, e, s), c in self._status.items()
+                ],
+            )
+            counter(
+                "request_bytes_total",
+                "Request body bytes sent.",
+                [(f'endpoint="{e}"', n) for e, n in self._bytes_sent.items()],
+            )
+            counter(
+                "response_bytes_total",
+                "Response bytes received on the wire.",
+                [(f'endpoint="{e}"', n) for e, n in self._bytes_received.items()],
+            )
+            counter(
+                "retries_total",
+                "Attempts retried after connection errors or timeouts.",
+                [(f'endpoint="{e}"', n) for e, n in self._retries.items()],
+            )
+            counter(
+                "token_refreshes_total",
+                "Token refreshes triggered by 401 responses.",
+                [(f'endpoint="{e}"', n) for e, n in self._token_refreshes.items()],
+            )
+            counter(
+                "cache_lookups_total",
+                "Client-side cache lookups by result.",
+                [(f'cache="{c}",result="{r}"', n) for (c, r), n in self._cache.items()],
+            )
+
+        return "\n".join(lines) + "\n"
@@ -1,12 +1,53 @@
-from .app import App
-from .auth_response import AuthResponse
-from .file import File
-from .file_list import FileList
-from .path_info import PathInfo, PathInfoItem
-from .remote_download import RemoteTask, RemoteTaskList
-from .storage_details import StorageDetails
-from .torrent import Torrent, TorrentDetails, TorrentFile, TorrentInfo, TorrentList
-from .user_details import UserDetails
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_LAZY_EXPORTS = {
+    "AuthResponse": ".auth_response",
+    "UserDetails": ".user_details",
+    "App": ".app",
+    "StorageDetails": ".storage_details",
+    "PathInfo": ".path_info",
+    "PathInfoItem": ".path_info",
+    "FileList": ".file_list",
+    "File": ".file",
+    "TorrentList": ".torrent",
+    "Torrent": ".torrent",
+    "TorrentInfo": ".torrent",
+    "TorrentDetails": ".torrent",
+    "TorrentFile": ".torrent",
+    "RemoteTaskList": ".remote_download",
+    "RemoteTask": ".remote_download",
+    "BatchResult": ".batch_result",
+    "BatchItemResult": ".batch_result",
+    "ReclaimPlan": ".reclaim_plan",
+    "ReclaimItem": ".reclaim_plan",
+}
+
+if TYPE_CHECKING:
+    from .app import App
+    from .auth_response import AuthResponse
+    from .batch_result import BatchItemResult, BatchResult
+    from .file import File
+    from .file_list import FileList
+    from .path_info import PathInfo, PathInfoItem
+    from .reclaim_plan import ReclaimItem, ReclaimPlan
+    from .remote_download import RemoteTask, RemoteTaskList
+    from .storage_details import StorageDetails
+    from .torrent import Torrent, TorrentDetails, TorrentFile, TorrentInfo, TorrentList
+    from .user_details import UserDetails
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "AuthResponse",
@@ -24,4 +65,8 @@ __all__ = [
     "TorrentFile",
     "RemoteTaskList",
     "RemoteTask",
+    "BatchResult",
+    "BatchItemResult",
+    "ReclaimPlan",
+    "ReclaimItem",
 ]
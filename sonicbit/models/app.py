@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class App(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     type: str
     name_id: str
@@ -1,12 +1,14 @@
 from json import JSONDecodeError
 
 from httpx import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from sonicbit.errors import AuthError, InvalidResponseError
 
 
 class AuthResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     token: str
     session: str
     require_2fa_verification: bool
@@ -0,0 +1,66 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BatchItemResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    item: str
+    success: bool
+    skipped: bool = False
+    error: Optional[str] = None
+    value: Any = Field(default=None, exclude=True)
+
+    def __str__(self) -> str:
+        return self.model_dump_json(indent=4)
+
+
+class BatchResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    results: Dict[str, BatchItemResult]
+
+    @staticmethod
+    def empty() -> "BatchResult":
+        return BatchResult(results={})
+
+    def add(
+        self, item: str, success: bool, error: Optional[str] = None, value: Any = None
+    ) -> None:
+        self.results[item] = BatchItemResult(
+            item=item, success=success, error=error, value=value
+        )
+
+    def skip(self, item: str, reason: str) -> None:
+        self.results[item] = BatchItemResult(
+            item=item, success=False, skipped=True, error=reason
+        )
+
+    @property
+    def succeeded(self) -> List[str]:
+        return [item for item, result in self.results.items() if result.success]
+
+    @property
+    def failed(self) -> Dict[str, str | None]:
+        return {
+            item: result.error
+            for item, result in self.results.items()
+            if not result.success and not result.skipped
+        }
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        """Values returned for the succeeded items, e.g. TorrentDetails."""
+        return {
+            item: result.value
+            for item, result in self.results.items()
+            if result.success
+        }
+
+    @property
+    def skipped(self) -> List[str]:
+        return [item for item, result in self.results.items() if result.skipped]
+
+    def __str__(self) -> str:
+        return self.model_dump_json(indent=4)
@@ -1,14 +1,14 @@
 from datetime import datetime
 from typing import List
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from sonicbit.base import SonicBitBase
 from sonicbit.models.path_info import PathInfo
 
 
 class File(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     client: SonicBitBase = Field(exclude=True)
     name: str
@@ -22,11 +22,11 @@ class File(BaseModel):
     date_modified: datetime
     is_directory: bool
     is_remote_drive_dir: bool
-    raw: dict = Field(exclude=True)
+    _raw: dict = PrivateAttr()
 
     @staticmethod
     def from_dict(client: SonicBitBase, data: dict) -> "File":
-        return File(
+        file = File(
             client=client,
             name=data["name"],
             size=data["size"],
@@ -39,8 +39,15 @@ class File(BaseModel):
             date_modified=datetime.fromtimestamp(data["dateModifiedTS"]),
             is_directory=data["isDirectory"],
             is_remote_drive_dir=data["isRemoteDriveDir"],
-            raw=data,
         )
+        # The path segments live in path_info; keeping them here as well
+        # would hold a copy of every directory above every file.
+        file._raw = {k: v for k, v in data.items() if k != "data_drive_path"}
+        return file
+
+    @property
+    def raw(self) -> dict:
+        return {**self._raw, "data_drive_path": self.path_info.raw}
 
     def __str__(self) -> str:
         return self.model_dump_json(indent=4)
@@ -10,7 +10,7 @@ from sonicbit.models.file import File
 
 
 class FileList(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     client: SonicBitBase = Field(exclude=True)
     items: List[File]
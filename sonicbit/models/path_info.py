@@ -1,9 +1,13 @@
-from typing import List
+import threading
+import weakref
+from typing import Iterable, List, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 
 
 class PathInfoItem(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     key: str
     name: str
 
@@ -11,36 +15,133 @@ class PathInfoItem(BaseModel):
         return self.model_dump_json(indent=4)
 
 
+class _PathNode:
+    """A segment in the trie of every path seen, linked to its parent.
+
+    Each distinct path prefix exists once, however many files sit below
+    it. Children are held weakly, so segments no longer referenced by any
+    ``PathInfo`` are released.
+    """
+
+    __slots__ = ("parent", "key", "name", "depth", "children", "__weakref__")
+
+    _lock = threading.Lock()
+
+    def __init__(self, parent: "_PathNode | None", key: str, name: str):
+        self.parent = parent
+        self.key = key
+        self.name = name
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.children: weakref.WeakValueDictionary | None = None
+
+    def child(self, key: str, name: str) -> "_PathNode":
+        children = self.children
+        if children is not None and (node := children.get((key, name))) is not None:
+            return node
+        with self._lock:
+            if self.children is None:
+                self.children = weakref.WeakValueDictionary()
+            node = self.children.get((key, name))
+            if node is None:
+                node = self.children[(key, name)] = _PathNode(self, key, name)
+            return node
+
+    def __copy__(self) -> "_PathNode":
+        return self
+
+    def __deepcopy__(self, memo) -> "_PathNode":
+        # Nodes are immutable and shared; copying one would also copy every
+        # ancestor and detach it from the trie.
+        return self
+
+    def segments(self) -> List["_PathNode"]:
+        nodes = []
+        node = self
+        while node.parent is not None:
+            nodes.append(node)
+            node = node.parent
+        nodes.reverse()
+        return nodes
+
+    @classmethod
+    def intern(cls, items: Iterable[Tuple[str, str]]) -> "_PathNode":
+        node = _ROOT
+        for key, name in items:
+            node = node.child(key, name)
+        return node
+
+
+_ROOT = _PathNode(None, "", "")
+
+
 class PathInfo(BaseModel):
-    paths: List[PathInfoItem]
-    raw: List[dict] = Field(exclude=True)
+    """A drive path as the list of ``{"key", "name"}`` segments the API uses.
+
+    The segments are interned in a shared trie and a ``PathInfo`` only
+    references its last one, so the files of a large listing share their
+    directory prefixes. ``paths``, ``raw`` and ``serialized`` are built on
+    access.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
+
+    node: _PathNode = Field(default=_ROOT, exclude=True, repr=False)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _intern_paths(cls, data):
+        if isinstance(data, dict) and "node" not in data:
+            items = data.get("paths", data.get("raw")) or []
+            return {
+                "node": _PathNode.intern(
+                    (item.key, item.name)
+                    if isinstance(item, PathInfoItem)
+                    else (item["key"], item["name"])
+                    for item in items
+                )
+            }
+        return data
 
     @staticmethod
     def from_list(data: List[dict]) -> "PathInfo":
-        paths = [PathInfoItem(**item) for item in data]
-        return PathInfo(paths=paths, raw=data)
+        node = _PathNode.intern((item["key"], item["name"]) for item in data)
+        return PathInfo.model_construct(node=node)
 
     @staticmethod
     def from_path_key(path_key: str) -> "PathInfo":
         name = path_key.split("/")[-1]
-        return PathInfo(
-            paths=[PathInfoItem(key=path_key, name=name)],
-            raw=[{"key": path_key, "name": name}],
-        )
+        return PathInfo.model_construct(node=_ROOT.child(path_key, name))
+
+    def __reduce__(self):
+        # Nodes belong to this process's trie; pickle the segments and
+        # intern them again on load.
+        return PathInfo.from_list, (self.raw,)
 
     def __str__(self):
         return self.model_dump_json(indent=4)
 
+    @computed_field
+    @property
+    def paths(self) -> List[PathInfoItem]:
+        return [
+            PathInfoItem.model_construct(key=node.key, name=node.name)
+            for node in self.node.segments()
+        ]
+
+    @property
+    def raw(self) -> List[dict]:
+        return [{"key": node.key, "name": node.name} for node in self.node.segments()]
+
     @property
     def serialized(self):
         return self.raw
 
     @property
     def path(self):
-        if len(self.paths) == 0:
+        if self.node.parent is None:
             return "/"
-        return f"/{self.paths[-1].key}"
+        return f"/{self.node.key}"
 
     @staticmethod
     def root() -> "PathInfo":
-        return PathInfo(paths=[], raw=[])
+        return PathInfo.model_construct(node=_ROOT)
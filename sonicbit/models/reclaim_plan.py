@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from sonicbit.models.path_info import PathInfo
+
+
+class ReclaimItem(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    kind: str  # "torrent" or "file"
+    key: str  # infohash for torrents, path for files
+    name: str
+    size: int
+    date: datetime
+    path_info: Optional[PathInfo] = None
+
+    def __str__(self) -> str:
+        return self.model_dump_json(indent=4)
+
+
+class ReclaimPlan(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    policy: str
+    target_bytes: int
+    freed_bytes: int
+    items: List[ReclaimItem]
+
+    @property
+    def satisfied(self) -> bool:
+        return self.freed_bytes >= self.target_bytes
+
+    @property
+    def torrent_hashes(self) -> List[str]:
+        return [item.key for item in self.items if item.kind == "torrent"]
+
+    @property
+    def files(self) -> List[ReclaimItem]:
+        return [item for item in self.items if item.kind == "file"]
+
+    def __str__(self) -> str:
+        return self.model_dump_json(indent=4)
@@ -8,7 +8,7 @@ from sonicbit.models.path_info import PathInfo
 
 
 class RemoteTask(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     client: SonicBitBase = Field(exclude=True)
     id: int
@@ -1,5 +1,7 @@
 from datetime import datetime
+from functools import cached_property
 from json import JSONDecodeError
+from typing import Dict
 
 from httpx import Response
 from pydantic import BaseModel, ConfigDict, Field
@@ -12,7 +14,7 @@ from .remote_task import RemoteTask
 
 
 class RemoteTaskList(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     client: SonicBitBase = Field(exclude=True)
     tasks: list[RemoteTask]
@@ -59,5 +61,13 @@ class RemoteTaskList(BaseModel):
             raw=json_data,
         )
 
+    @cached_property
+    def by_url(self) -> Dict[str, RemoteTask]:
+        return {task.url: task for task in self.tasks}
+
+    @cached_property
+    def by_md5(self) -> Dict[str, RemoteTask]:
+        return {task.md5: task for task in self.tasks}
+
     def __str__(self) -> str:
         return self.model_dump_json(indent=4)
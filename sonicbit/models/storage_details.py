@@ -1,12 +1,14 @@
 from json import JSONDecodeError
 
 from httpx import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from sonicbit.errors import InvalidResponseError, SonicBitError
 
 
 class StorageDetails(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     size_byte_total: int
     size_byte_limit: int
     set_storage_left: int
@@ -8,7 +8,7 @@ from sonicbit.models.torrent.torrent_file import TorrentFile
 
 
 class Torrent(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     client: SonicBitBase = Field(exclude=True)
     name: str
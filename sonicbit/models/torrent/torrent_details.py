@@ -2,13 +2,15 @@ from json import JSONDecodeError
 from typing import List
 
 from httpx import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from sonicbit.errors import InvalidResponseError, SonicBitError
 from sonicbit.models.torrent.torrent_file import TorrentFile
 
 
 class TorrentDetails(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     files: List[TorrentFile]
     raw: list = Field(exclude=True)
 
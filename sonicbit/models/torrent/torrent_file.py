@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TorrentFile(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     size: int
     torrent_path: str
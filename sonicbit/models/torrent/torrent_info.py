@@ -1,9 +1,11 @@
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TorrentInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     download_rate: float
     upload_rate: float
     size_byte_total: int
@@ -12,7 +12,7 @@ from sonicbit.models.torrent.torrent_info import TorrentInfo
 
 
 class TorrentList(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     client: SonicBitBase = Field(exclude=True)
     torrents: Dict[str, Torrent]
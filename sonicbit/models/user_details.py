@@ -3,13 +3,15 @@ from json import JSONDecodeError
 from typing import List, Optional
 
 from httpx import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from sonicbit.errors import InvalidResponseError, SonicBitError
 from sonicbit.models.app import App
 
 
 class UserDetails(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: int
     name: str
     email: str
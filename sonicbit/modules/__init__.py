@@ -1,9 +1,35 @@
-from .auth import Auth
-from .file import File
-from .remote_download import RemoteDownload
-from .signup import Signup
-from .torrent import Torrent
-from .user import User
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_LAZY_EXPORTS = {
+    "Auth": ".auth",
+    "File": ".file",
+    "RemoteDownload": ".remote_download",
+    "Torrent": ".torrent",
+    "User": ".user",
+    "Signup": ".signup",
+}
+
+if TYPE_CHECKING:
+    from .auth import Auth
+    from .file import File
+    from .remote_download import RemoteDownload
+    from .signup import Signup
+    from .torrent import Torrent
+    from .user import User
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "Auth",
@@ -1,9 +1,14 @@
 import logging
 import threading
+from typing import List
 
+import httpx
+
+from sonicbit import profiling
 from sonicbit.base import SonicBitBase
 from sonicbit.constants import Constants
 from sonicbit.handlers.token_handler import TokenHandler
+from sonicbit.hooks import RequestHook
 from sonicbit.models import AuthResponse
 
 logger = logging.getLogger(__name__)
@@ -16,20 +21,29 @@ class Auth(SonicBitBase):
         password: str,
         token: str | None,
         token_handler: TokenHandler,
+        hooks: List[RequestHook] | None = None,
+        transport: httpx.BaseTransport | None = None,
+        limits: httpx.Limits | None = None,
+        lazy_session: bool = False,
     ):
-        super().__init__()
+        super().__init__(hooks, transport, limits)
         self._refresh_lock = threading.Lock()  # prevents concurrent token refreshes
         logger.debug("Initializing auth for email=%s", email)
         self._email = email
         self._password = password
         self._token_handler = token_handler
+        self._token: str | None = None
+        self._web_session = False
         self.session.headers.update(Constants.API_HEADERS)
 
         if not token:
             token = self._get_token()
 
-        self.session.headers.update({"Authorization": f"Bearer {token}"})
-        self._authenticate_session()
+        self._token = token
+        # A fresh login already authenticated the web session. With
+        # lazy_session it is deferred to the first file manager request.
+        if not self._web_session and not lazy_session:
+            self._authenticate_session()
 
     def _get_token(self) -> str:
         logger.debug("Retrieving token for email=%s", self._email)
@@ -42,10 +56,10 @@ class Auth(SonicBitBase):
 
     def _refresh_token(self) -> str:
         logger.debug("Refreshing token for email=%s", self._email)
-        auth = self.login(self._email, self._password)
+        auth = self._login()
         self._token_handler.write(self._email, auth)
         token = auth.token
-        self.session.headers.update({"Authorization": f"Bearer {token}"})
+        self._token = token
         self._authenticate_session()
         return token
 
@@ -55,9 +69,13 @@ class Auth(SonicBitBase):
         by endpoints like /api/file-manager that rely on the cookie rather
         than the Bearer token alone."""
         logger.debug("Authenticating web session for email=%s", self._email)
-        response = self.session.post(
-            self.url("/web/login"),
+        self._web_session = True
+        response = SonicBitBase._request(
+            self,
+            method="POST",
+            url=self.url("/web/login"),
             json={"email": self._email, "password": self._password},
+            headers=self._auth_headers(),
         )
         if response.status_code != 200:
             logger.warning(
@@ -67,14 +85,67 @@ class Auth(SonicBitBase):
                 response.reason_phrase,
             )
 
+    def _login(self) -> AuthResponse:
+        """Same as ``login`` but sent through this client's session, so a
+        custom transport also handles token refreshes."""
+        logger.info("Logging in as email=%s", self._email)
+        response = SonicBitBase._request(
+            self,
+            method="POST",
+            url=self.url("/web/login"),
+            json={"email": self._email, "password": self._password},
+        )
+
+        return AuthResponse.from_response(response)
+
+    def _auth_headers(self, headers: dict | None = None) -> dict:
+        """Return request headers carrying the current token.
+
+        The token is attached per request rather than stored in the shared
+        session headers, so a refresh never mutates state that requests on
+        other threads are reading.
+        """
+        headers = dict(headers or {})
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
+        return headers
+
     def _request(self, *args, **kwargs):
-        response = super()._request(*args, **kwargs)
+        # Opened here so the refreshes below count towards the call.
+        with profiling.call(self.endpoint(kwargs["url"])):
+            return self._request_with_refresh(*args, **kwargs)
+
+    def _request_with_refresh(self, *args, **kwargs):
+        if not self._web_session and self.endpoint(kwargs["url"]).startswith(
+            "/file-manager"
+        ):
+            with profiling.phase("auth", exclusive=True), self._refresh_lock:
+                if not self._web_session:
+                    self._authenticate_session()
 
-        if response.status_code == 401:
-            with self._refresh_lock:
-                logger.debug("Received 401, refreshing token for email=%s", self._email)
-                self._refresh_token()
-                response = super()._request(*args, **kwargs)
+        token = self._token
+        headers = kwargs.pop("headers", None)
+        response = super()._request(
+            *args, headers=self._auth_headers(headers), **kwargs
+        )
+
+        for _ in range(self.MAX_TOKEN_REFRESHES):
+            if response.status_code != 401:
+                break
+            response.close()  # release the connection of a streamed response
+            with profiling.phase("auth", exclusive=True), self._refresh_lock:
+                # Threads that failed with the same token refresh it once;
+                # the rest retry with the token the first one fetched.
+                if self._token == token:
+                    logger.debug(
+                        "Received 401, refreshing token for email=%s", self._email
+                    )
+                    self._emit("on_token_refresh", self.endpoint(kwargs.get("url", "")))
+                    self._refresh_token()
+                token = self._token
+            response = super()._request(
+                *args, headers=self._auth_headers(headers), **kwargs
+            )
 
         return response
 
@@ -1,12 +1,15 @@
 import json
 import logging
+from collections import defaultdict
 from json import JSONDecodeError
+from typing import Dict, Iterator, List, Set, Tuple
 
 from sonicbit.base import SonicBitBase
 from sonicbit.enums import FileCommand
 from sonicbit.errors import InvalidResponseError
+from sonicbit.models import BatchResult, FileList, PathInfo
 from sonicbit.models import File as FileType
-from sonicbit.models import FileList, PathInfo
+from sonicbit.utils import iter_json_array, run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +23,36 @@ class File(SonicBitBase):
         }
 
         response = self._request(
-            method="GET", url=self.url("/file-manager"), params=params
+            method="GET", url=self.url("/file-manager"), params=params, hedge=True
         )
-        return FileList.from_response(self, response)
+        with self._parse_timer("/file-manager", response):
+            return FileList.from_response(self, response)
+
+    def iter_files(self, path: PathInfo = PathInfo.root()) -> Iterator[FileType]:
+        """Stream a directory listing, yielding each File as it is parsed.
+
+        Unlike ``list_files`` the response body is never held in memory as a
+        whole, so huge directories can be processed with bounded memory.
+        """
+        logger.debug("Streaming files path=%s", path.path)
+        params = {
+            "arguments": json.dumps({"pathInfo": path.serialized}),
+            "command": FileCommand.GET_DIR_CONTENTS,
+        }
+
+        response = self._request(
+            method="GET", url=self.url("/file-manager"), params=params, stream=True
+        )
+        try:
+            for data in iter_json_array(response.iter_bytes(), "result"):
+                yield FileType.from_dict(self, data)
+        except JSONDecodeError as error:
+            raise InvalidResponseError(
+                f"Server returned invalid JSON data: {response.status_code} "
+                f"{response.reason_phrase} {error}"
+            ) from None
+        finally:
+            response.close()
 
     def delete_file(
         self, file: FileType | PathInfo, is_directory: bool = False
@@ -46,3 +76,99 @@ class File(SonicBitBase):
         except JSONDecodeError:
             raise InvalidResponseError.from_response(response) from None
         return json_data.get("success", False)
+
+    def walk(
+        self, path: PathInfo = PathInfo.root(), concurrency: int | None = None
+    ) -> Iterator[FileType]:
+        """Yield every file and directory below ``path``, parents first.
+
+        The directories of each level of the tree are listed concurrently.
+        """
+        level = [path]
+        while level:
+            directories = []
+            for _, file_list, error in run_concurrently(
+                self.list_files, level, concurrency or self.BATCH_CONCURRENCY
+            ):
+                if error is not None:
+                    raise error
+                for item in file_list.items:
+                    yield item
+                    if item.is_directory:
+                        directories.append(item.path_info)
+            level = directories
+
+    def delete_files(
+        self, items: List[FileType | PathInfo], concurrency: int | None = None
+    ) -> BatchResult:
+        """Delete many files and directories concurrently, keyed by path.
+
+        ``PathInfo`` items are deleted as files; pass ``File`` objects for
+        directories. Deeper paths are deleted before their parents.
+        """
+        targets = {}
+        for item in items:
+            if isinstance(item, FileType):
+                targets[item.path_info.path] = (item.path_info, item.is_directory)
+            else:
+                targets[item.path] = (item, False)
+        return self._delete_paths(targets, concurrency)
+
+    def delete_tree(
+        self, directory: FileType | PathInfo, concurrency: int | None = None
+    ) -> BatchResult:
+        """Delete a directory and everything below it, children first."""
+        if isinstance(directory, FileType):
+            if not directory.is_directory:
+                return self.delete_files([directory], concurrency)
+            directory = directory.path_info
+
+        targets = {
+            item.path_info.path: (item.path_info, item.is_directory)
+            for item in self.walk(directory, concurrency)
+        }
+        if directory.paths:  # never delete the root itself
+            targets[directory.path] = (directory, True)
+        return self._delete_paths(targets, concurrency)
+
+    def _delete_paths(
+        self, targets: Dict[str, Tuple[PathInfo, bool]], concurrency: int | None
+    ) -> BatchResult:
+        """Delete paths level by level, deepest first.
+
+        A directory is only deleted once every requested path below it was
+        deleted; otherwise it fails as well, so nothing is removed implicitly.
+        """
+        logger.debug("Deleting %d files in bulk", len(targets))
+        levels: Dict[int, List[str]] = defaultdict(list)
+        for key in targets:
+            levels[key.rstrip("/").count("/")].append(key)
+
+        result = BatchResult.empty()
+        blocked: Set[str] = set()  # ancestors of paths that were not deleted
+
+        def block(key: str) -> None:
+            while (key := key.rpartition("/")[0]) and key not in blocked:
+                blocked.add(key)
+
+        for depth in sorted(levels, reverse=True):
+            pending = []
+            for key in levels[depth]:
+                if key in blocked:
+                    result.add(key, False, "A path below it was not deleted")
+                    block(key)
+                else:
+                    pending.append(key)
+
+            for key, deleted, error in run_concurrently(
+                lambda key: self.delete_file(*targets[key]),
+                pending,
+                concurrency or self.BATCH_CONCURRENCY,
+            ):
+                if error is None and deleted:
+                    result.add(key, True)
+                    continue
+                result.add(key, False, str(error) if error else "File was not deleted")
+                block(key)
+
+        return result
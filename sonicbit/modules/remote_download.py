@@ -1,15 +1,19 @@
 import logging
+from typing import List, Set
 
 from sonicbit.base import SonicBitBase
 from sonicbit.enums import RemoteDownloadCommand
 from sonicbit.errors import SonicBitError
-from sonicbit.models import RemoteTaskList
+from sonicbit.models import BatchResult, RemoteTaskList
 from sonicbit.models.path_info import PathInfo
+from sonicbit.utils import run_concurrently
 
 logger = logging.getLogger(__name__)
 
 
 class RemoteDownload(SonicBitBase):
+    _known_remote_urls: Set[str] | None = None
+
     def add_remote_download(self, url: str, path: PathInfo) -> bool:
         logger.debug("Adding remote download url=%s path=%s", url, path.path)
 
@@ -24,8 +28,54 @@ class RemoteDownload(SonicBitBase):
                 f"Failed to add remote download: {json_data.get('msg')}"
             )
 
+        if self._known_remote_urls is not None:
+            self._known_remote_urls.add(url)
+
         return True
 
+    def add_remote_downloads(
+        self,
+        urls: List[str],
+        path: PathInfo = PathInfo.root(),
+        concurrency: int | None = None,
+        skip_existing: bool = False,
+    ) -> BatchResult:
+        """Add many remote downloads concurrently.
+
+        With ``skip_existing`` URLs that already have a task on the account
+        are reported as skipped without being sent.
+        """
+        result = BatchResult.empty()
+        urls = list(dict.fromkeys(urls))
+        if skip_existing:
+            known = self.known_remote_urls()
+            for url in urls:
+                if url in known:
+                    result.skip(url, "Remote download already exists")
+            urls = [url for url in urls if url not in known]
+        logger.debug("Adding %d remote downloads path=%s", len(urls), path.path)
+
+        for url, _, error in run_concurrently(
+            lambda url: self.add_remote_download(url, path),
+            urls,
+            concurrency or self.BATCH_CONCURRENCY,
+        ):
+            result.add(url, error is None, None if error is None else str(error))
+
+        return result
+
+    def known_remote_urls(self, refresh: bool = False) -> Set[str]:
+        """Return the URLs of the remote download tasks on the account.
+
+        The set is cached from the last ``list_remote_downloads`` call; pass
+        ``refresh`` to re-fetch it.
+        """
+        cached = not refresh and self._known_remote_urls is not None
+        self._emit("on_cache", "remote_urls", cached)
+        if not cached:
+            self.list_remote_downloads()
+        return self._known_remote_urls
+
     def list_remote_downloads(self) -> RemoteTaskList:
         logger.debug("Listing all remote downloads")
 
@@ -35,7 +85,10 @@ class RemoteDownload(SonicBitBase):
             params={"action": RemoteDownloadCommand.LIST_REMOTE_DOWNLOADS},
         )
 
-        return RemoteTaskList.from_response(self, response)
+        with self._parse_timer("/remote_download/task/list", response):
+            task_list = RemoteTaskList.from_response(self, response)
+        self._known_remote_urls = set(task_list.by_url)
+        return task_list
 
     def delete_remote_download(self, id: int) -> bool:
         logger.debug("Deleting remote download id=%s", id)
@@ -51,4 +104,23 @@ class RemoteDownload(SonicBitBase):
                 f"Failed to delete remote download: {json_data.get('msg')}"
             )
 
+        # Only the id is known here, so re-fetch the URLs on the next lookup.
+        self._known_remote_urls = None
+
         return True
+
+    def delete_remote_downloads(
+        self, ids: List[int], concurrency: int | None = None
+    ) -> BatchResult:
+        """Delete many remote downloads concurrently, keyed by task id."""
+        logger.debug("Deleting %d remote downloads", len(ids))
+
+        result = BatchResult.empty()
+        for id, _, error in run_concurrently(
+            self.delete_remote_download,
+            list(dict.fromkeys(ids)),
+            concurrency or self.BATCH_CONCURRENCY,
+        ):
+            result.add(str(id), error is None, None if error is None else str(error))
+
+        return result
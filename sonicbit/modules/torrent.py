@@ -1,22 +1,37 @@
 import logging
 import os.path
+import stat
+import threading
 from json import JSONDecodeError
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 
 from sonicbit.base import SonicBitBase
 from sonicbit.enums import TorrentCommand
 from sonicbit.errors import InvalidResponseError, SonicBitError
-from sonicbit.models import PathInfo, TorrentDetails, TorrentList
+from sonicbit.models import BatchResult, PathInfo, TorrentDetails, TorrentList
+from sonicbit.utils import (
+    chunked,
+    magnet_infohash,
+    run_concurrently,
+    torrent_infohash,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class Torrent(SonicBitBase):
+    _known_hashes: Set[str] | None = None
+    # Upper-case hash -> (progress, status) as of the last list_torrents call,
+    # and the details fetched while the torrent was in that state.
+    _torrent_states: Dict[str, tuple] | None = None
+    _details_cache: Dict[str, Tuple[tuple, TorrentDetails]] | None = None
+
     def add_torrent(
         self,
         uri: str | List[str],
         path: PathInfo = PathInfo.root(),
         auto_start: bool = True,
+        skip_existing: bool = False,
     ) -> List[str]:
         logger.debug(
             "Adding torrent uri=%s path=%s auto_start=%s", uri, path.path, auto_start
@@ -25,6 +40,79 @@ class Torrent(SonicBitBase):
         if isinstance(uri, str):
             uri = [uri]
 
+        if skip_existing:
+            uri = [item for item in uri if not self._is_known_uri(item)]
+            if not uri:
+                logger.debug("All torrents already exist, skipping add")
+                return []
+
+        json_data = self._post_add_torrent(uri, path, auto_start)
+
+        added_torrents = []
+        for index in json_data["added"]:
+            added_torrents.append(uri[index])
+        self._remember_uris(added_torrents)
+
+        if len(added_torrents) == 0 and not bool(json_data["success"]):
+            raise SonicBitError(f"Failed to add torrent: {json_data}")
+
+        return added_torrents
+
+    def add_torrents(
+        self,
+        uris: List[str],
+        path: PathInfo = PathInfo.root(),
+        auto_start: bool = True,
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+        skip_existing: bool = False,
+    ) -> BatchResult:
+        """Add many torrents, split into chunks that are sent concurrently.
+
+        A failing chunk only fails its own items; the result reports every
+        URI individually. With ``skip_existing`` magnets whose infohash is
+        already on the account are reported as skipped without being sent.
+        """
+        result = BatchResult.empty()
+        uris = list(dict.fromkeys(uris))
+        if skip_existing:
+            pending = []
+            for uri in uris:
+                if self._is_known_uri(uri):
+                    result.skip(uri, "Torrent already exists")
+                else:
+                    pending.append(uri)
+            uris = pending
+
+        chunks = chunked(
+            uris,
+            chunk_size or self.BATCH_MAX_ITEMS,
+            self.BATCH_MAX_QUERY_LENGTH,
+            "url_list[]",
+        )
+        logger.debug("Adding %d torrents in bulk path=%s", len(uris), path.path)
+
+        for chunk, json_data, error in run_concurrently(
+            lambda chunk: self._post_add_torrent(chunk, path, auto_start),
+            chunks,
+            concurrency or self.BATCH_CONCURRENCY,
+        ):
+            if error is not None:
+                for item in chunk:
+                    result.add(item, False, str(error))
+                continue
+
+            added = set(json_data.get("added") or [])
+            message = json_data.get("msg") or "Torrent was not added"
+            for index, item in enumerate(chunk):
+                result.add(item, index in added, None if index in added else message)
+            self._remember_uris(chunk[index] for index in added)
+
+        return result
+
+    def _post_add_torrent(
+        self, uri: List[str], path: PathInfo, auto_start: bool
+    ) -> dict:
         params = {
             "command": TorrentCommand.ADD_TORRENT_URL,
             "url_list[]": uri,
@@ -37,26 +125,18 @@ class Torrent(SonicBitBase):
             method="POST", url=self.url("/app/seedbox/torrent/add"), params=params
         )
         try:
-            json_data = response.json()
+            return response.json()
         except JSONDecodeError:
             raise InvalidResponseError(
                 f"Server returned invalid JSON data: {response.text}"
             ) from None
 
-        added_torrents = []
-        for index in json_data["added"]:
-            added_torrents.append(uri[index])
-
-        if len(added_torrents) == 0 and not bool(json_data["success"]):
-            raise SonicBitError(f"Failed to add torrent: {json_data}")
-
-        return added_torrents
-
     def add_torrent_file(
         self,
         local_path: str,
         path: PathInfo = PathInfo.root(),
         auto_start: bool = True,
+        skip_existing: bool = False,
     ) -> bool:
         logger.debug(
             "Uploading torrent file=%s path=%s auto_start=%s",
@@ -66,17 +146,34 @@ class Torrent(SonicBitBase):
         )
 
         file_name = os.path.basename(local_path)
-        if not os.path.isfile(local_path):
-            raise SonicBitError(
-                f"Failed to upload local torrent file: '{local_path}'. File does NOT exist"
-            )
+        error_message = (
+            f"Failed to upload local torrent file: '{local_path}'. File does NOT exist"
+        )
+        try:
+            torrent_file = open(local_path, "rb")
+        except OSError:
+            raise SonicBitError(error_message) from None
+
+        with torrent_file:
+            file_stat = os.fstat(torrent_file.fileno())
+            if not stat.S_ISREG(file_stat.st_mode):
+                raise SonicBitError(error_message)
+
+            content = torrent_file
+            info_hash = None
+            if skip_existing:
+                content = torrent_file.read()
+                info_hash = torrent_infohash(content)
+                if self._is_known_hash(info_hash):
+                    logger.debug("Torrent file=%s already exists, skipping", local_path)
+                    return False
 
-        with open(local_path, "rb") as torrent_file:
+            # httpx streams the multipart body from the open file in chunks.
             post_data = {
                 "command": (None, TorrentCommand.UPLOAD_TORRENT_FILE),
-                "file": (file_name, torrent_file, "application/octet-stream"),
+                "file": (file_name, content, "application/octet-stream"),
                 "name": (None, file_name),
-                "size": (None, str(os.stat(local_path).st_size)),
+                "size": (None, str(file_stat.st_size)),
                 "auto_start": (None, "1" if auto_start else "0"),
                 "path": (None, path.path),
             }
@@ -96,28 +193,227 @@ class Torrent(SonicBitBase):
             raise SonicBitError("Failed to add torrent: {}".format(json_data["msg"]))
 
         logger.debug(f"Torrent file uploaded successfully: {json_data}")
+        if info_hash is not None:
+            self._remember_hashes([info_hash])
+        else:
+            self._known_hashes = None  # hash unknown, re-fetch on next lookup
 
         return True
 
+    def add_torrent_files(
+        self,
+        local_paths: List[str],
+        path: PathInfo = PathInfo.root(),
+        auto_start: bool = True,
+        concurrency: int | None = None,
+        skip_existing: bool = False,
+    ) -> BatchResult:
+        """Upload many local .torrent files concurrently.
+
+        Each file is uploaded in its own request, so one unreadable or
+        rejected file only fails its own entry in the result.
+        """
+        local_paths = list(dict.fromkeys(local_paths))
+        logger.debug("Uploading %d torrent files path=%s", len(local_paths), path.path)
+        if skip_existing:
+            self.known_torrent_hashes()
+
+        result = BatchResult.empty()
+        for local_path, uploaded, error in run_concurrently(
+            lambda local_path: self.add_torrent_file(
+                local_path, path, auto_start, skip_existing
+            ),
+            local_paths,
+            concurrency or self.BATCH_CONCURRENCY,
+        ):
+            if error is not None:
+                result.add(local_path, False, str(error))
+            elif uploaded:
+                result.add(local_path, True)
+            else:
+                result.skip(local_path, "Torrent already exists")
+
+        return result
+
+    def watch_torrent_directory(
+        self,
+        directory: str,
+        path: PathInfo = PathInfo.root(),
+        auto_start: bool = True,
+        poll_interval: float = 5.0,
+        batch_size: int = 100,
+        concurrency: int | None = None,
+        skip_existing: bool = False,
+        stop_event: threading.Event | None = None,
+    ) -> Iterator[BatchResult]:
+        """Upload .torrent files as they appear in a directory.
+
+        The directory is polled every ``poll_interval`` seconds. A file is
+        picked up once its size is unchanged between two polls, so partially
+        written files are not uploaded, and is uploaded again only if it is
+        modified. Failed uploads are retried on the next poll. Yields one
+        BatchResult per batch until ``stop_event`` is set.
+        """
+        stop_event = stop_event or threading.Event()
+        seen: Dict[str, Tuple[int, int]] = {}
+        pending: Dict[str, Tuple[int, int]] = {}
+
+        while not stop_event.is_set():
+            ready = []
+            current = {}
+            listed = set()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".torrent") or not entry.is_file():
+                        continue
+                    listed.add(entry.path)
+                    entry_stat = entry.stat()
+                    signature = (entry_stat.st_size, entry_stat.st_mtime_ns)
+                    if seen.get(entry.path) == signature:
+                        continue
+                    if pending.get(entry.path) == signature:
+                        ready.append(entry.path)
+                    current[entry.path] = signature
+            pending = current
+            # Forget removed files, so seen does not grow without bound.
+            seen = {local_path: seen[local_path] for local_path in listed & seen.keys()}
+
+            for start in range(0, len(ready), batch_size):
+                batch = ready[start : start + batch_size]
+                result = self.add_torrent_files(
+                    batch, path, auto_start, concurrency, skip_existing
+                )
+                for local_path in batch:
+                    if local_path not in result.failed:
+                        seen[local_path] = pending.pop(local_path)
+                yield result
+
+            stop_event.wait(poll_interval)
+
     def list_torrents(self) -> TorrentList:
         logger.debug("Listing all torrents")
 
         response = self._request(
-            method="POST", url=self.url("/app/seedbox/torrent/list")
+            method="POST", url=self.url("/app/seedbox/torrent/list"), hedge=True
+        )
+
+        with self._parse_timer("/app/seedbox/torrent/list", response):
+            torrent_list = TorrentList.from_response(self, response)
+        self._known_hashes = {h.upper() for h in torrent_list.info.hash_list} | {
+            torrent.hash.upper() for torrent in torrent_list.torrents.values()
+        }
+        self._torrent_states = states = {
+            torrent.hash.upper(): (torrent.progress, tuple(torrent.status))
+            for torrent in torrent_list.torrents.values()
+        }
+        if self._details_cache:
+            self._details_cache = {
+                key: entry
+                for key, entry in self._details_cache.items()
+                if states.get(key) == entry[0]
+            }
+        return torrent_list
+
+    def known_torrent_hashes(self, refresh: bool = False) -> Set[str]:
+        """Return the upper-case infohashes on the account.
+
+        The set is cached from the last ``list_torrents`` call and kept up to
+        date by the add and delete helpers; pass ``refresh`` to re-fetch it.
+        """
+        cached = not refresh and self._known_hashes is not None
+        self._emit("on_cache", "torrent_hashes", cached)
+        if not cached:
+            self.list_torrents()
+        return self._known_hashes
+
+    def _is_known_hash(self, info_hash: str) -> bool:
+        return info_hash.upper() in self.known_torrent_hashes()
+
+    def _is_known_uri(self, uri: str) -> bool:
+        info_hash = magnet_infohash(uri)
+        return info_hash is not None and self._is_known_hash(info_hash)
+
+    def _remember_hashes(self, hashes: Iterable[str]) -> None:
+        if self._known_hashes is not None:
+            self._known_hashes |= {h.upper() for h in hashes}
+
+    def _forget_hashes(self, hashes: Iterable[str]) -> None:
+        hashes = {h.upper() for h in hashes}
+        if self._known_hashes is not None:
+            self._known_hashes -= hashes
+        if self._details_cache:
+            for key in hashes:
+                self._details_cache.pop(key, None)
+
+    def _remember_uris(self, uris: Iterable[str]) -> None:
+        self._remember_hashes(
+            info_hash for uri in uris if (info_hash := magnet_infohash(uri))
         )
 
-        return TorrentList.from_response(self, response)
+    def get_torrent_details(self, hash: str, refresh: bool = False) -> TorrentDetails:
+        """Fetch the files of a torrent.
+
+        Details are cached per hash and reused for as long as ``list_torrents``
+        reports the same progress and status, so a completed torrent is only
+        fetched once. Torrents not seen by ``list_torrents`` are never cached.
+        """
+        key = hash.upper()
+        state = (self._torrent_states or {}).get(key)
+        entry = (self._details_cache or {}).get(key)
+        cached = (
+            not refresh
+            and state is not None
+            and entry is not None
+            and entry[0] == state
+        )
+        if state is not None:
+            self._emit("on_cache", "torrent_details", cached)
+        if cached:
+            return entry[1]
 
-    def get_torrent_details(self, hash: str) -> TorrentDetails:
         logger.debug("Fetching torrent details hash=%s", hash)
 
         response = self._request(
             method="POST",
             url=self.url("/app/seedbox/torrent/details"),
             params={"hash": hash},
+            hedge=True,
         )
 
-        return TorrentDetails.from_response(response)
+        with self._parse_timer("/app/seedbox/torrent/details", response):
+            details = TorrentDetails.from_response(response)
+
+        if state is not None:
+            if self._details_cache is None:
+                self._details_cache = {}
+            self._details_cache[key] = (state, details)
+        return details
+
+    def get_torrent_details_many(
+        self,
+        hashes: List[str],
+        concurrency: int | None = None,
+        refresh: bool = False,
+    ) -> BatchResult:
+        """Fetch the details of many torrents concurrently.
+
+        The TorrentDetails of each succeeded hash are in ``result.values``.
+        """
+        hashes = list(dict.fromkeys(hashes))
+        logger.debug("Fetching torrent details in bulk count=%d", len(hashes))
+
+        result = BatchResult.empty()
+        for _hash, details, error in run_concurrently(
+            lambda _hash: self.get_torrent_details(_hash, refresh),
+            hashes,
+            concurrency or self.BATCH_CONCURRENCY,
+        ):
+            if error is not None:
+                result.add(_hash, False, str(error))
+            else:
+                result.add(_hash, True, value=details)
+
+        return result
 
     def delete_torrent(
         self, _hash: str | List[str], with_file: bool = False
@@ -127,6 +423,58 @@ class Torrent(SonicBitBase):
         if isinstance(_hash, str):
             _hash = [_hash]
 
+        json_data = self._post_delete_torrent(_hash, with_file)
+
+        deleted_hash = []
+        for key, value in json_data.items():
+            if key in _hash:
+                if value:
+                    deleted_hash.append(key)
+
+        if len(deleted_hash) == 0:
+            raise SonicBitError("Failed to delete torrent")
+
+        self._forget_hashes(deleted_hash)
+
+        return deleted_hash
+
+    def delete_torrents(
+        self,
+        hashes: List[str],
+        with_file: bool = False,
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> BatchResult:
+        """Delete many torrents, split into chunks that are sent concurrently."""
+        hashes = list(dict.fromkeys(hashes))
+        chunks = chunked(
+            hashes,
+            chunk_size or self.BATCH_MAX_ITEMS,
+            self.BATCH_MAX_QUERY_LENGTH,
+            "hash_list[]",
+        )
+        logger.debug(
+            "Deleting %d torrents in bulk with_file=%s", len(hashes), with_file
+        )
+
+        result = BatchResult.empty()
+        for chunk, json_data, error in run_concurrently(
+            lambda chunk: self._post_delete_torrent(chunk, with_file),
+            chunks,
+            concurrency or self.BATCH_CONCURRENCY,
+        ):
+            for item in chunk:
+                if error is not None:
+                    result.add(item, False, str(error))
+                elif json_data.get(item):
+                    result.add(item, True)
+                else:
+                    result.add(item, False, "Torrent was not deleted")
+        self._forget_hashes(result.succeeded)
+
+        return result
+
+    def _post_delete_torrent(self, _hash: List[str], with_file: bool) -> dict:
         params = {
             "command": TorrentCommand.DELETE_TORRENT,
             "hash_list[]": _hash,
@@ -137,18 +485,14 @@ class Torrent(SonicBitBase):
         response = self._request(
             method="POST", url=self.url("/app/seedbox/torrent/delete"), params=params
         )
-        json_data = response.json()
+        try:
+            json_data = response.json()
+        except JSONDecodeError:
+            raise InvalidResponseError(
+                f"Server returned invalid JSON data: {response.text}"
+            ) from None
 
         if "message" in json_data:
             raise SonicBitError(f"Failed to delete torrent: {json_data['message']}")
 
-        deleted_hash = []
-        for key, value in json_data.items():
-            if key in hash:
-                if value:
-                    deleted_hash.append(key)
-
-        if len(deleted_hash) == 0:
-            raise SonicBitError("Failed to delete torrent")
-
-        return deleted_hash
+        return json_data
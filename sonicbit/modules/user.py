@@ -13,7 +13,8 @@ class User(SonicBitBase):
         logger.debug("Fetching user details")
         response = self._request(method="POST", url=self.url("/get/user/details"))
 
-        return UserDetails.from_response(response)
+        with self._parse_timer("/get/user/details", response):
+            return UserDetails.from_response(response)
 
     def get_storage_details(self) -> StorageDetails:
         logger.debug("Fetching storage details")
@@ -21,7 +22,8 @@ class User(SonicBitBase):
             method="POST", url=self.url("/get/user/storage_details")
         )
 
-        return StorageDetails.from_response(response)
+        with self._parse_timer("/get/user/storage_details", response):
+            return StorageDetails.from_response(response)
 
     def clear_storage(self) -> bool:
         logger.debug("Clearing all storage")
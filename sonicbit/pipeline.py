@@ -0,0 +1,304 @@
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Callable, Dict, List, NamedTuple, Set
+
+from sonicbit.client import SonicBit
+from sonicbit.errors import SonicBitError
+from sonicbit.models import BatchResult, TorrentFile
+from sonicbit.utils import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class _Job(NamedTuple):
+    hash: str  # upper-cased state key
+    name: str
+    files: List[TorrentFile]
+    torrent_hash: str  # as the server lists it, for requests
+
+
+class TransferPipeline:
+    """Download completed torrents, verify the files and delete the torrents.
+
+    Four stages are connected by bounded queues: ``detect`` polls
+    ``list_torrents`` for completed torrents, ``download`` fetches their
+    files into ``destination``, ``verify`` checks them and ``cleanup``
+    deletes the torrent. A full queue blocks the stage feeding it, so a slow
+    disk or link never lets work pile up in memory.
+
+    The stage each torrent has reached is written to ``state_path``
+    atomically after every transition. After a crash or restart torrents
+    resume at the stage they were in, and partial downloads resume with
+    HTTP range requests.
+
+    ``verify`` is called as ``verify(file, local_path)``; by default only
+    the size is compared.
+    """
+
+    DOWNLOAD = "download"
+    VERIFY = "verify"
+    CLEANUP = "cleanup"
+    DONE = "done"
+
+    def __init__(
+        self,
+        client: SonicBit,
+        destination: str,
+        state_path: str,
+        download_concurrency: int = 4,
+        verify_concurrency: int = 2,
+        cleanup_concurrency: int = 2,
+        queue_size: int = 16,
+        poll_interval: float = 30.0,
+        verify: Callable[[TorrentFile, str], bool] | None = None,
+        delete_with_file: bool = True,
+        chunk_size: int = 1 << 20,
+    ):
+        self.client = client
+        self.destination = os.path.abspath(destination)
+        self.state_path = state_path
+        self.poll_interval = poll_interval
+        self.verify = verify or self._verify_size
+        self.delete_with_file = delete_with_file
+        self.chunk_size = chunk_size
+        self.concurrency = {
+            self.DOWNLOAD: download_concurrency,
+            self.VERIFY: verify_concurrency,
+            self.CLEANUP: cleanup_concurrency,
+        }
+        self._queues: Dict[str, queue.Queue] = {
+            stage: queue.Queue(maxsize=queue_size) for stage in self.concurrency
+        }
+        self._lock = threading.Lock()
+        self._active: Set[str] = set()
+        self._result = BatchResult.empty()
+        self._state: Dict[str, dict] = self._load_state()
+
+    @property
+    def state(self) -> Dict[str, dict]:
+        with self._lock:
+            return {key: dict(value) for key, value in self._state.items()}
+
+    def run(self, stop_event: threading.Event | None = None) -> None:
+        """Poll for completed torrents until ``stop_event`` is set.
+
+        Torrents still queued when stopping are picked up on the next run.
+        """
+        stop_event = stop_event or threading.Event()
+        threads = self._start()
+        try:
+            while not stop_event.is_set():
+                self.detect(stop_event)
+                stop_event.wait(self.poll_interval)
+        finally:
+            self._stop(threads, drain=True)
+
+    def run_once(self) -> BatchResult:
+        """Process the torrents completed right now and wait for them.
+
+        Returns a result keyed by infohash; a torrent succeeds once deleted.
+        """
+        threads = self._start()
+        try:
+            self.detect()
+            for stage in self._queues:
+                self._queues[stage].join()
+        finally:
+            self._stop(threads, drain=False)
+        with self._lock:
+            result, self._result = self._result, BatchResult.empty()
+        return result
+
+    def detect(self, stop_event: threading.Event | None = None) -> int:
+        """Queue every completed torrent that is not being processed."""
+        torrents = self.client.list_torrents().torrents.values()
+        present = {torrent.hash.upper() for torrent in torrents}
+        with self._lock:
+            # Forget finished torrents once they have left the account.
+            for key in [k for k, v in self._state.items() if v["stage"] == self.DONE]:
+                if key not in present:
+                    del self._state[key]
+            ready = [
+                torrent
+                for torrent in torrents
+                if torrent.progress >= 100
+                and torrent.hash.upper() not in self._active
+                and self._state.get(torrent.hash.upper(), {}).get("stage") != self.DONE
+            ]
+            self._active.update(torrent.hash.upper() for torrent in ready)
+        if not ready:
+            return 0
+
+        details = self.client.get_torrent_details_many(
+            [torrent.hash for torrent in ready], self.concurrency[self.DOWNLOAD]
+        )
+        jobs = []
+        with self._lock:
+            for torrent in ready:
+                if torrent.hash in details.values:
+                    key = torrent.hash.upper()
+                    entry = self._state.setdefault(
+                        key, {"name": torrent.name, "stage": self.DOWNLOAD}
+                    )
+                    files = details.values[torrent.hash].files
+                    jobs.append(
+                        (entry["stage"], _Job(key, torrent.name, files, torrent.hash))
+                    )
+        self._save_state()
+        for torrent in ready:
+            if torrent.hash not in details.values:
+                self._fail(torrent.hash.upper(), details.failed.get(torrent.hash))
+
+        queued = 0
+        for stage, job in jobs:
+            if self._put(stage, job, stop_event):
+                queued += 1
+            else:
+                with self._lock:
+                    self._active.discard(job.hash)
+        logger.debug("Queued %d completed torrents", queued)
+        return queued
+
+    def _start(self) -> List[threading.Thread]:
+        stages = list(self._queues)
+        threads = []
+        for index, stage in enumerate(stages):
+            following = stages[index + 1] if index + 1 < len(stages) else None
+            for _ in range(self.concurrency[stage]):
+                thread = threading.Thread(
+                    target=self._worker, args=(stage, following), name=stage
+                )
+                thread.start()
+                threads.append(thread)
+        return threads
+
+    def _stop(self, threads: List[threading.Thread], drain: bool) -> None:
+        # Stop the stages in order so every worker can hand on its job.
+        for stage, jobs in self._queues.items():
+            if drain:
+                while True:
+                    try:
+                        job = jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is not None:
+                        with self._lock:
+                            self._active.discard(job.hash)
+                    jobs.task_done()
+            for _ in range(self.concurrency[stage]):
+                jobs.put(None)
+            for thread in threads:
+                if thread.name == stage:
+                    thread.join()
+
+    def _worker(self, stage: str, following: str | None) -> None:
+        handler = getattr(self, f"_{stage}")
+        jobs = self._queues[stage]
+        while True:
+            job = jobs.get()
+            if job is None:
+                jobs.task_done()
+                return
+            try:
+                handler(job)
+            except Exception as error:
+                self._fail(job.hash, error)
+            else:
+                next_stage = following or self.DONE
+                with self._lock:
+                    self._state[job.hash]["stage"] = next_stage
+                    self._state[job.hash].pop("error", None)
+                self._save_state()
+                if following is not None:
+                    self._queues[following].put(job)
+                else:
+                    with self._lock:
+                        self._active.discard(job.hash)
+                        self._result.add(job.hash, True)
+            finally:
+                jobs.task_done()
+
+    def _put(self, stage: str, job: _Job, stop_event: threading.Event | None) -> bool:
+        while stop_event is None or not stop_event.is_set():
+            try:
+                self._queues[stage].put(job, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fail(self, key: str, error) -> None:
+        logger.warning("Transfer of torrent hash=%s failed: %s", key, error)
+        with self._lock:
+            self._active.discard(key)
+            self._result.add(key, False, str(error))
+            if key in self._state:
+                self._state[key]["error"] = str(error)
+        self._save_state()
+
+    def local_path(self, file: TorrentFile) -> str:
+        path = os.path.normpath(os.path.join(self.destination, file.torrent_path))
+        if os.path.commonpath([self.destination, path]) != self.destination:
+            raise SonicBitError(f"Refusing to write outside destination: {path}")
+        return path
+
+    def _download(self, job: _Job) -> None:
+        for file in job.files:
+            self._download_file(file)
+
+    def _download_file(self, file: TorrentFile) -> None:
+        path = self.local_path(file)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        offset = os.path.getsize(path) if os.path.exists(path) else 0
+        if offset == file.size:
+            return
+        if offset > file.size:
+            offset = 0
+
+        logger.debug("Downloading file=%s offset=%d", file.torrent_path, offset)
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with self.client.download_session.stream(
+            "GET", file.download_url, headers=headers
+        ) as response:
+            if response.status_code not in (200, 206):
+                raise SonicBitError(
+                    f"Download of {file.torrent_path} failed: "
+                    f"{response.status_code} {response.reason_phrase}"
+                )
+            # A server that ignores the range sends the whole file again.
+            mode = "ab" if response.status_code == 206 else "wb"
+            with open(path, mode) as f:
+                for chunk in response.iter_bytes(self.chunk_size):
+                    f.write(chunk)
+
+    def _verify(self, job: _Job) -> None:
+        for file in job.files:
+            path = self.local_path(file)
+            if not self.verify(file, path):
+                # Download the file again on the next attempt.
+                if os.path.exists(path):
+                    os.remove(path)
+                with self._lock:
+                    self._state[job.hash]["stage"] = self.DOWNLOAD
+                raise SonicBitError(f"Verification of {file.torrent_path} failed")
+
+    def _cleanup(self, job: _Job) -> None:
+        self.client.delete_torrent(job.torrent_hash, with_file=self.delete_with_file)
+
+    @staticmethod
+    def _verify_size(file: TorrentFile, path: str) -> bool:
+        return os.path.exists(path) and os.path.getsize(path) == file.size
+
+    def _load_state(self) -> Dict[str, dict]:
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)["torrents"]
+        except FileNotFoundError:
+            return {}
+
+    def _save_state(self) -> None:
+        with self._lock:
+            write_json_atomic(self.state_path, {"version": 1, "torrents": self._state})
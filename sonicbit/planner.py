@@ -0,0 +1,168 @@
+import logging
+import math
+from typing import Iterable, List, Set, Tuple
+
+from sonicbit.client import SonicBit
+from sonicbit.enums import ReclaimPolicy
+from sonicbit.errors import SonicBitError
+from sonicbit.models import BatchResult, PathInfo, ReclaimItem, ReclaimPlan
+
+logger = logging.getLogger(__name__)
+
+
+class StoragePlanner:
+    """Pick what to delete to free a number of bytes on the account.
+
+    One crawl (``list_torrents`` plus a ``walk`` of the drive) yields the
+    candidates: torrents, deleted together with their data, and the files
+    that do not belong to any torrent, going by the drive paths in each
+    torrent's ``TorrentDetails``. Candidates are ordered by the policy
+    and taken until the target is met, then any item the target does not
+    need is dropped again, so selection is O(n log n) in the candidates.
+
+    ``OLDEST_FIRST`` orders by modification or added date and
+    ``LARGEST_FIRST`` by size. ``COMPLETED_FIRST`` takes completed torrents
+    whose hash is in ``downloaded`` first, then other completed torrents,
+    then everything else oldest first. Unfinished torrents are only
+    considered with ``include_incomplete``.
+    """
+
+    TORRENT = "torrent"
+    FILE = "file"
+
+    def __init__(self, client: SonicBit):
+        self.client = client
+
+    def bytes_to_free(self, target_percent: float) -> int:
+        """Bytes to delete to bring storage usage down to ``target_percent``."""
+        storage = self.client.get_storage_details()
+        allowed = storage.size_byte_limit * target_percent / 100
+        return max(0, math.ceil(storage.size_byte_total - allowed))
+
+    def plan(
+        self,
+        target_bytes: int,
+        policy: ReclaimPolicy = ReclaimPolicy.OLDEST_FIRST,
+        downloaded: Iterable[str] = (),
+        include_files: bool = True,
+        include_incomplete: bool = False,
+        path: PathInfo = PathInfo.root(),
+    ) -> ReclaimPlan:
+        downloaded = {h.upper() for h in downloaded}
+        candidates, completed = self._candidates(
+            path, include_files, include_incomplete
+        )
+
+        if policy == ReclaimPolicy.LARGEST_FIRST:
+            candidates.sort(key=lambda item: item.size, reverse=True)
+        elif policy == ReclaimPolicy.COMPLETED_FIRST:
+            candidates.sort(
+                key=lambda item: (
+                    item.key.upper() not in downloaded,
+                    item.key not in completed,
+                    item.date,
+                )
+            )
+        else:
+            candidates.sort(key=lambda item: item.date)
+
+        selected, freed = [], 0
+        for item in candidates:
+            if freed >= target_bytes:
+                break
+            if item.size > 0:
+                selected.append(item)
+                freed += item.size
+
+        # Drop the least preferred items the target can do without.
+        for index in range(len(selected) - 1, -1, -1):
+            if freed - selected[index].size >= target_bytes:
+                freed -= selected.pop(index).size
+
+        logger.debug(
+            "Planned %d deletions freeing %d of %d bytes policy=%s",
+            len(selected),
+            freed,
+            target_bytes,
+            policy,
+        )
+        return ReclaimPlan(
+            policy=policy,
+            target_bytes=target_bytes,
+            freed_bytes=freed,
+            items=selected,
+        )
+
+    def execute(self, plan: ReclaimPlan, concurrency: int | None = None) -> BatchResult:
+        """Delete the planned torrents with their data, then the files.
+
+        Results are keyed by infohash for torrents and by path for files.
+        """
+        result = BatchResult.empty()
+        if hashes := plan.torrent_hashes:
+            result.results.update(
+                self.client.delete_torrents(
+                    hashes, with_file=True, concurrency=concurrency
+                ).results
+            )
+        if files := plan.files:
+            result.results.update(
+                self.client.delete_files(
+                    [item.path_info for item in files], concurrency
+                ).results
+            )
+        return result
+
+    def _candidates(
+        self, path: PathInfo, include_files: bool, include_incomplete: bool
+    ) -> Tuple[List[ReclaimItem], Set[str]]:
+        items: List[ReclaimItem] = []
+        completed: Set[str] = set()
+        torrents = self.client.list_torrents().torrents.values()
+        for torrent in torrents:
+            if torrent.progress >= 100:
+                completed.add(torrent.hash)
+            elif not include_incomplete:
+                continue
+            items.append(
+                ReclaimItem(
+                    kind=self.TORRENT,
+                    key=torrent.hash,
+                    name=torrent.name,
+                    size=torrent.size,
+                    date=torrent.date_added,
+                )
+            )
+
+        if include_files:
+            torrent_paths = self._torrent_paths([t.hash for t in torrents])
+            for file in self.client.walk(path):
+                # Torrent data is freed by deleting the torrent itself.
+                if file.is_directory or file.path_info.path in torrent_paths:
+                    continue
+                items.append(
+                    ReclaimItem(
+                        kind=self.FILE,
+                        key=file.path_info.path,
+                        name=file.name,
+                        size=file.size,
+                        date=file.date_modified,
+                        path_info=file.path_info,
+                    )
+                )
+        return items, completed
+
+    def _torrent_paths(self, hashes: List[str]) -> Set[str]:
+        """Drive paths of the files of the torrents ``hashes``."""
+        details = self.client.get_torrent_details_many(hashes)
+        if details.failed:
+            # Without a torrent's file list its data would look unowned.
+            raise SonicBitError(
+                f"Failed to get the files of {len(details.failed)} torrents: "
+                f"{details.failed}"
+            )
+        return {
+            "/" + file.file_path.strip("/")
+            for torrent in details.values.values()
+            for file in torrent.files
+        }
@@ -0,0 +1,300 @@
+import atexit
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter, sleep
+from typing import Dict, Iterator, List, TextIO
+
+PHASES = (
+    "connect",  # DNS lookup and TCP connect
+    "tls",  # TLS handshake
+    "send",  # writing the request
+    "server",  # waiting for the response headers
+    "receive",  # reading the response body
+    "throttle",  # waiting on the client-side rate limiter
+    "backoff",  # tenacity sleeps between retries
+    "auth",  # 401 token refreshes and web session logins
+    "json",  # decoding the response body
+    "models",  # building pydantic models from the decoded data
+)
+
+# Trace events httpcore emits, mapped to the phase they close.
+_TRACE_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.connect_unix_socket": "connect",
+    "connection.start_tls": "tls",
+    "http11.send_request_headers": "send",
+    "http11.send_request_body": "send",
+    "http2.send_request_headers": "send",
+    "http2.send_request_body": "send",
+    "http11.receive_response_headers": "server",
+    "http2.receive_response_headers": "server",
+    "http11.receive_response_body": "receive",
+    "http2.receive_response_body": "receive",
+}
+
+_current: ContextVar["_Call | None"] = ContextVar("sonicbit_profile_call", default=None)
+_active: "Profiler | None" = None
+
+
+class _Endpoint:
+    __slots__ = ("calls", "wall", "phases", "stats")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.stats = None  # pstats.Stats, when cprofile is enabled
+
+
+class _Call:
+    __slots__ = ("profiler", "endpoint", "exclusive", "started")
+
+    def __init__(self, profiler: "Profiler", endpoint: str):
+        self.profiler = profiler
+        self.endpoint = endpoint
+        self.exclusive = False
+        self.started: Dict[str, float] = {}
+
+    def add(self, phase: str, elapsed: float) -> None:
+        # Requests sent while refreshing the token are counted as auth time
+        # only, not again as network time of the call they interrupted.
+        if not self.exclusive:
+            self.profiler.add(self.endpoint, phase, elapsed)
+
+    def trace(self, name: str, info: dict) -> None:
+        """httpcore trace callback, see the ``trace`` request extension."""
+        event, _, state = name.rpartition(".")
+        if state == "started":
+            self.started[event] = perf_counter()
+        elif state in ("complete", "failed") and event in self.started:
+            phase = _TRACE_PHASES.get(event)
+            elapsed = perf_counter() - self.started.pop(event)
+            if phase is not None:
+                self.add(phase, elapsed)
+
+
+class Profiler:
+    """Aggregates the time SDK calls spend in each phase, per endpoint.
+
+    Network phases come from httpcore trace events, so with a custom
+    transport that does not emit them the whole request shows up as
+    ``other``. With ``cprofile`` every call and parse is also run under
+    ``cProfile`` and the stats are kept per endpoint for ``dump``.
+    """
+
+    def __init__(self, cprofile: bool = False):
+        self.cprofile = cprofile
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _Endpoint] = {}
+
+    def _endpoint(self, endpoint: str) -> _Endpoint:
+        entry = self._endpoints.get(endpoint)
+        if entry is None:
+            entry = self._endpoints[endpoint] = _Endpoint()
+        return entry
+
+    def add(self, endpoint: str, phase: str, elapsed: float) -> None:
+        with self._lock:
+            self._endpoint(endpoint).phases[phase] += elapsed
+
+    def _finish(self, endpoint: str, wall: float, calls: int = 1) -> None:
+        with self._lock:
+            entry = self._endpoint(endpoint)
+            entry.calls += calls
+            entry.wall += wall
+
+    @contextmanager
+    def _sampled(self, endpoint: str) -> Iterator[None]:
+        if not self.cprofile:
+            yield
+            return
+        import cProfile
+        import pstats
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # another profiler is already active on this thread
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                entry = self._endpoint(endpoint)
+                if entry.stats is None:
+                    entry.stats = pstats.Stats(profile)
+                else:
+                    entry.stats.add(profile)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def report(self) -> dict:
+        """Return the per-endpoint breakdown as plain, JSON-serializable data.
+
+        ``wall`` is the time spent in requests, parsing included; ``other``
+        is the part of it no phase accounts for, such as hooks and request
+        building, or the whole request without trace events.
+        """
+        with self._lock:
+            report = {}
+            for endpoint, entry in sorted(self._endpoints.items()):
+                phases = dict(entry.phases)
+                report[endpoint] = {
+                    "calls": entry.calls,
+                    "wall": entry.wall,
+                    "phases": phases,
+                    "other": max(0.0, entry.wall - sum(phases.values())),
+                }
+            return report
+
+    def format_report(self) -> str:
+        """Render ``report`` as a table of seconds, slowest endpoint first."""
+        columns = ["calls", "wall", *PHASES, "other"]
+        report = sorted(self.report().items(), key=lambda item: -item[1]["wall"])
+        width = max([len("endpoint"), *(len(endpoint) for endpoint, _ in report)])
+        lines = ["endpoint".ljust(width) + "".join(f"{c:>10}" for c in columns)]
+        for endpoint, entry in report:
+            values = [entry["wall"], *entry["phases"].values(), entry["other"]]
+            lines.append(
+                endpoint.ljust(width)
+                + f"{entry['calls']:>10}"
+                + "".join(f"{value:>10.4f}" for value in values)
+            )
+        return "\n".join(lines) + "\n"
+
+    def dump(self, directory: str) -> List[str]:
+        """Write ``report.json`` and, with ``cprofile``, one ``.pstats`` file
+        per endpoint into ``directory``. Returns the paths written."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "report.json")
+        with open(path, "w") as file:
+            json.dump(self.report(), file, indent=2)
+        paths = [path]
+
+        with self._lock:
+            stats = [(e, entry.stats) for e, entry in self._endpoints.items()]
+        for endpoint, endpoint_stats in stats:
+            if endpoint_stats is None:
+                continue
+            name = endpoint.strip("/").replace("/", "_") or "root"
+            path = os.path.join(directory, f"{name}.pstats")
+            endpoint_stats.dump_stats(path)
+            paths.append(path)
+        return paths
+
+
+def active() -> Profiler | None:
+    """Return the profiler calls are currently reported to, if any."""
+    return _active
+
+
+@contextmanager
+def profile(cprofile: bool = False) -> Iterator[Profiler]:
+    """Profile every SDK call made, from any thread, inside the block."""
+    global _active
+    previous, _active = _active, Profiler(cprofile=cprofile)
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+@contextmanager
+def call(endpoint: str) -> Iterator["_Call | None"]:
+    """Attribute the enclosed request to ``endpoint``.
+
+    Nested requests, such as the login behind a token refresh, are folded
+    into the outermost call rather than counted on their own.
+    """
+    profiler = _active
+    outer = _current.get()
+    if profiler is None or outer is not None:
+        yield outer
+        return
+
+    current = _Call(profiler, endpoint)
+    token = _current.set(current)
+    started = perf_counter()
+    try:
+        with profiler._sampled(endpoint):
+            yield current
+    finally:
+        _current.reset(token)
+        profiler._finish(endpoint, perf_counter() - started)
+
+
+@contextmanager
+def phase(name: str, exclusive: bool = False) -> Iterator[None]:
+    """Count the enclosed block as ``name`` time of the current call.
+
+    With ``exclusive`` the phases of requests sent inside the block are not
+    counted separately.
+    """
+    current = _current.get()
+    if current is None or current.exclusive:
+        yield
+        return
+    current.exclusive = exclusive
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        current.exclusive = False
+        current.add(name, perf_counter() - started)
+
+
+def backoff_sleep(seconds: float) -> None:
+    """``sleep`` for tenacity that reports the wait as backoff."""
+    with phase("backoff"):
+        sleep(seconds)
+
+
+@contextmanager
+def parse(endpoint: str, response) -> Iterator[None]:
+    """Split the parsing of ``response`` into JSON decoding and models.
+
+    The body is decoded once up front and ``response.json`` is pointed at
+    the result, so the parser inside the block does not decode it again.
+    """
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+
+    started = perf_counter()
+    with profiler._sampled(endpoint):
+        if response is not None:
+            try:
+                data = response.json()
+            except ValueError:
+                pass  # left for the parser to report
+            else:
+                response.json = lambda **kwargs: data
+        decoded = perf_counter()
+        profiler.add(endpoint, "json", decoded - started)
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - decoded
+            profiler.add(endpoint, "models", elapsed)
+            profiler._finish(endpoint, perf_counter() - started, calls=0)
+
+
+def _report_at_exit(profiler: Profiler, stream: TextIO, directory: str | None):
+    stream.write(profiler.format_report())
+    if directory:
+        profiler.dump(directory)
+
+
+if os.environ.get("SONICBIT_PROFILE"):
+    _directory = os.environ.get("SONICBIT_PROFILE_DIR")
+    _active = Profiler(cprofile=bool(_directory))
+    atexit.register(_report_at_exit, _active, sys.stderr, _directory)
@@ -0,0 +1,284 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, NamedTuple, Tuple
+from urllib.parse import quote, unquote
+
+import httpx
+
+from sonicbit.client import SonicBit
+from sonicbit.errors import SonicBitError
+from sonicbit.models import File, PathInfo, TorrentFile
+
+logger = logging.getLogger(__name__)
+
+
+class _Source(NamedTuple):
+    url: str
+    size: int
+    name: str
+
+
+class RangeProxy:
+    """Local HTTP proxy that serves seedbox files from an on-disk chunk cache.
+
+    Files are fetched from the download server in ``chunk_size`` pieces
+    with range requests and stored under ``cache_dir``; the least recently
+    used chunks are evicted once the cache exceeds ``max_bytes``. While a
+    chunk is served the next ``read_ahead`` chunks are fetched in the
+    background, so sequential playback rarely waits on the network.
+
+    Files are addressed as ``/drive/<path>`` (looked up by listing the
+    parent directory once, which registers all of its files) or through the
+    URL returned by ``url_for``::
+
+        proxy = RangeProxy(sb, "/var/cache/sonicbit")
+        server = proxy.serve(port=8080)
+        print(proxy.url_for(torrent_file))
+    """
+
+    def __init__(
+        self,
+        client: SonicBit,
+        cache_dir: str,
+        max_bytes: int = 10 << 30,
+        chunk_size: int = 4 << 20,
+        read_ahead: int = 2,
+        fetch_concurrency: int = 4,
+    ):
+        self.client = client
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.read_ahead = read_ahead
+        self.base_url = ""
+        self._lock = threading.Lock()
+        self._sources: Dict[str, _Source] = {}
+        self._paths: Dict[str, str] = {}  # drive path -> source id
+        self._chunks: OrderedDict[Tuple[str, int], int] = OrderedDict()
+        self._cached_bytes = 0
+        self._fetching: Dict[Tuple[str, int], threading.Event] = {}
+        self._executor = ThreadPoolExecutor(max_workers=fetch_concurrency)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_cache()
+
+    def register(self, file: File | TorrentFile) -> str:
+        """Make a file available through the proxy and return its id."""
+        source = _Source(file.download_url, file.size, file.name)
+        source_id = hashlib.sha1(source.url.encode()).hexdigest()[:20]
+        with self._lock:
+            self._sources[source_id] = source
+        return source_id
+
+    def url_for(self, file: File | TorrentFile) -> str:
+        """Return the proxy URL of a file; ``serve`` must have been called."""
+        return f"{self.base_url}/f/{self.register(file)}/{quote(file.name)}"
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """Serve the proxy over HTTP from a background thread."""
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                proxy._handle(self, body=True)
+
+            def do_HEAD(self):
+                proxy._handle(self, body=False)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        self.base_url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def read(self, source_id: str, start: int, end: int) -> Iterator[bytes]:
+        """Yield bytes ``start`` to ``end`` (inclusive) of a registered file."""
+        source = self._sources[source_id]
+        first, last = start // self.chunk_size, end // self.chunk_size
+        ahead = first + 1
+        for index in range(first, last + 1):
+            # Players request open-ended ranges, so prefetch as we go rather
+            # than after the range has been served.
+            for next_index in range(ahead, index + 1 + self.read_ahead):
+                if next_index * self.chunk_size < source.size:
+                    self._executor.submit(self._prefetch, source_id, source, next_index)
+            ahead = max(ahead, index + 1 + self.read_ahead)
+            data = self._chunk(source_id, source, index)
+            offset = index * self.chunk_size
+            yield data[max(start - offset, 0) : end - offset + 1]
+
+    def _handle(self, request: BaseHTTPRequestHandler, body: bool) -> None:
+        try:
+            source_id = self._resolve(unquote(request.path.split("?", 1)[0]))
+        except SonicBitError as error:
+            request.send_error(404, str(error))
+            return
+        size = self._sources[source_id].size
+
+        start, end, status = 0, size - 1, 200
+        if range_header := request.headers.get("range"):
+            first, _, last = range_header.removeprefix("bytes=").partition("-")
+            try:
+                if first:
+                    start, end = int(first), min(int(last or size - 1), size - 1)
+                else:
+                    start = max(size - int(last), 0)
+            except ValueError:
+                first = None
+            if first is None or start > end:
+                request.send_response(416)
+                request.send_header("Content-Range", f"bytes */{size}")
+                request.end_headers()
+                return
+            status = 206
+
+        request.send_response(status)
+        request.send_header("Accept-Ranges", "bytes")
+        request.send_header("Content-Type", "application/octet-stream")
+        request.send_header("Content-Length", str(end - start + 1))
+        if status == 206:
+            request.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        request.end_headers()
+        if not body or size == 0:
+            return
+        try:
+            for data in self.read(source_id, start, end):
+                request.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the player seeked elsewhere or went away
+        except (SonicBitError, httpx.HTTPError) as error:
+            # The headers are out, so all that is left is to hang up and let
+            # the player see a short body.
+            logger.warning("Failed to serve path=%s: %s", request.path, error)
+            request.close_connection = True
+
+    def _resolve(self, path: str) -> str:
+        if path.startswith("/f/"):
+            source_id = path.split("/")[2]
+            if source_id in self._sources:
+                return source_id
+        elif path.startswith("/drive/"):
+            key = "/" + path.removeprefix("/drive/").strip("/")
+            if (source_id := self._paths.get(key)) is not None:
+                return source_id
+            parent = key.rpartition("/")[0].lstrip("/")
+            directory = PathInfo.from_path_key(parent) if parent else PathInfo.root()
+            for file in self.client.list_files(directory).items:
+                if not file.is_directory:
+                    self._paths[file.path_info.path] = self.register(file)
+            if (source_id := self._paths.get(key)) is not None:
+                return source_id
+        raise SonicBitError(f"Unknown file: {path}")
+
+    def _prefetch(self, source_id: str, source: _Source, index: int) -> None:
+        with self._lock:
+            key = (source_id, index)
+            if key in self._chunks or key in self._fetching:
+                return
+        self._chunk(source_id, source, index)
+
+    def _chunk(self, source_id: str, source: _Source, index: int) -> bytes:
+        key = (source_id, index)
+        while True:
+            with self._lock:
+                cached = key in self._chunks
+                if cached:
+                    self._chunks.move_to_end(key)
+                elif (fetching := self._fetching.get(key)) is None:
+                    fetching = self._fetching[key] = threading.Event()
+                    break
+            if not cached:
+                fetching.wait()  # another thread is fetching this chunk
+                continue
+            try:
+                with open(self._chunk_path(source_id, index), "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                with self._lock:  # evicted between lookup and read
+                    if (size := self._chunks.pop(key, None)) is not None:
+                        self._cached_bytes -= size
+
+        try:
+            return self._fetch(source_id, source, index)
+        finally:
+            with self._lock:
+                del self._fetching[key]
+            fetching.set()
+
+    def _fetch(self, source_id: str, source: _Source, index: int) -> bytes:
+        start = index * self.chunk_size
+        end = min(start + self.chunk_size, source.size) - 1
+        logger.debug("Fetching chunk url=%s bytes=%d-%d", source.url, start, end)
+        with self.client.download_session.stream(
+            "GET", source.url, headers={"Range": f"bytes={start}-{end}"}
+        ) as response:
+            if response.status_code == 206:
+                data = response.read()
+            elif response.status_code == 200 and start == 0:
+                # The range was ignored; read the first chunk and hang up.
+                data = bytearray()
+                for part in response.iter_bytes():
+                    data += part
+                    if len(data) > end:
+                        break
+                data = bytes(data[: end + 1])
+            elif response.status_code == 200:
+                raise SonicBitError(
+                    f"Failed to fetch {source.name}: the server ignored the range"
+                )
+            else:
+                raise SonicBitError(
+                    f"Failed to fetch {source.name}: "
+                    f"{response.status_code} {response.reason_phrase}"
+                )
+
+        path = self._chunk_path(source_id, index)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        self._store((source_id, index), len(data))
+        return data
+
+    def _store(self, key: Tuple[str, int], size: int) -> None:
+        evicted = []
+        with self._lock:
+            self._chunks[key] = size
+            self._cached_bytes += size
+            while self._cached_bytes > self.max_bytes and len(self._chunks) > 1:
+                old_key, old_size = self._chunks.popitem(last=False)
+                self._cached_bytes -= old_size
+                evicted.append(old_key)
+        for source_id, index in evicted:
+            try:
+                os.remove(self._chunk_path(source_id, index))
+            except FileNotFoundError:
+                pass
+
+    def _chunk_path(self, source_id: str, index: int) -> str:
+        return os.path.join(self.cache_dir, source_id, f"{index:08d}.chunk")
+
+    def _load_cache(self) -> None:
+        """Index chunks left by a previous run, least recently used first."""
+        found = []
+        for source_id in os.listdir(self.cache_dir):
+            directory = os.path.join(self.cache_dir, source_id)
+            if not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                if name.endswith(".chunk"):
+                    stat = os.stat(path)
+                    index = int(name.removesuffix(".chunk"))
+                    found.append((stat.st_mtime, (source_id, index), stat.st_size))
+                elif name.endswith(".tmp"):
+                    os.remove(path)
+        for _, key, size in sorted(found):
+            self._store(key, size)
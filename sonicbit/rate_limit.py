@@ -0,0 +1,177 @@
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+from sonicbit.errors import CircuitOpenError
+
+DEFAULT_FAMILY = "default"
+FAMILY_PREFIXES = (
+    ("/file-manager", "file_manager"),
+    ("/app/seedbox/torrent", "torrent"),
+    ("/remote_download", "remote_download"),
+)
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Map an API path to the family it is rate limited under."""
+    for prefix, family in FAMILY_PREFIXES:
+        if endpoint.startswith(prefix):
+            return family
+    return DEFAULT_FAMILY
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second.
+
+    ``clock`` and ``sleep`` default to ``time.monotonic`` and ``time.sleep``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            self._sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds``, e.g. after a 429 response."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+            self._tokens = 0.0
+
+
+class RateLimiter:
+    """Token buckets for a whole account and for each endpoint family.
+
+    Families are ``file_manager``, ``torrent``, ``remote_download`` and
+    ``default``; ``rates`` maps a family to ``(requests_per_second, burst)``.
+    Share one instance between every client of the same account::
+
+        limiter = RateLimiter(account=(20, 40), rates={"file_manager": (5, 10)})
+        sb.rate_limiter = limiter
+    """
+
+    def __init__(
+        self,
+        account: Tuple[float, int] | None = None,
+        rates: Dict[str, Tuple[float, int]] | None = None,
+        throttle_pause: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.throttle_pause = throttle_pause
+        self._account = TokenBucket(*account, clock, sleep) if account else None
+        self._families = {
+            family: TokenBucket(rate, burst, clock, sleep)
+            for family, (rate, burst) in (rates or {}).items()
+        }
+
+    def acquire(self, endpoint: str) -> None:
+        if self._account is not None:
+            self._account.acquire()
+        bucket = self._families.get(endpoint_family(endpoint))
+        if bucket is not None:
+            bucket.acquire()
+
+    def throttled(self, endpoint: str, retry_after: float | None = None) -> None:
+        """Back off after the server answered 429."""
+        seconds = retry_after if retry_after is not None else self.throttle_pause
+        bucket = self._families.get(endpoint_family(endpoint), self._account)
+        if bucket is not None:
+            bucket.pause(seconds)
+
+
+class CircuitBreaker:
+    """Per-family circuit breaker.
+
+    After ``failure_threshold`` consecutive failures (transport errors, 429
+    and 5xx responses) calls to that family fail fast with
+    CircuitOpenError for ``reset_timeout`` seconds; then a single trial call
+    is let through and its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._trial: Dict[str, bool] = {}
+
+    def state(self, endpoint: str) -> str:
+        family = endpoint_family(endpoint)
+        with self._lock:
+            return self._state(family)
+
+    def before(self, endpoint: str) -> None:
+        """Raise CircuitOpenError unless a call to ``endpoint`` may proceed."""
+        family = endpoint_family(endpoint)
+        with self._lock:
+            state = self._state(family)
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial.get(family):
+                self._trial[family] = True
+                return
+        raise CircuitOpenError(
+            f"Circuit for '{family}' endpoints is open after "
+            f"{self.failure_threshold} consecutive failures"
+        )
+
+    def record(self, endpoint: str, success: bool) -> None:
+        family = endpoint_family(endpoint)
+        with self._lock:
+            self._trial.pop(family, None)
+            if success:
+                self._failures.pop(family, None)
+                self._opened_at.pop(family, None)
+                return
+            self._failures[family] = self._failures.get(family, 0) + 1
+            if self._failures[family] >= self.failure_threshold:
+                self._opened_at[family] = self._clock()
+
+    def _state(self, family: str) -> str:
+        opened_at = self._opened_at.get(family)
+        if opened_at is None:
+            return self.CLOSED
+        if self._clock() - opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
@@ -0,0 +1,184 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import List, NamedTuple
+
+from sonicbit.client import SonicBit
+from sonicbit.models import BatchResult, PathInfo, StorageDetails, TorrentList
+
+logger = logging.getLogger(__name__)
+
+
+class _Job(NamedTuple):
+    kind: str
+    target: str
+    path: PathInfo
+    size: int | None
+    auto_start: bool
+    priority: int
+    attempts: int = 0
+
+
+class SubmissionScheduler:
+    """Client-side queue that releases torrents and remote downloads only when
+    the account has a free slot and enough storage left for them.
+
+    Torrents are limited by ``StorageDetails.max_parallel`` minus the
+    unfinished torrents in the last ``list_torrents`` snapshot, and every job
+    with a known size by ``StorageDetails.set_storage_left``. Jobs are released
+    highest priority first; a job that does not fit yet does not block smaller
+    jobs behind it. A failed submission frees its slot and storage again and
+    is requeued, up to ``MAX_ATTEMPTS`` submissions per job.
+    """
+
+    TORRENT = "torrent"
+    REMOTE_DOWNLOAD = "remote_download"
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, client: SonicBit, refresh_interval: float = 30.0):
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._queue: List[tuple] = []
+        self._counter = itertools.count()
+        self._storage: StorageDetails | None = None
+        self._torrents: TorrentList | None = None
+        self._refreshed_at = 0.0
+        self._reserved_slots = 0
+        self._reserved_bytes = 0
+
+    def submit_torrent(
+        self,
+        uri: str,
+        path: PathInfo = PathInfo.root(),
+        priority: int = 0,
+        size: int | None = None,
+        auto_start: bool = True,
+    ) -> None:
+        self._push(_Job(self.TORRENT, uri, path, size, auto_start, priority))
+
+    def submit_remote_download(
+        self,
+        url: str,
+        path: PathInfo = PathInfo.root(),
+        priority: int = 0,
+        size: int | None = None,
+    ) -> None:
+        self._push(_Job(self.REMOTE_DOWNLOAD, url, path, size, True, priority))
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def refresh(self) -> None:
+        """Re-fetch storage details and the torrent list."""
+        storage = self.client.get_storage_details()
+        torrents = self.client.list_torrents()
+        with self._lock:
+            self._storage = storage
+            self._torrents = torrents
+            self._refreshed_at = time.monotonic()
+            self._reserved_slots = 0
+            self._reserved_bytes = 0
+
+    def run_once(self) -> BatchResult:
+        """Submit every queued job the account can run right now."""
+        if time.monotonic() - self._refreshed_at >= self.refresh_interval:
+            self.refresh()
+
+        with self._lock:
+            released, rejected = self._release()
+
+        result = BatchResult.empty()
+        for job in rejected:
+            result.add(job.target, False, "Job is larger than the storage limit")
+
+        torrents = {}
+        for job in released:
+            if job.kind == self.TORRENT:
+                torrents.setdefault((job.path.path, job.auto_start), []).append(job)
+            else:
+                try:
+                    self.client.add_remote_download(job.target, job.path)
+                    result.add(job.target, True)
+                except Exception as error:
+                    result.add(job.target, False, str(error))
+                    self._failed(job)
+
+        for jobs in torrents.values():
+            batch = self.client.add_torrents(
+                [job.target for job in jobs], jobs[0].path, jobs[0].auto_start
+            )
+            result.results.update(batch.results)
+            for job in jobs:
+                if job.target in batch.failed:
+                    self._failed(job)
+
+        if released:
+            logger.debug(
+                "Released %d jobs, %d still pending", len(released), self.pending
+            )
+        return result
+
+    def run(
+        self, poll_interval: float = 10.0, stop_event: threading.Event | None = None
+    ) -> BatchResult:
+        """Release jobs until the queue drains or ``stop_event`` is set."""
+        stop_event = stop_event or threading.Event()
+        result = BatchResult.empty()
+        while not stop_event.is_set():
+            result.results.update(self.run_once().results)
+            if not self.pending:
+                break
+            stop_event.wait(poll_interval)
+        return result
+
+    def _push(self, job: _Job) -> None:
+        with self._lock:
+            heapq.heappush(self._queue, (-job.priority, next(self._counter), job))
+
+    def _failed(self, job: _Job) -> None:
+        """Free what ``job`` reserved and requeue it if it has attempts left."""
+        with self._lock:
+            self._reserved_bytes = max(0, self._reserved_bytes - (job.size or 0))
+            if job.kind == self.TORRENT:
+                self._reserved_slots = max(0, self._reserved_slots - 1)
+        if job.attempts + 1 < self.MAX_ATTEMPTS:
+            self._push(job._replace(attempts=job.attempts + 1))
+
+    def _release(self) -> tuple[List[_Job], List[_Job]]:
+        storage = self._storage
+        active = sum(
+            1
+            for torrent in self._torrents.torrents.values()
+            if torrent.progress < 100 and not torrent.deleted
+        )
+        free_slots = storage.max_parallel - active - self._reserved_slots
+        storage_left = storage.set_storage_left - self._reserved_bytes
+
+        released, rejected, deferred = [], [], []
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            job = entry[2]
+            if job.size is not None and job.size > storage.size_byte_limit:
+                rejected.append(job)
+                continue
+
+            needs_slot = job.kind == self.TORRENT
+            fits = (job.size or 0) <= storage_left and storage_left > 0
+            if fits and (free_slots > 0 or not needs_slot):
+                released.append(job)
+                storage_left -= job.size or 0
+                self._reserved_bytes += job.size or 0
+                if needs_slot:
+                    free_slots -= 1
+                    self._reserved_slots += 1
+            else:
+                deferred.append(entry)
+
+        for entry in deferred:
+            heapq.heappush(self._queue, entry)
+        return released, rejected
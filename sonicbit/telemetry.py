@@ -0,0 +1,168 @@
+import threading
+import time
+from array import array
+from typing import Dict, List, NamedTuple
+
+from sonicbit.models import TorrentList
+
+RATE_UNITS = {"": 1, "B": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def rate_to_bytes(value: float | None, unit: str | None) -> float:
+    """Convert a rate such as ``(1.5, "MB/s")`` to bytes per second."""
+    if not value or not unit:
+        return 0.0
+    prefix = unit.strip().upper()[:1]
+    return float(value) * RATE_UNITS.get(prefix, 1)
+
+
+class _Ring:
+    """Fixed-size ring buffer of doubles with an O(1) running sum."""
+
+    __slots__ = ("values", "index", "count", "sum", "writes")
+
+    def __init__(self, size: int):
+        self.values = array("d", bytes(8 * size))
+        self.index = 0
+        self.count = 0
+        self.sum = 0.0
+        self.writes = 0
+
+    def push(self, value: float) -> None:
+        size = len(self.values)
+        if self.count == size:
+            self.sum -= self.values[self.index]
+        else:
+            self.count += 1
+        self.values[self.index] = value
+        self.sum += value
+        self.index = (self.index + 1) % size
+        self.writes += 1
+        if self.writes % size == 0:
+            self.sum = sum(self.values[: self.count])  # shed float drift
+
+    def latest(self) -> float:
+        return self.values[self.index - 1]
+
+    def oldest(self) -> float:
+        return self.values[self.index if self.count == len(self.values) else 0]
+
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class _Series:
+    __slots__ = ("times", "rates", "done", "size", "progress", "progressed_at")
+
+    def __init__(self, window: int):
+        self.times = _Ring(window)
+        self.rates = _Ring(window)
+        self.done = _Ring(window)  # bytes completed
+        self.size = 0
+        self.progress = 0
+        self.progressed_at = 0.0
+
+
+class TorrentStats(NamedTuple):
+    hash: str
+    progress: int
+    rate: float  # bytes per second, as last reported
+    average_rate: float  # bytes per second over the window
+    eta: float | None  # seconds, None while nothing is moving
+    stalled: bool
+
+
+class TorrentTelemetry:
+    """Per-torrent throughput history fed by successive ``list_torrents``.
+
+    Every torrent keeps its last ``window`` samples of reported rate and
+    completed bytes in array-backed ring buffers, so memory is bounded by
+    the window and the number of torrents on the account, and each update
+    and query is O(1) per torrent. Torrents that leave the list are dropped.
+
+    The average rate is the mean reported rate over the window. The ETA
+    divides the remaining bytes by that average or, when the server reports
+    no rate, by the completion speed observed across the window. A torrent
+    is stalled when it is unfinished, its progress has not moved for
+    ``stall_after`` seconds and its average rate is below ``stall_rate``
+    bytes per second.
+    """
+
+    def __init__(
+        self, window: int = 60, stall_after: float = 300.0, stall_rate: float = 1024.0
+    ):
+        self.window = window
+        self.stall_after = stall_after
+        self.stall_rate = stall_rate
+        self._lock = threading.Lock()
+        self._series: Dict[str, _Series] = {}
+
+    def update(self, torrent_list: TorrentList, at: float | None = None) -> None:
+        at = time.monotonic() if at is None else at
+        with self._lock:
+            series = {}
+            for torrent in torrent_list.torrents.values():
+                key = torrent.hash.upper()
+                entry = self._series.get(key)
+                if entry is None:
+                    entry = _Series(self.window)
+                    entry.progressed_at = at
+                elif torrent.progress != entry.progress:
+                    entry.progressed_at = at
+                entry.size = torrent.size
+                entry.progress = torrent.progress
+                entry.times.push(at)
+                entry.rates.push(
+                    rate_to_bytes(
+                        torrent.download_rate_value, torrent.download_rate_unit
+                    )
+                )
+                entry.done.push(torrent.size * torrent.progress / 100)
+                series[key] = entry
+            self._series = series
+
+    def stats(self, hash: str, at: float | None = None) -> TorrentStats | None:
+        at = time.monotonic() if at is None else at
+        with self._lock:
+            entry = self._series.get(hash.upper())
+            if entry is None:
+                return None
+            return self._stats(hash.upper(), entry, at)
+
+    def all_stats(self, at: float | None = None) -> List[TorrentStats]:
+        at = time.monotonic() if at is None else at
+        with self._lock:
+            return [self._stats(key, entry, at) for key, entry in self._series.items()]
+
+    def stalled(self, at: float | None = None) -> List[str]:
+        return [stats.hash for stats in self.all_stats(at) if stats.stalled]
+
+    def _stats(self, key: str, entry: _Series, at: float) -> TorrentStats:
+        complete = entry.progress >= 100
+        average = entry.rates.mean()
+        remaining = max(0.0, entry.size - entry.done.latest())
+
+        speed = average
+        elapsed = entry.times.latest() - entry.times.oldest()
+        if speed <= 0 and elapsed > 0:
+            speed = (entry.done.latest() - entry.done.oldest()) / elapsed
+
+        if complete:
+            eta = 0.0
+        elif speed > 0:
+            eta = remaining / speed
+        else:
+            eta = None
+
+        return TorrentStats(
+            hash=key,
+            progress=entry.progress,
+            rate=entry.rates.latest(),
+            average_rate=average,
+            eta=eta,
+            stalled=(
+                not complete
+                and average < self.stall_rate
+                and at - entry.progressed_at >= self.stall_after
+            ),
+        )
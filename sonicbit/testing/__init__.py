@@ -0,0 +1,4 @@
+from .fake_server import FakeSonicBit
+from .recording import RecordingTransport, ReplayTransport
+
+__all__ = ["FakeSonicBit", "RecordingTransport", "ReplayTransport"]
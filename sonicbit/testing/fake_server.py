@@ -0,0 +1,554 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+from sonicbit.constants import Constants
+from sonicbit.utils import magnet_infohash, torrent_infohash
+
+DOWNLOAD_BASE_URL = "https://dl.fake.sonicbit.invalid/dl"
+
+
+class FakeSonicBit(httpx.BaseTransport):
+    """Stateful, in-memory stand-in for the SonicBit API.
+
+    Pass an instance as ``SonicBit(transport=...)`` to run the SDK offline.
+    It implements the endpoints the SDK calls, with configurable latency and
+    jitter, injected failures (401, 429, timeouts and slow responses) and
+    ``populate_*`` helpers that generate listings of any size::
+
+        fake = FakeSonicBit(latency=0.02, jitter=0.01)
+        fake.add_account("user@example.com", "password")
+        fake.populate_torrents(10_000)
+        sb = SonicBit("user@example.com", "password", transport=fake)
+
+    ``serve()`` exposes the same handler over plain HTTP for non-Python
+    load generators.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rates: Dict[int | str, float] | None = None,
+        storage_limit: int = 1 << 40,
+        max_parallel: int = 10,
+        slow_latency: float = 1.0,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.slow_latency = slow_latency
+        self.error_rates = dict(error_rates or {})
+        self.storage_limit = storage_limit
+        self.max_parallel = max_parallel
+        self.requests = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._accounts: Dict[str, str] = {}
+        self._tokens: Dict[str, str] = {}
+        self._faults: List[Tuple[int | str, str | None]] = []
+        self._torrents: Dict[str, dict] = {}
+        self._torrent_files: Dict[str, List[dict]] = {}
+        self._directories: Dict[str, Dict[str, dict]] = {"": {}}
+        self._tasks: Dict[int, dict] = {}
+        self._next_task_id = 1
+
+    # ------------------------------------------------------------------ setup
+
+    def add_account(self, email: str, password: str) -> None:
+        with self._lock:
+            self._accounts[email] = password
+
+    def expire_tokens(self) -> None:
+        """Invalidate every issued token so the next calls receive 401."""
+        with self._lock:
+            self._tokens.clear()
+
+    def fail(self, error: int | str, times: int = 1, endpoint: str | None = None):
+        """Make the next ``times`` matching requests fail.
+
+        ``error`` is an HTTP status code (e.g. 401, 429, 500), ``"timeout"``
+        or ``"slow"``, which delays the response by ``slow_latency``.
+        ``endpoint`` restricts the fault to one API path such as
+        ``"/app/seedbox/torrent/list"``.
+        """
+        with self._lock:
+            self._faults.extend([(error, endpoint)] * times)
+
+    def populate_torrents(
+        self,
+        count: int,
+        files_per_torrent: int = 1,
+        completed: float = 0.5,
+        size: int | None = None,
+    ) -> List[str]:
+        """Add ``count`` generated torrents; returns their hashes.
+
+        ``size`` is the total size of each torrent; by default it is derived
+        from the hash and ranges from 1 MiB to 4 GiB.
+        """
+        hashes = []
+        with self._lock:
+            offset = len(self._torrents)
+            for i in range(offset, offset + count):
+                name = f"torrent-{i:06d}"
+                info_hash = hashlib.sha1(name.encode()).hexdigest().upper()
+                progress = 100 if self._random.random() < completed else i % 100
+                self._add_torrent(info_hash, name, progress, files_per_torrent, size)
+                hashes.append(info_hash)
+        return hashes
+
+    def complete_torrents(self, hashes: List[str]) -> None:
+        """Finish downloading the given torrents, as the seedbox would."""
+        with self._lock:
+            for info_hash in hashes:
+                torrent = self._torrents[info_hash.upper()]
+                self._add_torrent(
+                    torrent["hash"],
+                    torrent["name"],
+                    100,
+                    len(self._torrent_files[torrent["hash"]]),
+                    int(torrent["sizeBytes"]),
+                )
+
+    def populate_files(
+        self,
+        count: int,
+        directory: str = "",
+        size: int = 1 << 20,
+        subdirectories: int = 0,
+        depth: int = 1,
+    ) -> None:
+        """Add ``count`` files to ``directory`` and, recursively, to
+        ``subdirectories`` child directories down to ``depth`` levels."""
+        with self._lock:
+            self._populate_files(count, directory, size, subdirectories, depth)
+
+    def populate_remote_tasks(self, count: int) -> None:
+        with self._lock:
+            for i in range(count):
+                self._add_task(f"https://example.invalid/file-{i:06d}.bin", "")
+
+    # -------------------------------------------------------------- transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests += 1
+        self._sleep()
+
+        path = request.url.path
+        endpoint = path.removeprefix("/api")
+        fault = self._take_fault(endpoint)
+        if fault == "timeout":
+            raise httpx.ReadTimeout("Injected timeout", request=request)
+        if fault == "slow":
+            time.sleep(self.slow_latency)
+            fault = None
+        if fault is not None:
+            return httpx.Response(fault, json={"message": f"Injected {fault}"})
+
+        if request.url.host == httpx.URL(DOWNLOAD_BASE_URL).host:
+            if request.headers.get("host") != request.url.netloc.decode():
+                return httpx.Response(421, json={"message": "Misdirected Request"})
+            return self._download(request, path.removeprefix("/dl/"))
+
+        route = self._routes().get(endpoint)
+        if route is None:
+            return httpx.Response(404, json={"message": "Not Found"})
+        if endpoint != "/web/login" and not self._authorized(request):
+            return httpx.Response(401, json={"message": "Unauthenticated."})
+
+        request.read()
+        with self._lock:
+            status, body = route(request)
+        return httpx.Response(status, json=body)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """Serve the fake API over HTTP from a background thread."""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self):
+                length = int(self.headers.get("content-length") or 0)
+                request = httpx.Request(
+                    self.command,
+                    f"{Constants.API_BASE_URL.removesuffix('/api')}{self.path}",
+                    headers=dict(self.headers),
+                    content=self.rfile.read(length),
+                )
+                try:
+                    response = fake.handle_request(request)
+                except httpx.TimeoutException:
+                    self.close_connection = True
+                    return
+                content = response.read()
+                self.send_response(response.status_code)
+                for key, value in response.headers.items():
+                    if key.lower() != "content-length":
+                        self.send_header(key, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = _handle
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    # --------------------------------------------------------------- handlers
+
+    def _routes(self):
+        return {
+            "/web/login": self._login,
+            "/file-manager": self._file_manager,
+            "/app/seedbox/torrent/add": self._torrent_add,
+            "/app/seedbox/torrent/upload": self._torrent_upload,
+            "/app/seedbox/torrent/list": self._torrent_list,
+            "/app/seedbox/torrent/details": self._torrent_details,
+            "/app/seedbox/torrent/delete": self._torrent_delete,
+            "/remote_download/task/add": self._task_add,
+            "/remote_download/task/list": self._task_list,
+            "/remote_download/task/delete": self._task_delete,
+            "/get/user/details": self._user_details,
+            "/get/user/storage_details": self._storage_details,
+            "/user/drive/clear": self._clear_storage,
+        }
+
+    def _login(self, request):
+        data = json.loads(request.content or b"{}")
+        email = data.get("email")
+        if email is None or self._accounts.get(email) != data.get("password"):
+            return 200, {"error": "invalid_credentials", "msg": "Invalid login"}
+        token = hashlib.sha1(f"{email}{self._random.random()}".encode()).hexdigest()
+        self._tokens[token] = email
+        return 200, {
+            "success": {
+                "token": token,
+                "session": token[:16],
+                "require_2fa_verification": False,
+            }
+        }
+
+    def _file_manager(self, request):
+        if request.method == "GET":
+            fields = {k: v[0] for k, v in parse_qs(request.url.query.decode()).items()}
+        else:
+            fields = {k: v[0] for k, v in parse_qs(request.content.decode()).items()}
+        arguments = json.loads(fields.get("arguments", "{}"))
+        path_info = arguments.get("pathInfo") or []
+        key = path_info[-1]["key"] if path_info else ""
+
+        if fields.get("command") == "GetDirContents":
+            entries = self._directories.get(key, {})
+            return 200, {"result": list(entries.values())}
+        if fields.get("command") == "Remove":
+            return 200, {"success": self._remove_entry(key)}
+        return 200, {"success": False, "msg": "Unknown command"}
+
+    def _torrent_add(self, request):
+        uris = request.url.params.get_list("url_list[]")
+        added = []
+        for index, uri in enumerate(uris):
+            info_hash = magnet_infohash(uri) or hashlib.sha1(uri.encode()).hexdigest()
+            info_hash = info_hash.upper()
+            if info_hash not in self._torrents:
+                names = parse_qs(urlsplit(uri).query).get("dn")
+                name = names[0] if names else uri.rsplit("/", 1)[-1]
+                self._add_torrent(info_hash, name, 0, 1)
+                added.append(index)
+        return 200, {"success": bool(added), "added": added, "msg": ""}
+
+    def _torrent_upload(self, request):
+        header = f"Content-Type: {request.headers['content-type']}\r\n\r\n"
+        message = BytesParser(policy=HTTP).parsebytes(header.encode() + request.content)
+        fields = {
+            part.get_param("name", header="content-disposition"): part
+            for part in message.iter_parts()
+        }
+        try:
+            info_hash = torrent_infohash(fields["file"].get_payload(decode=True))
+        except Exception:
+            return 200, {"success": False, "msg": "Invalid torrent file"}
+        if info_hash in self._torrents:
+            return 200, {"success": False, "msg": "Torrent already exists"}
+        name = fields["name"].get_payload(decode=True).decode()
+        self._add_torrent(info_hash, name.removesuffix(".torrent"), 0, 1)
+        return 200, {"success": True, "msg": ""}
+
+    def _torrent_list(self, request):
+        used = sum(int(t["sizeBytes"]) for t in self._torrents.values())
+        return 200, {
+            "list": self._torrents,
+            "info": {
+                "downloadRate": "0",
+                "uploadRate": "0",
+                "sizeByteTotal": str(used),
+                "sizeByteLimit": str(self.storage_limit),
+                "percent": str(round(used * 100 / self.storage_limit, 2)),
+                "max_prallel": str(self.max_parallel),
+                "email": next(iter(self._accounts), ""),
+                "userftp": "ftp.fake.sonicbit.invalid",
+                "package": "Fake",
+                "seedbox_status_up": True,
+                "hash_list": list(self._torrents),
+            },
+        }
+
+    def _torrent_details(self, request):
+        files = self._torrent_files.get(request.url.params.get("hash", ""))
+        if files is None:
+            return 200, {"message": "Torrent not found"}
+        return 200, files
+
+    def _torrent_delete(self, request):
+        result = {}
+        for info_hash in request.url.params.get_list("hash_list[]"):
+            result[info_hash] = self._torrents.pop(info_hash, None) is not None
+            self._torrent_files.pop(info_hash, None)
+        return 200, result
+
+    def _task_add(self, request):
+        data = json.loads(request.content)
+        self._add_task(data["url"], data.get("path", "").strip("/"))
+        return 200, {"success": True}
+
+    def _task_list(self, request):
+        return 200, {"success": True, "tasks": list(self._tasks.values())}
+
+    def _task_delete(self, request):
+        task_id = json.loads(request.content).get("task_id")
+        if self._tasks.pop(task_id, None) is None:
+            return 200, {"success": False, "msg": "Task not found"}
+        return 200, {"success": True}
+
+    def _user_details(self, request):
+        email = self._tokens.get(self._bearer(request), "")
+        return 200, {
+            "user_data": {
+                "id": 1,
+                "displayName": email.split("@")[0],
+                "useremail": email,
+                "member_since": "01 Jan 2024",
+                "acc_is_premium": 1,
+                "username": email.split("@")[0],
+                "is_pending": 0,
+                "is_suspended": 0,
+                "sizeByteLimit": self.storage_limit,
+                "sizeByteLimitFile": self.storage_limit,
+                "plan_id": 1,
+                "accpackage": "Fake",
+                "max_parallel": self.max_parallel,
+                "plan_type_support_public": True,
+                "plan_type_support_private": True,
+                "days_left": None,
+                "dlserver": DOWNLOAD_BASE_URL,
+                "ftpserver": "ftp.fake.sonicbit.invalid",
+                "server_prefix": "fake",
+                "seedbox_restart_limit": 3,
+                "require_pass_change": 0,
+                "apps": [],
+            }
+        }
+
+    def _storage_details(self, request):
+        used = sum(int(t["sizeBytes"]) for t in self._torrents.values())
+        return 200, {
+            "data": {
+                "sizeByteTotal": used,
+                "sizeByteLimit": self.storage_limit,
+                "setStorageleft": max(self.storage_limit - used, 0),
+                "percent": round(used * 100 / self.storage_limit, 2),
+                "max_prallel": self.max_parallel,
+                "showNotice": False,
+            }
+        }
+
+    def _clear_storage(self, request):
+        self._torrents.clear()
+        self._torrent_files.clear()
+        self._directories = {"": {}}
+        return 200, {"success": True}
+
+    def _download(self, request: httpx.Request, key: str) -> httpx.Response:
+        with self._lock:
+            entry = self._find_entry(key)
+        if entry is None:
+            return httpx.Response(404)
+        size = entry["size"] if "size" in entry else entry["sizeBytes"]
+        start, end = 0, size - 1
+        status = 200
+        if range_header := request.headers.get("range"):
+            first, _, last = range_header.removeprefix("bytes=").partition("-")
+            start = int(first) if first else max(size - int(last), 0)
+            end = min(int(last), size - 1) if first and last else size - 1
+            status = 206
+        pattern = hashlib.sha256(key.encode()).digest()
+        block = pattern * (1 + (end - start + 1) // len(pattern) + 1)
+        offset = start % len(pattern)
+        content = block[offset : offset + end - start + 1]
+        headers = {"accept-ranges": "bytes"}
+        if status == 206:
+            headers["content-range"] = f"bytes {start}-{end}/{size}"
+        return httpx.Response(status, content=content, headers=headers)
+
+    # ---------------------------------------------------------------- helpers
+
+    def _sleep(self) -> None:
+        delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _take_fault(self, endpoint: str) -> int | str | None:
+        with self._lock:
+            for index, (error, fault_endpoint) in enumerate(self._faults):
+                if fault_endpoint in (None, endpoint):
+                    del self._faults[index]
+                    return error
+            for error, rate in self.error_rates.items():
+                if self._random.random() < rate:
+                    return error
+        return None
+
+    @staticmethod
+    def _bearer(request: httpx.Request) -> str:
+        return request.headers.get("authorization", "").removeprefix("Bearer ")
+
+    def _authorized(self, request: httpx.Request) -> bool:
+        with self._lock:
+            return self._bearer(request) in self._tokens
+
+    def _add_torrent(
+        self,
+        info_hash: str,
+        name: str,
+        progress: int,
+        files: int,
+        size: int | None = None,
+    ):
+        if size is None:
+            size = (1 + int(info_hash[:6], 16) % 4096) << 20
+        self._torrents[info_hash] = {
+            "name": name,
+            "hash": info_hash,
+            "sizeBytes": str(size),
+            "percentComplete": str(progress),
+            "dlRateValue": "0" if progress == 100 else "1.5",
+            "dlRateUnit": "MB/s",
+            "upRateValue": "N/A",
+            "uploadRateUnit": None,
+            "peersStatus": "0 (0)",
+            "seedsStatus": "0 (0)",
+            "t_added": str(int(time.time())),
+            "isMultiFile": "1" if files > 1 else "0",
+            "status": ["seeding"] if progress == 100 else ["downloading"],
+            "isPrivate": "Public",
+            "in_cache": False,
+        }
+        directory = f"Torrents/{name}"
+        self._torrent_files[info_hash] = [
+            {
+                "filename": f"{name}-{index}.bin",
+                "sizeBytes": size // files,
+                "tor_path": f"{name}/{name}-{index}.bin",
+                "name": name,
+                "mydrive_path": f"{directory}/{name}-{index}.bin",
+                "percentComplete": progress,
+                "ext": "bin",
+                "priority": 1,
+                "index": index,
+                "dl_url": f"{DOWNLOAD_BASE_URL}/{directory}/{name}-{index}.bin",
+                "hash_code": info_hash,
+            }
+            for index in range(files)
+        ]
+        if progress == 100:
+            self._ensure_directory(directory)
+            for file_data in self._torrent_files[info_hash]:
+                self._add_entry(
+                    directory, file_data["filename"], file_data["sizeBytes"]
+                )
+
+    def _add_task(self, url: str, directory: str) -> None:
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        self._tasks[task_id] = {
+            "id": task_id,
+            "name": url.rsplit("/", 1)[-1],
+            "url": url,
+            "mime_type": "application/octet-stream",
+            "download_dir": directory,
+            "log_file_md5": hashlib.md5(url.encode()).hexdigest(),
+            "error": None,
+            "percent": 0,
+            "added": int(time.time()),
+            "isQueue": 1,
+        }
+
+    def _populate_files(self, count, directory, size, subdirectories, depth):
+        self._ensure_directory(directory)
+        for i in range(count):
+            self._add_entry(directory, f"file-{i:06d}.bin", size)
+        if depth <= 0:
+            return
+        for i in range(subdirectories):
+            child = f"{directory}/dir-{i:03d}".lstrip("/")
+            self._populate_files(count, child, size, subdirectories, depth - 1)
+
+    def _ensure_directory(self, key: str) -> None:
+        if key in self._directories:
+            return
+        parent, _, name = key.rpartition("/")
+        self._ensure_directory(parent)
+        self._directories[key] = {}
+        self._directories[parent][name] = self._entry(key, name, 0, True)
+
+    def _add_entry(self, directory: str, name: str, size: int) -> None:
+        key = f"{directory}/{name}".lstrip("/")
+        self._directories[directory][name] = self._entry(key, name, size, False)
+
+    def _entry(self, key: str, name: str, size: int, is_directory: bool) -> dict:
+        parts = key.split("/")
+        now = int(time.time())
+        return {
+            "name": name,
+            "size": size,
+            "path": f"/{key}",
+            "drive_path": f"/My Drive/{key}",
+            "data_drive_path": [
+                {"key": "/".join(parts[: i + 1]), "name": parts[i]}
+                for i in range(len(parts))
+            ],
+            "dlurl": f"{DOWNLOAD_BASE_URL}/{key}",
+            "diff_minutes": 0,
+            "dateModified": time.strftime("%Y-%m-%d %H:%M", time.gmtime(now)),
+            "dateModifiedTS": now - self._random.randint(0, 90 * 86400),
+            "isDirectory": is_directory,
+            "isRemoteDriveDir": False,
+        }
+
+    def _find_entry(self, key: str) -> dict | None:
+        parent, _, name = key.rpartition("/")
+        return self._directories.get(parent, {}).get(name)
+
+    def _remove_entry(self, key: str) -> bool:
+        parent, _, name = key.rpartition("/")
+        if self._directories.get(parent, {}).pop(name, None) is None:
+            return False
+        for directory in [d for d in self._directories if d.startswith(f"{key}/")]:
+            del self._directories[directory]
+        self._directories.pop(key, None)
+        return True
@@ -0,0 +1,199 @@
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from typing import IO, Deque, Dict, List, Tuple
+
+import httpx
+
+from sonicbit.errors import SonicBitError
+
+SECRET_KEYS = {"password", "token", "session", "code"}
+SCRUBBED = "***"
+VOLATILE_PARAMS = {"_", "tzo"}  # see SonicBitBase.get_time_params
+DECODED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _scrub(value):
+    if isinstance(value, dict):
+        return {
+            key: SCRUBBED if key in SECRET_KEYS else _scrub(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_scrub(item) for item in value]
+    return value
+
+
+def _encode_body(content: bytes, content_type: str) -> dict:
+    if "json" in content_type or content[:1] in (b"{", b"["):
+        try:
+            return {"json": _scrub(json.loads(content))}
+        except ValueError:
+            pass
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(body: dict) -> bytes:
+    if "json" in body:
+        return json.dumps(body["json"], separators=(",", ":")).encode()
+    if "text" in body:
+        return body["text"].encode("utf-8")
+    return base64.b64decode(body.get("base64", ""))
+
+
+def _body_hash(request: httpx.Request) -> str:
+    """Hash of the scrubbed request body, so secrets never reach the file."""
+    content = request.read()
+    if not content:
+        return ""
+    body = _encode_body(content, request.headers.get("content-type", ""))
+    return hashlib.sha1(_decode_body(body)).hexdigest()
+
+
+def _request_key(method: str, url: httpx.URL, body_hash: str) -> Tuple[str, ...]:
+    params = sorted(
+        (key, value)
+        for key, value in url.params.multi_items()
+        if key not in VOLATILE_PARAMS
+    )
+    return method, url.path, json.dumps(params), body_hash
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport that records every exchange to a JSON-lines file.
+
+    Pass it as ``SonicBit(transport=...)``. Authorization headers and cookies
+    are never written, and JSON values under ``password``, ``token``,
+    ``session`` and ``code`` keys are replaced in both directions. Paths
+    ending in ``.gz`` are gzip-compressed.
+    """
+
+    def __init__(self, path: str, transport: httpx.BaseTransport | None = None):
+        self.transport = transport or httpx.HTTPTransport(retries=2)
+        self._file = _open(path, "w")
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request_content = request.read()
+        started = time.monotonic()
+        response = self.transport.handle_request(request)
+        content = response.read()
+        elapsed = time.monotonic() - started
+
+        content_type = response.headers.get("content-type", "")
+        record = {
+            "at": round(started - self._started, 6),
+            "elapsed": round(elapsed, 6),
+            "method": request.method,
+            "url": str(request.url.copy_with(query=None)),
+            "params": request.url.params.multi_items(),
+            "request": _encode_body(
+                request_content, request.headers.get("content-type", "")
+            ),
+            "body_hash": _body_hash(request),
+            "status": response.status_code,
+            "content_type": content_type,
+            "response": _encode_body(content, content_type),
+        }
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+        # ``content`` is already decoded, so the framing headers of the
+        # original body no longer apply to it.
+        headers = [
+            (key, value)
+            for key, value in response.headers.multi_items()
+            if key.lower() not in DECODED_HEADERS
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+        self.transport.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Transport that serves exchanges captured by RecordingTransport.
+
+    In ``"sequential"`` mode responses are returned in recorded order no
+    matter what is requested. In ``"keyed"`` mode each request is matched by
+    method, path, query (ignoring the cache-busting time parameters) and
+    body, falling back to method and path. ``time_scale`` multiplies the
+    recorded server time that is slept before answering: 0 replays at full
+    speed, 1 in real time.
+    """
+
+    def __init__(self, path: str, mode: str = "keyed", time_scale: float = 0.0):
+        if mode not in ("sequential", "keyed"):
+            raise ValueError("mode must be 'sequential' or 'keyed'")
+        self.mode = mode
+        self.time_scale = time_scale
+        self._lock = threading.Lock()
+
+        with _open(path, "r") as f:
+            self.records: List[dict] = [json.loads(line) for line in f if line.strip()]
+        self._sequence: Deque[dict] = deque(self.records)
+        self._by_key: Dict[tuple, Deque[dict]] = defaultdict(deque)
+        self._by_path: Dict[tuple, Deque[dict]] = defaultdict(deque)
+        for record in self.records:
+            url = httpx.URL(record["url"], params=record["params"])
+            key = _request_key(record["method"], url, record["body_hash"])
+            self._by_key[key].append(record)
+            self._by_path[(record["method"], url.path)].append(record)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        record = self._next(request)
+        if self.time_scale > 0:
+            time.sleep(record["elapsed"] * self.time_scale)
+        return httpx.Response(
+            record["status"],
+            headers={"content-type": record["content_type"]},
+            content=_decode_body(record["response"]),
+            request=request,
+        )
+
+    def _next(self, request: httpx.Request) -> dict:
+        with self._lock:
+            if self.mode == "sequential":
+                if not self._sequence:
+                    raise SonicBitError("Replay exhausted: no recorded responses left")
+                return self._sequence.popleft()
+
+            key = _request_key(request.method, request.url, _body_hash(request))
+            for candidates in (
+                self._by_key.get(key),
+                self._by_path.get((request.method, request.url.path)),
+            ):
+                if candidates:
+                    record = candidates[0]
+                    # Keep the last response so repeated calls still resolve.
+                    if len(candidates) > 1:
+                        candidates.popleft()
+                    return record
+
+        raise SonicBitError(
+            f"No recorded response for {request.method} {request.url.path}"
+        )
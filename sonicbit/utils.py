@@ -0,0 +1,252 @@
+import base64
+import binascii
+import codecs
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Callable, Iterable, Iterator, List, Tuple, TypeVar
+from urllib.parse import parse_qs, quote_plus, urlsplit
+
+from sonicbit.errors import SonicBitError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(
+    items: Iterable[str],
+    max_items: int,
+    max_length: int | None = None,
+    param_name: str = "",
+) -> Iterator[List[str]]:
+    """Split items into chunks bounded by count and by encoded query length.
+
+    Each item costs ``len(param_name) + len(quote_plus(item)) + 2`` characters
+    of query string (``&name=value``), which is what httpx emits for list
+    parameters. An item that alone exceeds ``max_length`` is sent on its own.
+    """
+    chunk: List[str] = []
+    length = 0
+    for item in items:
+        cost = len(quote_plus(param_name)) + len(quote_plus(item)) + 2
+        if chunk and (
+            len(chunk) >= max_items
+            or (max_length is not None and length + cost > max_length)
+        ):
+            yield chunk
+            chunk, length = [], 0
+        chunk.append(item)
+        length += cost
+    if chunk:
+        yield chunk
+
+
+def run_concurrently(
+    func: Callable[[T], R], items: Iterable[T], concurrency: int
+) -> Iterator[Tuple[T, R | None, Exception | None]]:
+    """Run ``func`` over items with at most ``concurrency`` calls in flight.
+
+    Yields ``(item, result, error)`` tuples in completion order; exactly one
+    of ``result`` and ``error`` is meaningful for each item.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(func, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                yield item, future.result(), None
+            except Exception as error:
+                yield item, None, error
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write ``data`` as JSON to ``path`` in one step.
+
+    The JSON goes to a uniquely named temp file next to ``path``, which is
+    synced and then renamed over it, so neither concurrent writers, readers
+    nor a crash ever see a partial file.
+    """
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def magnet_infohash(uri: str) -> str | None:
+    """Return the upper-case hex v1 infohash of a magnet URI, if it has one."""
+    if not uri.startswith("magnet:?"):
+        return None
+
+    for value in parse_qs(urlsplit(uri).query).get("xt", []):
+        if not value.lower().startswith("urn:btih:"):
+            continue
+        digest = value[len("urn:btih:") :]
+        if len(digest) == 40:
+            return digest.upper()
+        if len(digest) == 32:
+            try:
+                return base64.b32decode(digest.upper()).hex().upper()
+            except binascii.Error:
+                return None
+    return None
+
+
+def torrent_infohash(data: bytes) -> str:
+    """Return the upper-case hex v1 infohash of a bencoded .torrent file."""
+    if data[:1] != b"d":
+        raise SonicBitError("Invalid torrent file: not a bencoded dictionary")
+
+    position = 1
+    try:
+        while data[position : position + 1] != b"e":
+            key_end = _bencode_skip(data, position)
+            key = data[data.index(b":", position) + 1 : key_end]
+            value_end = _bencode_skip(data, key_end)
+            if key == b"info":
+                return hashlib.sha1(data[key_end:value_end]).hexdigest().upper()
+            position = value_end
+    except (ValueError, IndexError):
+        raise SonicBitError("Invalid torrent file: malformed bencoding") from None
+
+    raise SonicBitError("Invalid torrent file: missing 'info' dictionary")
+
+
+def _bencode_skip(data: bytes, position: int) -> int:
+    """Return the offset just past the bencoded value starting at position.
+
+    Containers are tracked with a depth counter rather than recursion, so
+    deeply nested input fails with ValueError, not RecursionError.
+    """
+    depth = 0
+    while True:
+        token = data[position : position + 1]
+        if token in (b"l", b"d"):
+            depth += 1
+            position += 1
+        elif token == b"e" and depth:
+            depth -= 1
+            position += 1
+        elif token == b"i":
+            position = data.index(b"e", position) + 1
+        elif token.isdigit():
+            colon = data.index(b":", position)
+            position = colon + 1 + int(data[position:colon])
+            if position > len(data):
+                raise ValueError("Truncated bencoded string")
+        elif not token:
+            raise ValueError("Unterminated bencoded value")
+        else:
+            raise ValueError(f"Invalid bencode token at offset {position}")
+        if depth == 0:
+            return position
+
+
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class _JSONStream:
+    """Incremental reader over a stream of UTF-8 encoded JSON bytes."""
+
+    _decoder = JSONDecoder()
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping everything already consumed."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        try:
+            if chunk is None:
+                self.eof = True
+                text = self._text.decode(b"", final=True)
+            else:
+                text = self._text.decode(chunk)
+        except UnicodeDecodeError as error:
+            raise JSONDecodeError(
+                f"Invalid UTF-8: {error.reason}", self.buffer, self.pos
+            ) from None
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or "" at the end."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def take(self, expected: str) -> str:
+        char = self.peek()
+        if not char or char not in expected:
+            raise JSONDecodeError(
+                f"Expected one of {expected!r}", self.buffer, self.pos
+            )
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number followed only by number characters, e.g. "1." of
+            # "1.5", may continue in the next chunk.
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and not self.buffer[end:].strip(_NUMBER_CHARS)
+                and self._fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """Yield the items of the array under ``key`` of a streamed JSON object.
+
+    Items are decoded one at a time as the bytes arrive, so memory is bounded
+    by the largest item rather than by the whole document. Yields nothing if
+    the object has no such key; raises JSONDecodeError on malformed input.
+    """
+    stream = _JSONStream(chunks)
+    stream.take("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        name = stream.value()
+        stream.take(":")
+        if name != key:
+            stream.value()
+        elif stream.take("[") and stream.peek() == "]":
+            stream.take("]")
+        else:
+            while True:
+                yield stream.value()
+                if stream.take(",]") == "]":
+                    break
+        if stream.take(",}") == "}":
+            return
@@ -0,0 +1,30 @@
+import hashlib
+import os
+import tempfile
+
+from sonicbit import SonicBit
+from sonicbit.handlers import TokenFileHandler
+from sonicbit.testing import FakeSonicBit
+
+EMAIL = "user@example.com"
+PASSWORD = "password"
+
+
+def make_client(fake: FakeSonicBit, **kwargs) -> SonicBit:
+    """Add the test account to ``fake`` and return a client connected to it,
+    with a token cache of its own."""
+    fake.add_account(EMAIL, PASSWORD)
+    token_path = os.path.join(tempfile.mkdtemp(), "token.cache")
+    return SonicBit(
+        EMAIL,
+        PASSWORD,
+        token_handler=TokenFileHandler(token_path),
+        transport=fake,
+        **kwargs,
+    )
+
+
+def magnet(name: str) -> str:
+    """A magnet URI whose infohash is derived from ``name``."""
+    info_hash = hashlib.sha1(name.encode()).hexdigest()
+    return f"magnet:?xt=urn:btih:{info_hash}&dn={name}"
@@ -0,0 +1,52 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from sonicbit import cli
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+
+class CliTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.client = make_client(self.fake)
+        self.fake.populate_files(3, directory="Downloads")
+
+    def run_cli(self, *argv: str):
+        stdout = io.StringIO()
+        with mock.patch.object(cli, "_client", lambda args: self.client):
+            with redirect_stdout(stdout):
+                status = cli.main(["--email", "e", "--password", "p", *argv])
+        return status, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def drive(self):
+        return [file.name for file in self.client.walk()]
+
+    def test_rm_refuses_the_root(self):
+        for argv in (["rm", "-r", "/"], ["rm", "/"]):
+            status, lines = self.run_cli(*argv)
+            self.assertEqual(status, 1)
+            self.assertFalse(lines[0]["success"])
+            self.assertIn("--no-preserve-root", lines[0]["error"])
+        self.assertEqual(len(self.drive()), 4)
+
+    def test_rm_root_with_override(self):
+        status, _ = self.run_cli("rm", "-r", "--no-preserve-root", "/")
+        self.assertEqual(status, 0)
+        self.assertEqual(self.drive(), [])
+
+    def test_remote_rm_reports_invalid_ids_per_item(self):
+        self.fake.populate_remote_tasks(1)
+        status, lines = self.run_cli("remote", "rm", "abc", "1")
+        results = {line["item"]: line for line in lines}
+        self.assertEqual(status, 1)
+        self.assertEqual(results["abc"]["error"], "Invalid task id: abc")
+        self.assertTrue(results["1"]["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
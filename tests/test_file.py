@@ -0,0 +1,73 @@
+import unittest
+
+from sonicbit.models import PathInfo
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+
+class DeleteFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.fake.populate_files(2, "data", size=1024, subdirectories=2, depth=2)
+        self.fake.populate_files(1, "keep", size=1024)
+        self.client = make_client(self.fake)
+
+    def names(self, path=PathInfo.root()):
+        return sorted(item.name for item in self.client.list_files(path).items)
+
+    def test_delete_files(self):
+        items = [
+            item
+            for item in self.client.list_files(PathInfo.from_path_key("data")).items
+            if item.name in ("dir-000", "file-000000.bin")
+        ]
+
+        result = self.client.delete_files(items)
+
+        self.assertEqual(
+            sorted(result.succeeded), ["/data/dir-000", "/data/file-000000.bin"]
+        )
+        self.assertEqual(
+            self.names(PathInfo.from_path_key("data")), ["dir-001", "file-000001.bin"]
+        )
+
+    def test_delete_tree(self):
+        data = PathInfo.from_path_key("data")
+        expected = ["/data"] + [item.path_info.path for item in self.client.walk(data)]
+
+        result = self.client.delete_tree(data, concurrency=4)
+
+        self.assertEqual(len(expected), 21)
+        self.assertEqual(sorted(result.succeeded), sorted(expected))
+        self.assertEqual(result.failed, {})
+        self.assertEqual(self.names(), ["keep"])
+
+    def test_delete_tree_keeps_the_root(self):
+        result = self.client.delete_tree(PathInfo.root())
+
+        self.assertNotIn("/", result.succeeded)
+        self.assertEqual(self.names(), [])
+
+    def test_failure_keeps_the_parents(self):
+        missing = PathInfo.from_path_key("data/dir-000/missing")
+        directory = next(
+            item
+            for item in self.client.list_files(PathInfo.from_path_key("data")).items
+            if item.name == "dir-000"
+        )
+
+        result = self.client.delete_files([missing, directory])
+
+        self.assertEqual(
+            result.failed,
+            {
+                "/data/dir-000/missing": "File was not deleted",
+                "/data/dir-000": "A path below it was not deleted",
+            },
+        )
+        self.assertIn("dir-000", self.names(PathInfo.from_path_key("data")))
+
+
+if __name__ == "__main__":
+    unittest.main()
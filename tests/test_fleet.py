@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+import httpx
+
+from sonicbit.fleet import connect_many
+from sonicbit.handlers import TokenFileHandler
+from sonicbit.testing import FakeSonicBit
+
+ACCOUNTS = {"a@example.com": "pw1", "b@example.com": "pw2"}
+
+
+class ClosableTransport(httpx.BaseTransport):
+    """Forwards to the fake and refuses requests once closed, like a pool."""
+
+    def __init__(self, fake: FakeSonicBit):
+        self.fake = fake
+        self.closed = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.closed:
+            raise RuntimeError("transport is closed")
+        return self.fake.handle_request(request)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FleetTest(unittest.TestCase):
+    def setUp(self):
+        fake = FakeSonicBit(seed=1)
+        for email, password in ACCOUNTS.items():
+            fake.add_account(email, password)
+        self.transport = ClosableTransport(fake)
+        token_path = os.path.join(tempfile.mkdtemp(), "token.cache")
+        self.fleet = connect_many(
+            ACCOUNTS,
+            token_handler=TokenFileHandler(token_path),
+            transport=self.transport,
+        )
+
+    def test_closing_one_client_keeps_the_pool_open(self):
+        self.assertEqual(sorted(self.fleet.clients), sorted(ACCOUNTS))
+        self.fleet.clients["a@example.com"].session.close()
+
+        self.fleet.clients["b@example.com"].list_torrents()
+        self.assertFalse(self.transport.closed)
+
+    def test_fleet_close_shuts_down_the_pool(self):
+        with self.fleet:
+            pass
+        self.assertTrue(self.transport.closed)
+
+    def test_limits_with_transport_raise(self):
+        with self.assertRaises(ValueError):
+            connect_many(ACCOUNTS, transport=self.transport, limits=httpx.Limits())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sonicbit.index import AccountIndex
+from sonicbit.models import PathInfo
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+LIST = "/app/seedbox/torrent/list"
+
+
+class AccountIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.fakes = {"a": FakeSonicBit(seed=1), "b": FakeSonicBit(seed=2)}
+        self.hashes = {
+            "a": self.fakes["a"].populate_torrents(2, completed=0, size=1024),
+            "b": self.fakes["b"].populate_torrents(3, completed=0, size=1024),
+        }
+        self.fakes["a"].populate_files(2, "data", size=10, subdirectories=1)
+        self.fakes["b"].populate_files(1, "data", size=20)
+        self.clients = {email: make_client(fake) for email, fake in self.fakes.items()}
+        self.path = os.path.join(tempfile.mkdtemp(), "index.json")
+        self.index = AccountIndex(self.path)
+
+    def test_torrents(self):
+        for email, client in self.clients.items():
+            self.index.update_torrents(email, client.list_torrents())
+        shared = self.hashes["a"][0]
+
+        self.assertEqual(self.index.accounts_with_hash(shared.lower()), ["a", "b"])
+        self.assertEqual(self.index.accounts_with_hash(self.hashes["b"][2]), ["b"])
+        self.assertEqual(self.index.missing_hashes(["0" * 40, shared]), ["0" * 40])
+
+        self.clients["b"].delete_torrent(shared)
+        self.index.update_torrents("b", self.clients["b"].list_torrents())
+        self.assertEqual(self.index.accounts_with_hash(shared), ["a"])
+
+        self.index.remove_account("a")
+        self.assertEqual(self.index.missing_hashes([shared]), [shared])
+
+    def test_files(self):
+        self.assertEqual(self.index.crawl("a", self.clients["a"]), 4)
+        self.index.crawl("b", self.clients["b"])
+
+        found = self.index.find_files(name="file-000000.bin")
+        self.assertEqual(
+            sorted((f.email, f.path_info.path) for f in found),
+            [
+                ("a", "/data/dir-000/file-000000.bin"),
+                ("a", "/data/file-000000.bin"),
+                ("b", "/data/file-000000.bin"),
+            ],
+        )
+        self.assertEqual(len(self.index.find_files(size=10)), 4)
+        self.assertEqual(
+            [f.email for f in self.index.find_files("file-000000.bin", 20)], ["b"]
+        )
+        with self.assertRaises(ValueError):
+            self.index.find_files()
+
+        # Re-crawling a directory only replaces the files below it.
+        self.clients["a"].delete_tree(PathInfo.from_path_key("data/dir-000"))
+        self.index.crawl("a", self.clients["a"], PathInfo.from_path_key("data/dir-000"))
+        self.assertEqual(len(self.index.find_files(size=10)), 2)
+
+    def test_refresh_saves_and_loads(self):
+        self.fakes["b"].fail("timeout", times=10, endpoint=LIST)
+        with mock.patch("sonicbit.profiling.backoff_sleep"):
+            result = self.index.refresh(self.clients, files=True)
+
+        self.assertEqual(result.succeeded, ["a"])
+        self.assertEqual(list(result.failed), ["b"])
+
+        loaded = AccountIndex(self.path)
+        self.assertEqual(loaded.accounts_with_hash(self.hashes["a"][1]), ["a"])
+        self.assertEqual(loaded.missing_hashes(self.hashes["b"]), self.hashes["b"][2:])
+        self.assertEqual(
+            sorted(f.path_info.path for f in loaded.find_files(size=10)),
+            sorted(f.path_info.path for f in self.index.find_files(size=10)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
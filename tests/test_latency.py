@@ -0,0 +1,61 @@
+import unittest
+from unittest import mock
+
+import httpx
+
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+LIST_FILES = "/file-manager:GetDirContents"
+
+
+class DelayedTransport(httpx.BaseTransport):
+    """Times out file manager requests whose read timeout is below ``delay``,
+    without actually waiting."""
+
+    def __init__(self, fake: FakeSonicBit):
+        self.fake = fake
+        self.delay = 0.0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        timeout = request.extensions["timeout"]["read"]
+        if request.url.path.endswith("/file-manager") and self.delay > timeout:
+            raise httpx.ReadTimeout("Simulated timeout", request=request)
+        return self.fake.handle_request(request)
+
+
+class AdaptiveTimeoutTest(unittest.TestCase):
+    def setUp(self):
+        fake = FakeSonicBit(seed=1)
+        self.client = make_client(fake)
+        self.transport = DelayedTransport(fake)
+        self.client.session._transport = self.transport
+        self.client.adaptive_timeouts = True
+        patcher = mock.patch("sonicbit.profiling.backoff_sleep")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def timeout(self, key: str) -> float | None:
+        return self.client.latency_tracker.timeout_for(key, self.client.REQUEST_TIMEOUT)
+
+    def test_timeout_grows_when_the_endpoint_slows_down(self):
+        for _ in range(25):
+            self.client.list_files()
+        self.assertEqual(self.timeout(LIST_FILES), 1.0)
+
+        self.transport.delay = 1.3
+        self.client.list_files()
+
+        self.assertGreater(self.timeout(LIST_FILES), 1.3)
+
+    def test_windows_are_kept_per_command(self):
+        for _ in range(25):
+            self.client.list_files()
+        self.assertIsNotNone(self.timeout(LIST_FILES))
+        self.assertIsNone(self.timeout("/file-manager:Remove"))
+        self.assertIsNone(self.timeout("/file-manager"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sonicbit.metrics import MetricsCollector
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+LIST = "/app/seedbox/torrent/list"
+UPLOAD = "/app/seedbox/torrent/upload"
+
+
+class MetricsCollectorTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.metrics = MetricsCollector()
+        self.client = make_client(self.fake, hooks=[self.metrics])
+        patcher = mock.patch("sonicbit.profiling.backoff_sleep")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_requests_statuses_and_bytes(self):
+        self.fake.populate_torrents(3, size=1024)
+        self.client.list_torrents()
+        self.client.list_torrents()
+
+        snapshot = self.metrics.snapshot()
+        (requests,) = [r for r in snapshot["requests"] if r["endpoint"] == LIST]
+        self.assertEqual(requests["count"], 2)
+        self.assertEqual(requests["latency_buckets"]["+Inf"], 2)
+        self.assertIn(
+            {"method": "POST", "endpoint": LIST, "status": "200", "count": 2},
+            snapshot["status"],
+        )
+        self.assertEqual(snapshot["parse"][LIST]["count"], 2)
+
+    def test_upload_bytes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "a.torrent")
+            with open(path, "wb") as file:
+                file.write(b"d4:infod6:lengthi1e4:name1:aee")
+            self.client.add_torrent_file(path)
+
+        self.assertGreater(self.metrics.snapshot()["bytes_sent"][UPLOAD], 0)
+
+    def test_retries_and_token_refreshes(self):
+        self.fake.fail("timeout", endpoint=LIST)
+        self.client.list_torrents()
+        self.fake.fail(401, endpoint=LIST)
+        self.client.list_torrents()
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["retries"], {LIST: 1})
+        self.assertEqual(snapshot["token_refreshes"], {LIST: 1})
+
+    def test_cache_lookups(self):
+        self.client.known_torrent_hashes()
+        self.client.known_torrent_hashes()
+
+        self.assertEqual(
+            self.metrics.snapshot()["cache"],
+            {"torrent_hashes:miss": 1, "torrent_hashes:hit": 1},
+        )
+
+    def test_prometheus_and_reset(self):
+        self.client.list_torrents()
+
+        text = self.metrics.to_prometheus()
+        self.assertIn(
+            f'sonicbit_request_duration_seconds_count{{method="POST",endpoint="{LIST}"}} 1',
+            text,
+        )
+        self.assertIn("# TYPE sonicbit_responses_total counter", text)
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot()["requests"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
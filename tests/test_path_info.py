@@ -0,0 +1,26 @@
+import pickle
+import unittest
+
+from sonicbit.models import PathInfo
+
+SEGMENTS = [{"key": "a", "name": "a"}, {"key": "a/b", "name": "b"}]
+
+
+class PathInfoTest(unittest.TestCase):
+    def test_pickle_round_trip(self):
+        for path_info in (PathInfo.root(), PathInfo.from_list(SEGMENTS)):
+            loaded = pickle.loads(pickle.dumps(path_info))
+            self.assertEqual(loaded.serialized, path_info.serialized)
+            self.assertEqual(loaded.path, path_info.path)
+            # Loading interns the segments into the shared trie again.
+            self.assertIs(loaded.node, path_info.node)
+
+    def test_shared_prefixes(self):
+        parent = PathInfo.from_list(SEGMENTS[:1])
+        child = PathInfo.from_list(SEGMENTS)
+        self.assertIs(child.node.parent, parent.node)
+        self.assertEqual(child.path, "/a/b")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from sonicbit.pipeline import TransferPipeline
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+
+class TransferPipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.client = make_client(self.fake)
+        directory = tempfile.mkdtemp()
+        self.destination = os.path.join(directory, "downloads")
+        self.pipeline = TransferPipeline(
+            self.client, self.destination, os.path.join(directory, "state.json")
+        )
+
+    def test_downloads_verifies_and_deletes(self):
+        hashes = self.fake.populate_torrents(
+            2, files_per_torrent=2, completed=1, size=4096
+        )
+
+        result = self.pipeline.run_once()
+
+        self.assertEqual(sorted(result.succeeded), sorted(hashes))
+        self.assertEqual(self.client.list_torrents().torrents, {})
+        self.assertEqual(len(os.listdir(self.destination)), 2)
+
+    def test_cleanup_sends_the_hash_as_listed(self):
+        info_hash = "ab" * 20  # a server that lists lower-case hashes
+        self.fake._add_torrent(info_hash, "lower", 100, 1, size=4096)
+
+        result = self.pipeline.run_once()
+
+        self.assertEqual(result.succeeded, [info_hash.upper()])
+        self.assertEqual(self.client.list_torrents().torrents, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
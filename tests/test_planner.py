@@ -0,0 +1,28 @@
+import unittest
+
+from sonicbit.planner import StoragePlanner
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+
+class StoragePlannerTest(unittest.TestCase):
+    def setUp(self):
+        fake = FakeSonicBit(seed=1)
+        (self.hash,) = fake.populate_torrents(1, files_per_torrent=2, completed=1)
+        # A folder named like the torrent that is not its data.
+        fake.populate_files(1, directory="Backups/torrent-000000")
+        self.planner = StoragePlanner(make_client(fake))
+
+    def test_only_torrent_data_is_left_to_the_torrent(self):
+        plan = self.planner.plan(1 << 60)
+
+        self.assertEqual(plan.torrent_hashes, [self.hash])
+        self.assertEqual(
+            [item.key for item in plan.files],
+            ["/Backups/torrent-000000/file-000000.bin"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from sonicbit import SonicBit, profiling
+from sonicbit.constants import Constants
+from sonicbit.handlers import TokenFileHandler
+from sonicbit.testing import FakeSonicBit
+
+from . import EMAIL, PASSWORD, make_client
+
+LIST = "/app/seedbox/torrent/list"
+
+
+class ProfilingTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.fake.populate_torrents(3, size=1024)
+        self.client = make_client(self.fake)
+        self.client.list_torrents()  # log in outside the profiled block
+
+    def test_nothing_is_recorded_outside_a_block(self):
+        with profiling.profile() as profiler:
+            pass
+        self.client.list_torrents()
+
+        self.assertIsNone(profiling.active())
+        self.assertEqual(profiler.report(), {})
+
+    def test_parse_phases(self):
+        with profiling.profile() as profiler:
+            self.client.list_torrents()
+            self.client.list_torrents()
+
+        entry = profiler.report()[LIST]
+        self.assertEqual(entry["calls"], 2)
+        self.assertGreater(entry["phases"]["json"], 0)
+        self.assertGreater(entry["phases"]["models"], 0)
+        self.assertGreaterEqual(
+            entry["wall"], entry["phases"]["json"] + entry["phases"]["models"]
+        )
+        self.assertIn(LIST, profiler.format_report())
+
+    def test_backoff_and_auth(self):
+        self.fake.fail("timeout", endpoint=LIST)
+        self.fake.expire_tokens()
+        with (
+            mock.patch("sonicbit.profiling.sleep", lambda _: time.sleep(0.01)),
+            profiling.profile() as profiler,
+        ):
+            self.client.list_torrents()
+
+        report = profiler.report()
+        self.assertEqual(list(report), [LIST])  # the login is folded in
+        self.assertEqual(report[LIST]["calls"], 1)
+        self.assertGreaterEqual(report[LIST]["phases"]["backoff"], 0.01)
+        self.assertGreater(report[LIST]["phases"]["auth"], 0)
+
+    def test_network_phases_over_http(self):
+        server = self.fake.serve()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        host, port = server.server_address
+        with mock.patch.object(Constants, "API_BASE_URL", f"http://{host}:{port}/api"):
+            client = SonicBit(
+                EMAIL,
+                PASSWORD,
+                token_handler=TokenFileHandler(
+                    os.path.join(tempfile.mkdtemp(), "token.cache")
+                ),
+            )
+            self.addCleanup(client.session.close)
+            with profiling.profile() as profiler:
+                client.list_torrents()
+
+        phases = profiler.report()[LIST]["phases"]
+        for name in ("send", "server", "receive"):
+            self.assertGreater(phases[name], 0, name)
+
+    def test_dump(self):
+        with profiling.profile(cprofile=True) as profiler:
+            self.client.list_torrents()
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = profiler.dump(directory)
+            self.assertEqual(
+                sorted(os.path.basename(path) for path in paths),
+                ["app_seedbox_torrent_list.pstats", "report.json"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+
+from sonicbit.proxy import RangeProxy
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+CHUNK = 1 << 10
+FILE = "/drive/Downloads/file-000000.bin"
+
+
+class RangeProxyTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.fake.populate_files(2, directory="Downloads", size=3 * CHUNK)
+        self.client = make_client(self.fake)
+        self.proxy = RangeProxy(
+            self.client, tempfile.mkdtemp(), chunk_size=CHUNK, read_ahead=0
+        )
+        self.server = self.proxy.serve()
+        self.server.handle_error = mock.Mock()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def get(self, path: str, **headers) -> httpx.Response:
+        return httpx.get(self.proxy.base_url + path, headers=headers)
+
+    def test_drive_paths_are_listed_once(self):
+        with mock.patch.object(
+            self.client, "list_files", wraps=self.client.list_files
+        ) as list_files:
+            for _ in range(3):
+                self.assertEqual(len(self.get(FILE, range="bytes=0-9").content), 10)
+            self.assertEqual(self.get(FILE.replace("0.bin", "1.bin")).status_code, 200)
+            self.assertEqual(self.get("/drive/Downloads/missing").status_code, 404)
+        self.assertEqual(list_files.call_count, 2)
+
+    def test_upstream_failure_after_headers_closes_the_connection(self):
+        self.assertEqual(self.get(FILE, range="bytes=0-9").status_code, 206)
+        self.fake.fail(500, times=10, endpoint="/dl/Downloads/file-000000.bin")
+
+        with self.assertLogs("sonicbit.proxy", "WARNING"):
+            with self.assertRaises(httpx.RemoteProtocolError):
+                self.get(FILE)
+        self.server.handle_error.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+
+from sonicbit.errors import CircuitOpenError
+from sonicbit.rate_limit import CircuitBreaker, RateLimiter, TokenBucket
+
+FILES = "/file-manager"
+TORRENTS = "/app/seedbox/torrent/list"
+
+
+class FakeClock:
+    """A monotonic clock that only moves when slept on or advanced."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def bucket(self, rate: float = 2, burst: int = 3) -> TokenBucket:
+        return TokenBucket(rate, burst, self.clock, self.clock.sleep)
+
+    def test_burst_then_rate(self):
+        bucket = self.bucket()
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5])
+
+    def test_refills_up_to_burst(self):
+        bucket = self.bucket()
+        bucket.acquire()
+        self.clock.now += 60
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5])
+
+    def test_pause(self):
+        bucket = self.bucket()
+        bucket.pause(5)
+        bucket.acquire()
+        self.assertEqual(self.clock.now, 5)
+
+    def test_validates_rate_and_burst(self):
+        with self.assertRaises(ValueError):
+            self.bucket(rate=0)
+        with self.assertRaises(ValueError):
+            self.bucket(burst=0)
+
+
+class RateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def limiter(self, **kwargs) -> RateLimiter:
+        return RateLimiter(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_throttled_honours_retry_after(self):
+        limiter = self.limiter(rates={"file_manager": (100, 100)})
+        limiter.throttled(FILES, 7)
+        limiter.acquire(FILES)
+        self.assertEqual(self.clock.now, 7)
+
+    def test_throttled_defaults_to_throttle_pause(self):
+        limiter = self.limiter(rates={"file_manager": (100, 100)}, throttle_pause=3)
+        limiter.throttled(FILES)
+        limiter.acquire(FILES)
+        self.assertEqual(self.clock.now, 3)
+
+    def test_throttled_pauses_only_its_family(self):
+        limiter = self.limiter(
+            rates={"file_manager": (100, 100), "torrent": (100, 100)}
+        )
+        limiter.throttled(FILES, 7)
+        limiter.acquire(TORRENTS)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_throttled_falls_back_to_the_account_bucket(self):
+        limiter = self.limiter(account=(100, 100), rates={"torrent": (100, 100)})
+        limiter.throttled(FILES, 7)
+        limiter.acquire(TORRENTS)
+        self.assertEqual(self.clock.now, 7)
+
+    def test_without_buckets(self):
+        limiter = self.limiter()
+        limiter.throttled(FILES, 7)
+        limiter.acquire(FILES)
+        self.assertEqual(self.clock.sleeps, [])
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            failure_threshold=3, reset_timeout=30, clock=self.clock
+        )
+
+    def fail(self, times: int, endpoint: str = FILES) -> None:
+        for _ in range(times):
+            self.breaker.before(endpoint)
+            self.breaker.record(endpoint, False)
+
+    def test_opens_after_consecutive_failures(self):
+        self.fail(2)
+        self.breaker.record(FILES, True)
+        self.fail(2)
+        self.assertEqual(self.breaker.state(FILES), CircuitBreaker.CLOSED)
+
+        self.fail(1)
+        self.assertEqual(self.breaker.state(FILES), CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before(FILES)
+        self.breaker.before(TORRENTS)  # other families stay closed
+
+    def test_half_open_lets_a_single_trial_through(self):
+        self.fail(3)
+        self.clock.now += 30
+        self.assertEqual(self.breaker.state(FILES), CircuitBreaker.HALF_OPEN)
+
+        self.breaker.before(FILES)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before(FILES)
+
+    def test_successful_trial_closes(self):
+        self.fail(3)
+        self.clock.now += 30
+        self.breaker.before(FILES)
+        self.breaker.record(FILES, True)
+        self.assertEqual(self.breaker.state(FILES), CircuitBreaker.CLOSED)
+        self.breaker.before(FILES)
+
+    def test_failed_trial_reopens(self):
+        self.fail(3)
+        self.clock.now += 30
+        self.breaker.before(FILES)
+        self.breaker.record(FILES, False)
+        self.assertEqual(self.breaker.state(FILES), CircuitBreaker.OPEN)
+
+        self.clock.now += 30
+        self.breaker.before(FILES)  # a new trial after another timeout
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+import httpx
+
+from sonicbit.testing import RecordingTransport, ReplayTransport
+
+
+class RecordingTransportTest(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "exchanges.jsonl")
+
+    def test_gzip_response_is_recorded_and_replayed(self):
+        body = b'{"success":true,"list":[1,2,3]}'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={
+                    "content-type": "application/json",
+                    "content-encoding": "gzip",
+                },
+                content=gzip.compress(body),
+            )
+
+        recorder = RecordingTransport(self.path, transport=httpx.MockTransport(handler))
+        with httpx.Client(transport=recorder) as client:
+            response = client.get("https://example.invalid/api/list")
+        self.assertEqual(response.json(), {"success": True, "list": [1, 2, 3]})
+        self.assertNotIn("content-encoding", response.headers)
+
+        with httpx.Client(transport=ReplayTransport(self.path)) as client:
+            response = client.get("https://example.invalid/api/list")
+        self.assertEqual(response.json(), {"success": True, "list": [1, 2, 3]})
+
+
+if __name__ == "__main__":
+    unittest.main()
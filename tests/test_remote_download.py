@@ -0,0 +1,37 @@
+import unittest
+
+from sonicbit.models import PathInfo
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+URL = "https://example.invalid/file.bin"
+
+
+class RemoteDownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.client = make_client(self.fake)
+
+    def _task_id(self) -> int:
+        return self.client.list_remote_downloads().by_url[URL].id
+
+    def _assert_readded_after(self, delete):
+        self.client.add_remote_download(URL, PathInfo.root())
+        self.assertIn(URL, self.client.known_remote_urls())
+
+        delete(self._task_id())
+
+        result = self.client.add_remote_downloads([URL], skip_existing=True)
+        self.assertEqual(result.succeeded, [URL])
+        self.assertIn(URL, self.client.list_remote_downloads().by_url)
+
+    def test_single_delete_invalidates_known_urls(self):
+        self._assert_readded_after(self.client.delete_remote_download)
+
+    def test_bulk_delete_invalidates_known_urls(self):
+        self._assert_readded_after(lambda id: self.client.delete_remote_downloads([id]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from sonicbit.scheduler import SubmissionScheduler
+from sonicbit.testing import FakeSonicBit
+
+from . import magnet, make_client
+
+GIB = 1 << 30
+
+
+class SubmissionSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1, max_parallel=2, storage_limit=10 * GIB)
+        self.scheduler = SubmissionScheduler(make_client(self.fake))
+
+    def test_releases_highest_priority_into_free_slots(self):
+        for name, priority in (("low", 0), ("high", 5), ("mid", 1)):
+            self.scheduler.submit_torrent(magnet(name), priority=priority)
+
+        result = self.scheduler.run_once()
+
+        self.assertEqual(sorted(result.succeeded), [magnet("high"), magnet("mid")])
+        self.assertEqual(self.scheduler.pending, 1)
+
+    def test_jobs_wait_for_storage(self):
+        url = "https://example.invalid/"
+        self.scheduler.submit_remote_download(url + "huge", size=11 * GIB)
+        self.scheduler.submit_remote_download(url + "big", priority=2, size=8 * GIB)
+        self.scheduler.submit_remote_download(url + "large", priority=1, size=4 * GIB)
+        self.scheduler.submit_remote_download(url + "small", size=1 * GIB)
+
+        result = self.scheduler.run_once()
+
+        self.assertEqual(sorted(result.succeeded), [url + "big", url + "small"])
+        self.assertEqual(list(result.failed), [url + "huge"])
+        self.assertEqual(self.scheduler.pending, 1)
+
+    def test_failed_submission_frees_its_slot_and_is_requeued(self):
+        self.scheduler.submit_torrent(magnet("a"), priority=1, size=GIB)
+        self.scheduler.submit_torrent(magnet("b"), size=GIB)
+        self.fake.fail(500, endpoint="/app/seedbox/torrent/add")
+
+        first = self.scheduler.run_once()
+        self.assertEqual(len(first.failed), 2)
+        self.assertEqual(self.scheduler.pending, 2)
+
+        second = self.scheduler.run_once()  # no refresh in between
+        self.assertEqual(sorted(second.succeeded), [magnet("a"), magnet("b")])
+
+    def test_gives_up_after_max_attempts(self):
+        url = "https://example.invalid/file"
+        self.scheduler.submit_remote_download(url)
+        self.fake.fail(500, times=3, endpoint="/remote_download/task/add")
+
+        for _ in range(SubmissionScheduler.MAX_ATTEMPTS):
+            self.assertEqual(list(self.scheduler.run_once().failed), [url])
+        self.assertEqual(self.scheduler.pending, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
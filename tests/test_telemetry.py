@@ -0,0 +1,78 @@
+import unittest
+
+from sonicbit.telemetry import TorrentTelemetry, rate_to_bytes
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+MIB = 1 << 20
+
+
+class RateToBytesTest(unittest.TestCase):
+    def test_units(self):
+        self.assertEqual(rate_to_bytes(1.5, "MB/s"), 1.5 * MIB)
+        self.assertEqual(rate_to_bytes(2, "kb/s"), 2048)
+        self.assertEqual(rate_to_bytes(3, "B/s"), 3)
+        self.assertEqual(rate_to_bytes(None, "MB/s"), 0)
+        self.assertEqual(rate_to_bytes(1, None), 0)
+
+
+class TorrentTelemetryTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.client = make_client(self.fake)
+        (self.hash,) = self.fake.populate_torrents(1, completed=0, size=100 * MIB)
+        self.telemetry = TorrentTelemetry(window=4, stall_after=60, stall_rate=1024)
+
+    def update(self, at, progress, rate="0"):
+        self.fake._torrents[self.hash].update(
+            percentComplete=str(progress), dlRateValue=rate
+        )
+        self.telemetry.update(self.client.list_torrents(), at=at)
+        return self.telemetry.stats(self.hash, at=at)
+
+    def test_reported_rate(self):
+        self.update(0, 10, "1")
+        stats = self.update(1, 10, "2")
+
+        self.assertEqual(stats.rate, 2 * MIB)
+        self.assertEqual(stats.average_rate, 1.5 * MIB)
+        self.assertAlmostEqual(stats.eta, 90 / 1.5)
+        self.assertFalse(stats.stalled)
+
+    def test_window_is_bounded(self):
+        for at, rate in enumerate(["8", "1", "1", "1", "1"]):
+            stats = self.update(at, at, rate)
+
+        self.assertEqual(stats.average_rate, MIB)
+
+    def test_eta_from_observed_progress(self):
+        self.update(0, 10)
+        stats = self.update(10, 20)
+
+        self.assertEqual(stats.average_rate, 0)
+        self.assertAlmostEqual(stats.eta, 80)
+
+    def test_no_eta_without_movement(self):
+        self.assertIsNone(self.update(0, 10).eta)
+        self.assertEqual(self.update(5, 100).eta, 0)
+
+    def test_stalled(self):
+        self.update(0, 10)
+        self.assertFalse(self.update(59, 10).stalled)
+        self.assertEqual(self.telemetry.stalled(at=60), [self.hash])
+
+        self.assertFalse(self.update(61, 11).stalled)
+        self.assertFalse(self.update(200, 100).stalled)
+
+    def test_removed_torrents_are_dropped(self):
+        self.update(0, 10)
+        self.client.delete_torrent(self.hash)
+        self.telemetry.update(self.client.list_torrents(), at=1)
+
+        self.assertIsNone(self.telemetry.stats(self.hash))
+        self.assertEqual(self.telemetry.all_stats(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from sonicbit.handlers import TokenFileHandler
+from sonicbit.models.auth_response import AuthResponse
+from sonicbit.utils import run_concurrently
+
+
+def auth(token: str) -> AuthResponse:
+    return AuthResponse(
+        token=token, session="session", require_2fa_verification=False, raw={}
+    )
+
+
+class TokenFileHandlerTest(unittest.TestCase):
+    def test_handlers_sharing_a_path_write_concurrently(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "token.cache")
+        handlers = [TokenFileHandler(path) for _ in range(8)]
+
+        def write(index: int) -> None:
+            handler = handlers[index % len(handlers)]
+            email = f"user-{index % 16}@example.com"
+            handler.write(email, auth(f"token-{index}"))
+            handler.read(email)
+
+        errors = [
+            error
+            for _, _, error in run_concurrently(write, range(800), 8)
+            if error is not None
+        ]
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(handlers[0]._read_cache()), 16)
+        self.assertEqual(os.listdir(directory), ["token.cache"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+
+from sonicbit.errors import SonicBitError
+from sonicbit.testing import FakeSonicBit
+
+from . import magnet, make_client
+
+ADD = "/app/seedbox/torrent/add"
+
+
+class BulkTorrentTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.client = make_client(self.fake)
+
+    def hashes(self):
+        return set(self.client.list_torrents().torrents)
+
+    def test_add_torrents_in_chunks(self):
+        uris = [magnet(str(i)) for i in range(5)]
+        self.client.list_torrents()
+        requests = self.fake.requests
+
+        result = self.client.add_torrents(uris + uris[:1], chunk_size=2)
+
+        self.assertEqual(sorted(result.succeeded), sorted(uris))
+        self.assertEqual(self.fake.requests - requests, 3)
+        self.assertEqual(len(self.hashes()), 5)
+
+    def test_failed_chunk_only_fails_its_items(self):
+        uris = [magnet(str(i)) for i in range(5)]
+        self.fake.fail(500, endpoint=ADD)
+
+        result = self.client.add_torrents(uris, chunk_size=2, concurrency=1)
+
+        self.assertEqual(sorted(result.failed), sorted(uris[:2]))
+        self.assertEqual(sorted(result.succeeded), sorted(uris[2:]))
+
+    def test_skip_existing(self):
+        self.client.add_torrents([magnet("old")])
+        self.client.list_torrents()
+        requests = self.fake.requests
+
+        result = self.client.add_torrents(
+            [magnet("old"), magnet("new")], skip_existing=True
+        )
+
+        self.assertEqual(result.results[magnet("old")].skipped, True)
+        self.assertEqual(result.succeeded, [magnet("new")])
+        self.assertEqual(self.fake.requests - requests, 1)
+
+    def test_delete_torrents(self):
+        hashes = self.fake.populate_torrents(5, size=1024)
+        unknown = "0" * 40
+
+        result = self.client.delete_torrents(hashes + [unknown], chunk_size=2)
+
+        self.assertEqual(sorted(result.succeeded), sorted(hashes))
+        self.assertEqual(result.failed, {unknown: "Torrent was not deleted"})
+        self.assertEqual(self.hashes(), set())
+
+
+class TorrentDetailsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.client = make_client(self.fake)
+        self.completed, self.downloading = self.fake.populate_torrents(
+            1, completed=1, size=1024
+        ) + self.fake.populate_torrents(1, completed=0, size=1024)
+
+    def test_listed_torrents_are_fetched_once(self):
+        self.client.list_torrents()
+        first = self.client.get_torrent_details(self.completed)
+        requests = self.fake.requests
+
+        self.assertIs(self.client.get_torrent_details(self.completed.lower()), first)
+        self.assertEqual(self.fake.requests, requests)
+
+        self.client.get_torrent_details(self.completed, refresh=True)
+        self.assertEqual(self.fake.requests, requests + 1)
+
+    def test_progress_change_invalidates(self):
+        self.client.list_torrents()
+        self.client.get_torrent_details(self.downloading)
+        self.fake.complete_torrents([self.downloading])
+        self.client.list_torrents()
+        requests = self.fake.requests
+
+        self.client.get_torrent_details(self.downloading)
+
+        self.assertEqual(self.fake.requests, requests + 1)
+
+    def test_unlisted_torrents_are_not_cached(self):
+        self.client.get_torrent_details(self.completed)
+        requests = self.fake.requests
+
+        self.client.get_torrent_details(self.completed)
+
+        self.assertEqual(self.fake.requests, requests + 1)
+
+    def test_deleted_torrents_are_dropped(self):
+        self.client.list_torrents()
+        self.client.get_torrent_details(self.completed)
+        self.client.delete_torrent(self.completed)
+
+        with self.assertRaises(SonicBitError):
+            self.client.get_torrent_details(self.completed)
+
+    def test_many_reports_failures(self):
+        unknown = "0" * 40
+
+        result = self.client.get_torrent_details_many(
+            [self.completed, unknown, self.completed]
+        )
+
+        self.assertEqual(list(result.values), [self.completed])
+        self.assertEqual(list(result.failed), [unknown])
+
+
+if __name__ == "__main__":
+    unittest.main()
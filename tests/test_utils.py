@@ -0,0 +1,142 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from json import JSONDecodeError
+
+from sonicbit.errors import SonicBitError
+from sonicbit.utils import (
+    iter_json_array,
+    magnet_infohash,
+    torrent_infohash,
+    write_json_atomic,
+)
+
+INFO = b"d6:lengthi42e4:name5:a.bin12:piece lengthi16384e6:pieces0:e"
+TORRENT = b"d8:announce14:http://tracker7:comment3:l:e4:info" + INFO + b"e"
+INFOHASH = hashlib.sha1(INFO).hexdigest().upper()
+
+
+def chunks(data: bytes, size: int):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+class IterJsonArrayTest(unittest.TestCase):
+    def assert_items(self, document, key="result"):
+        body = json.dumps(document, ensure_ascii=False).encode()
+        expected = document.get(key, [])
+        for size in range(1, len(body) + 1):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    list(iter_json_array(chunks(body, size), key)), expected
+                )
+
+    def test_numbers(self):
+        self.assert_items({"total": 12.5, "result": [1.5, 2, -3e10, 0, -0.25e-3]})
+
+    def test_strings_with_escapes_and_multibyte_utf8(self):
+        self.assert_items(
+            {"result": ['a "quoted" \\ \n name', "über", "日本語", "🎬.mkv"]}
+        )
+
+    def test_nested_objects(self):
+        self.assert_items(
+            {
+                "before": {"deep": [1, {"x": [2.5e3]}]},
+                "result": [{"name": "a", "sizes": [1, 2]}, {"empty": {}}, []],
+                "after": [True, False, None],
+            }
+        )
+
+    def test_empty_array(self):
+        self.assert_items({"result": [], "total": 0})
+
+    def test_missing_key(self):
+        self.assert_items({"total": 12.5, "other": [1, 2]})
+        self.assertEqual(list(iter_json_array([b"{}"], "result")), [])
+
+    def test_truncated_input(self):
+        body = b'{"result":[1.5,"\xc3\xbcber",{"a":-3e10}],"total":12}'
+        for end in range(len(body)):
+            for size in (1, 7):
+                with self.subTest(end=end, size=size):
+                    with self.assertRaises(JSONDecodeError):
+                        list(iter_json_array(chunks(body[:end], size), "result"))
+
+
+class MagnetInfohashTest(unittest.TestCase):
+    def test_hex(self):
+        uri = f"magnet:?xt=urn:btih:{INFOHASH.lower()}&dn=a.bin"
+        self.assertEqual(magnet_infohash(uri), INFOHASH)
+
+    def test_base32(self):
+        digest = base64.b32encode(bytes.fromhex(INFOHASH)).decode()
+        self.assertEqual(magnet_infohash(f"magnet:?xt=urn:btih:{digest}"), INFOHASH)
+        uri = f"magnet:?xt=urn:btih:{digest.lower()}"
+        self.assertEqual(magnet_infohash(uri), INFOHASH)
+
+    def test_multiple_xt_values(self):
+        uri = f"magnet:?xt=urn:btmh:1220{'0' * 64}&xt=urn:btih:{INFOHASH}"
+        self.assertEqual(magnet_infohash(uri), INFOHASH)
+
+    def test_without_a_v1_hash(self):
+        self.assertIsNone(magnet_infohash(f"magnet:?xt=urn:btmh:1220{'0' * 64}"))
+        self.assertIsNone(magnet_infohash("magnet:?xt=urn:btih:tooshort"))
+        self.assertIsNone(magnet_infohash("magnet:?xt=urn:btih:" + "1" * 32))
+        self.assertIsNone(magnet_infohash("https://example.com/a.torrent"))
+
+
+class TorrentInfohashTest(unittest.TestCase):
+    def test_hashes_the_info_dictionary(self):
+        self.assertEqual(torrent_infohash(TORRENT), INFOHASH)
+
+    def test_malformed(self):
+        for data in (
+            b"",
+            b"l4:infoe",
+            b"d8:announce3:urle",
+            b"d4:infoi12",
+            b"d4:info" + b"l" * 100_000,
+            b"d4:infod4:name99:abcee",
+            b"d4:infox",
+            b"de" + b"x",
+        ):
+            with self.subTest(data=data[:20]):
+                with self.assertRaises(SonicBitError):
+                    torrent_infohash(data)
+
+    def test_truncated(self):
+        for end in range(len(TORRENT) - 1):
+            with self.subTest(end=end):
+                with self.assertRaises(SonicBitError):
+                    torrent_infohash(TORRENT[:end])
+
+
+class WriteJsonAtomicTest(unittest.TestCase):
+    def test_replaces_the_file_without_leftovers(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "state.json")
+        write_json_atomic(path, {"version": 1})
+        write_json_atomic(path, {"version": 2})
+
+        with open(path) as f:
+            self.assertEqual(json.load(f), {"version": 2})
+        self.assertEqual(os.listdir(directory), ["state.json"])
+
+    def test_failed_write_keeps_the_old_file(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "state.json")
+        write_json_atomic(path, {"version": 1})
+
+        with self.assertRaises(TypeError):
+            write_json_atomic(path, {"version": object()})
+
+        with open(path) as f:
+            self.assertEqual(json.load(f), {"version": 1})
+        self.assertEqual(os.listdir(directory), ["state.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
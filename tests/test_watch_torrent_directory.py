@@ -0,0 +1,53 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from sonicbit.testing import FakeSonicBit
+
+from . import make_client
+
+
+class WatchTorrentDirectoryTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSonicBit(seed=1)
+        self.directory = tempfile.mkdtemp()
+        client = make_client(self.fake)
+        self.stop_event = threading.Event()
+        # Ends the watch instead of hanging if an expected upload never comes.
+        timer = threading.Timer(5, self.stop_event.set)
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.results = client.watch_torrent_directory(
+            self.directory, poll_interval=0, stop_event=self.stop_event
+        )
+        self.local_path = os.path.join(self.directory, "a.torrent")
+
+    def _write(self, name: bytes, mtime_ns: int | None = None) -> None:
+        with open(self.local_path, "wb") as f:
+            f.write(b"d4:infod4:name3:" + name + b"ee")
+        if mtime_ns is not None:
+            os.utime(self.local_path, ns=(mtime_ns, mtime_ns))
+
+    def test_failed_upload_is_retried(self):
+        self._write(b"abc")
+        self.fake.fail(500, endpoint="/app/seedbox/torrent/upload")
+
+        self.assertEqual(list(next(self.results).failed), [self.local_path])
+        self.assertEqual(next(self.results).succeeded, [self.local_path])
+
+    def test_removed_file_is_forgotten(self):
+        self._write(b"abc")
+        self.assertEqual(next(self.results).succeeded, [self.local_path])
+        mtime_ns = os.stat(self.local_path).st_mtime_ns
+
+        # Replace it with a file of the same size and mtime once the watcher
+        # has polled without it.
+        os.remove(self.local_path)
+        threading.Timer(0.2, self._write, (b"xyz", mtime_ns)).start()
+
+        self.assertEqual(next(self.results).succeeded, [self.local_path])
+
+
+if __name__ == "__main__":
+    unittest.main()